@@ -1,6 +1,7 @@
 """APIs for Nautobot event-notification subsystem."""
 
 from nautobot.core.events import (
+    batched_event_publishing,
     deregister_event_broker,
     EventBroker,
     publish_event,
@@ -13,6 +14,7 @@ __all__ = (
     "EventBroker",
     "RedisEventBroker",
     "SyslogEventBroker",
+    "batched_event_publishing",
     "deregister_event_broker",
     "publish_event",
     "register_event_broker",
@@ -5,8 +5,8 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils import timezone
 
+from nautobot.dcim.cable_paths import CablePathTracer
 from nautobot.dcim.models import CablePath
-from nautobot.dcim.signals import create_cablepath
 
 from .choices import CircuitTerminationSideChoices
 from .models import CircuitTermination
@@ -21,17 +21,14 @@ def rebuild_paths_circuits(obj):
     # TODO: Remove pylint disable after issue is resolved (see: https://github.com/PyCQA/pylint/issues/7381)
     # pylint: disable=unsupported-binary-operation
     cable_paths = CablePath.objects.filter(
-        Q(path__contains=obj)
+        Q(pk__in=CablePath.objects.traversing(obj).values("pk"))
         | Q(destination_type=termination_type, destination_id=obj.pk)
         | Q(origin_type=termination_type, origin_id=obj.pk)
     )
     # pylint: enable=unsupported-binary-operation
 
     with transaction.atomic():
-        for cp in cable_paths:
-            cp.delete()
-            # Prevent looping back to rebuild_paths during the atomic transaction.
-            create_cablepath(cp.origin, rebuild=False)
+        CablePathTracer(preload=False).rebuild_paths(cable_paths.values_list("origin_type", "origin_id"))
 
 
 @receiver(post_save, sender=CircuitTermination)
@@ -1,6 +1,9 @@
 # Query parameters that are *not* filterset filters
 NON_FILTER_QUERY_PARAMS = (
     "api_version",  # used to select the Nautobot API version
+    "config_context_cache",  # used to read rendered config contexts from the cache, if CONFIG_CONTEXT_CACHE_ENABLED
+    "count",  # pagination: "false" to skip counting results or "estimated" to estimate the count
+    "cursor",  # pagination: cursor (keyset) pagination
     "depth",  # nested levels of the serializers default to depth=0
     "exclude_m2m",  # used to exclude many-to-many fields from the REST API
     "format",  # "json" or "api", used in the interactive HTML REST API views
@@ -1,4 +1,13 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db import connections
+from rest_framework.exceptions import NotFound, ParseError
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from nautobot.core.constants import MAX_PAGE_SIZE_DEFAULT, PAGINATE_COUNT_DEFAULT
 from nautobot.core.utils.config import get_settings_or_config
@@ -9,17 +18,53 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
     Override the stock paginator to allow setting limit=0 to disable pagination for a request. This returns all objects
     matching a query, but retains the same format as a paginated request. The limit can only be disabled if
     MAX_PAGE_SIZE has been set to 0 or None.
+
+    Additionally, `?count=false` skips counting the objects matching a query and `?count=estimated` reports the
+    database's estimate of that count instead, while `?cursor=` pages through the objects by primary key ("keyset"
+    pagination) rather than by offset, which costs the same for every page no matter how deep and never counts.
+    Cursor pagination always orders the objects by primary key, so can't be combined with `?sort=`.
     """
 
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    invalid_cursor_message = "Invalid cursor"
+    cursor_sort_message = "Cursor pagination always orders results by id, so cannot be combined with sorting"
+    cursor = None
+    has_next = None
+
     def paginate_queryset(self, queryset, request, view=None):
         # No pagination when rendering to CSV
         if "text/csv" in request.accepted_media_type:
             return None
 
-        self.count = self.get_count(queryset)
         self.limit = self.get_limit(request)
-        self.offset = self.get_offset(request)
         self.request = request
+        self.cursor = self.get_cursor(request)
+        self.has_next = None
+
+        if self.cursor is not None:
+            if request.query_params.get(api_settings.ORDERING_PARAM):
+                raise ParseError(self.cursor_sort_message)
+            self.count = None
+            self.offset = 0
+            queryset = queryset.order_by("pk")
+            if self.cursor:
+                try:
+                    queryset = queryset.filter(pk__gt=queryset.model._meta.pk.to_python(self.cursor))
+                except ValidationError:
+                    raise NotFound(self.invalid_cursor_message)
+            results = self.get_page(queryset)
+            self.last_pk = results[-1].pk if results else None
+            return results
+
+        self.offset = self.get_offset(request)
+
+        count_mode = request.query_params.get(self.count_query_param, "").lower()
+        if count_mode in ("false", "estimated"):
+            self.count = self.get_estimated_count(queryset) if count_mode == "estimated" else None
+            return self.get_page(queryset[self.offset :])
+
+        self.count = self.get_count(queryset)
 
         if self.limit and self.count > self.limit and self.template is not None:
             self.display_page_controls = True
@@ -32,6 +77,59 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         else:
             return list(queryset[self.offset :])
 
+    def get_paginated_response_schema(self, schema):
+        paginated_schema = super().get_paginated_response_schema(schema)
+        # The count is null when counting was skipped with `?count=false` or `?cursor=`
+        paginated_schema["properties"]["count"]["nullable"] = True
+        return paginated_schema
+
+    def get_page(self, queryset):
+        """
+        Return a page of results from the given queryset without counting it.
+
+        Whether there is a next page is instead determined by fetching one more result than the limit.
+        """
+        if not self.limit:
+            self.has_next = False
+            return list(queryset)
+        results = list(queryset[: self.limit + 1])
+        self.has_next = len(results) > self.limit
+        return results[: self.limit]
+
+    def get_cursor(self, request):
+        """
+        Return the primary key after which to resume cursor pagination, "" to begin it, or None if not requested.
+        """
+        if self.cursor_query_param not in request.query_params:
+            return None
+        encoded = request.query_params[self.cursor_query_param]
+        if not encoded:
+            return ""
+        try:
+            return urlsafe_b64decode(encoded.encode("ascii")).decode("ascii")
+        except (binascii.Error, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, pk):
+        return urlsafe_b64encode(str(pk).encode("ascii")).decode("ascii")
+
+    def get_estimated_count(self, queryset):
+        """
+        Return the database query planner's estimate of the number of objects in the given queryset.
+
+        Falls back to an exact count on databases other than PostgreSQL.
+        """
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return self.get_count(queryset)
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return plan[0]["Plan"]["Plan Rows"]
+
     def get_limit(self, request):
         if self.limit_query_param:
             try:
@@ -56,6 +154,17 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        # The results weren't counted, so whether there's a next page was determined when fetching them
+        if self.has_next is not None:
+            if not self.has_next:
+                return None
+            url = self.request.build_absolute_uri()
+            url = replace_query_param(url, self.limit_query_param, self.limit)
+            if self.cursor is not None:
+                url = remove_query_param(url, self.offset_query_param)
+                return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.last_pk))
+            return replace_query_param(url, self.offset_query_param, self.offset + self.limit)
+
         return super().get_next_link()
 
     def get_previous_link(self):
@@ -63,4 +172,8 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        # Cursor pagination only proceeds forward
+        if self.cursor is not None:
+            return None
+
         return super().get_previous_link()
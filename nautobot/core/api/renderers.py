@@ -12,6 +12,13 @@ from nautobot.core.constants import COMPOSITE_KEY_SEPARATOR
 logger = logging.getLogger(__name__)
 
 
+class _Echo:
+    """A file-like object whose `write()` returns what was written, to let `csv.writer` generate rows one by one."""
+
+    def write(self, value):
+        return value
+
+
 class FormlessBrowsableAPIRenderer(BrowsableAPIRenderer):
     """
     Override the built-in BrowsableAPIRenderer to disable HTML forms.
@@ -72,9 +79,35 @@ class NautobotCSVRenderer(BaseRenderer):
 
         return buffer.getvalue()
 
+    def render_stream(self, records, custom_field_keys=None):
+        """
+        Render the provided iterable of records to CSV format, yielding one line at a time.
+
+        Unlike `render()`, the records are consumed lazily, so that memory use is bounded regardless of their number.
+        The headers are determined from the first record, and from `custom_field_keys` (as from
+        `CustomField.objects.keys_for_model()`) rather than by scanning all records for custom field data.
+        """
+        records = iter(records)
+        first_record = next(records, None)
+        if first_record is None:
+            return
+
+        headers = self.get_headers([first_record], custom_field_keys=custom_field_keys)
+
+        writer = csv.writer(_Echo())
+        yield writer.writerow(headers)
+        yield writer.writerow(self.object_to_row_elements(first_record, headers=headers))
+        for record in records:
+            yield writer.writerow(self.object_to_row_elements(record, headers=headers))
+
     @classmethod
-    def get_headers(cls, data):
-        """Identify the appropriate CSV headers corresponding to the given data."""
+    def get_headers(cls, data, custom_field_keys=None):
+        """
+        Identify the appropriate CSV headers corresponding to the given data.
+
+        If `custom_field_keys` is specified, it is used to determine the custom field headers; otherwise all of the
+        data is scanned for custom field data.
+        """
         base_headers = list(data[0].keys())
 
         # Remove specific headers that we know are irrelevant
@@ -89,9 +122,11 @@ class NautobotCSVRenderer(BaseRenderer):
                 base_headers.remove(undesired_header)
 
         # Add individual headers for each relevant custom field
-        # Since we know there are cases where custom field data may be missing from a given instance,
-        # we iterate over *all* instances in the data set to be safe.
-        if "custom_fields" in data[0]:
+        if "custom_fields" in data[0] and custom_field_keys is not None:
+            cf_headers = sorted(f"cf_{key}" for key in custom_field_keys)
+        elif "custom_fields" in data[0]:
+            # Since we know there are cases where custom field data may be missing from a given instance,
+            # we iterate over *all* instances in the data set to be safe.
             cf_headers = set()
             for record in data:
                 cf_headers |= {f"cf_{key}" for key in record["custom_fields"]}
@@ -15,6 +15,7 @@ from django.db import models
 from django.db.models.fields.related_descriptors import ManyToManyDescriptor
 from django.db.models.functions import Cast
 from django.urls import NoReverseMatch
+from django.utils.functional import cached_property
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_field, PolymorphicProxySerializer as _PolymorphicProxySerializer
 from rest_framework import serializers
@@ -164,6 +165,9 @@ class BaseModelSerializer(OptInFieldsMixin, serializers.HyperlinkedModelSerializ
             case_query = self._build_query_case_for_natural_key_field_lookup(all_related_fields_natural_key_lookups)
             if isinstance(self.instance, models.QuerySet):
                 queryset = self.instance
+            elif isinstance(self.instance, (list, tuple)):
+                # A single chunk of a larger export, see `nautobot.core.api.utils.iter_serialized_data()`
+                queryset = self.Meta.model.objects.filter(pk__in=[obj.pk for obj in self.instance])
             else:
                 # We would only need to run one additional query, making this a more efficient method of
                 # obtaining all the natural key values for this instance;
@@ -453,13 +457,20 @@ class BaseModelSerializer(OptInFieldsMixin, serializers.HyperlinkedModelSerializ
                     data[key] = value
         return data
 
+    @cached_property
+    def _natural_keys_values_by_pk(self):
+        """Map each instance's PK to its `natural_keys_values`, to avoid a linear search for every instance."""
+        natural_keys_values_by_pk = {}
+        for item in self.natural_keys_values:
+            natural_keys_values_by_pk.setdefault(item["pk"], item)
+        return natural_keys_values_by_pk
+
     def to_representation(self, instance):
         data = super().to_representation(instance)
         altered_data = {}
 
         if self._is_csv_request() and self.natural_keys_values is not None:
-            if natural_key_field_instance := [item for item in self.natural_keys_values if item["pk"] == instance.pk]:
-                cleaned_natural_key_field_instance = natural_key_field_instance[0]
+            if cleaned_natural_key_field_instance := self._natural_keys_values_by_pk.get(instance.pk):
                 for key, value in data.items():
                     # FK field with natural_field_lookups
                     if natural_key_field_lookups_for_field := self._get_natural_key_lookups_value_for_field(
@@ -120,6 +120,28 @@ def get_serializer_for_model(model, prefix=""):
         ) from exc
 
 
+def iter_serialized_data(serializer_class, queryset, chunk_size=1000, **kwargs):
+    """
+    Serialize the objects in a queryset one chunk at a time, yielding the serialized data for each object in turn.
+
+    Unlike `serializer_class(queryset, many=True).data`, at most `chunk_size` objects are held in memory at once.
+
+    Args:
+        serializer_class (type[Serializer]): Serializer to apply to each chunk of objects.
+        queryset (QuerySet): Objects to serialize.
+        chunk_size (int): Number of objects to retrieve from the database and serialize at a time.
+        **kwargs: Passed through to the serializer, such as `context` or `force_csv`.
+    """
+    chunk = []
+    for instance in queryset.iterator(chunk_size=chunk_size):
+        chunk.append(instance)
+        if len(chunk) >= chunk_size:
+            yield from serializer_class(chunk, many=True, **kwargs).data
+            chunk = []
+    if chunk:
+        yield from serializer_class(chunk, many=True, **kwargs).data
+
+
 def nested_serializers_for_models(models, prefix=""):
     """
     Dynamically resolve and return the appropriate nested serializers for a list of models.
@@ -13,7 +13,7 @@ from django.db import transaction
 from django.db.models import ProtectedError
 from django.db.models.fields.related import ForeignKey, ManyToManyField, RelatedField
 from django.db.models.fields.reverse_related import ManyToManyRel, ManyToOneRel
-from django.http.response import HttpResponseBadRequest
+from django.http.response import HttpResponseBadRequest, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
@@ -40,7 +40,8 @@ import yaml
 
 from nautobot.core.api import BulkOperationSerializer
 from nautobot.core.api.exceptions import SerializerNotFound
-from nautobot.core.api.utils import get_serializer_for_model
+from nautobot.core.api.renderers import NautobotCSVRenderer
+from nautobot.core.api.utils import get_serializer_for_model, iter_serialized_data
 from nautobot.core.celery import app as celery_app
 from nautobot.core.exceptions import FilterSetFieldNotFound
 from nautobot.core.models.fields import TagsField
@@ -86,6 +87,22 @@ class NautobotAPIVersionMixin:
         return response
 
 
+def _bulk_operation_context():
+    """
+    Return a context manager to wrap a bulk REST API operation in an atomic transaction.
+
+    If change logging is enabled, as it is for every web request, the ObjectChanges resulting from the operation are
+    also deferred and created in bulk at the end of the operation, rather than one at a time.
+    """
+    # avoid circular import
+    from nautobot.extras.context_managers import deferred_change_logging_for_bulk_operation
+    from nautobot.extras.signals import change_context_state
+
+    if change_context_state.get() is None:
+        return transaction.atomic()
+    return deferred_change_logging_for_bulk_operation()
+
+
 class BulkUpdateModelMixin:
     """
     Support bulk modification of objects using the list endpoint for a model. Accepts a PATCH action with a list of one
@@ -123,7 +140,7 @@ class BulkUpdateModelMixin:
         return Response(data, status=status.HTTP_200_OK)
 
     def perform_bulk_update(self, objects, update_data, partial):
-        with transaction.atomic():
+        with _bulk_operation_context():
             data_list = []
             for obj in objects:
                 data = update_data.get(str(obj.id))
@@ -166,7 +183,7 @@ class BulkDestroyModelMixin:
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     def perform_bulk_destroy(self, objects):
-        with transaction.atomic():
+        with _bulk_operation_context():
             for obj in objects:
                 self.perform_destroy(obj)
 
@@ -178,6 +195,8 @@ class BulkDestroyModelMixin:
 
 class ModelViewSetMixin:
     logger = logging.getLogger(__name__ + ".ModelViewSet")
+    # Number of objects to retrieve and serialize at a time when streaming a CSV export
+    csv_export_chunk_size = 1000
 
     # TODO: can't set lookup_value_regex globally; some models/viewsets (ContentType, Group) have integer rather than
     #       UUID PKs and also do NOT support composite-keys.
@@ -286,6 +305,33 @@ class ModelViewSetMixin:
 
         return queryset
 
+    def list(self, request, *args, **kwargs):
+        """Stream CSV exports rather than rendering them in memory all at once."""
+        if "text/csv" in request.accepted_media_type:
+            return self.stream_csv(request)
+        return super().list(request, *args, **kwargs)
+
+    def stream_csv(self, request):
+        """
+        Return a StreamingHttpResponse rendering all objects in the filtered queryset to CSV.
+
+        Objects are retrieved and serialized `csv_export_chunk_size` at a time, so memory use is bounded regardless of
+        the number of objects.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        custom_fields_field = self.get_serializer().fields.get("custom_fields")
+        renderer = NautobotCSVRenderer()
+        records = iter_serialized_data(
+            self.get_serializer_class(),
+            queryset,
+            chunk_size=self.csv_export_chunk_size,
+            context=self.get_serializer_context(),
+        )
+        return StreamingHttpResponse(
+            renderer.render_stream(records, custom_field_keys=getattr(custom_fields_field, "custom_field_keys", None)),
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
+        )
+
     def restrict_queryset(self, request, *args, **kwargs):
         """
         Restrict the view's queryset to allow only the permitted objects for the given request.
@@ -365,9 +411,15 @@ class ModelViewSet(
         model = self.queryset.model
         self.logger.info(f"Creating new {model._meta.verbose_name}")
 
+        # Bulk (list) creation defers its change logging, as with bulk updates and deletes
+        if isinstance(serializer, drf_serializers.ListSerializer):
+            operation_context = _bulk_operation_context()
+        else:
+            operation_context = transaction.atomic()
+
         # Enforce object-level permissions on save()
         try:
-            with transaction.atomic():
+            with operation_context:
                 instance = serializer.save()
                 self._validate_objects(instance)
         except ObjectDoesNotExist:
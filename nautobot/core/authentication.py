@@ -20,17 +20,51 @@ from nautobot.users.models import ObjectPermission
 logger = logging.getLogger(__name__)
 
 
+class ObjectPermissionCache(defaultdict):
+    """
+    Mapping of permission names to the constraints of each ObjectPermission granting that permission to a given user.
+
+    Also caches the QuerySet filter compiled from the constraints of each permission, as this is needed repeatedly
+    (e.g. by every `RestrictedQuerySet.restrict()` call) over the lifetime of the user's permissions.
+    """
+
+    # The ObjectPermissionBackend.generation at which these permissions were loaded
+    generation = None
+
+    def __init__(self, default_factory=list, *args, **kwargs):
+        super().__init__(default_factory, *args, **kwargs)
+        self.filters = {}
+
+    def get_filter(self, perm, user_obj):
+        """Return the Q filter matching all objects on which the given user has been granted the given permission."""
+        if perm not in self.filters:
+            tokens = {
+                "$user": user_obj,
+            }
+            self.filters[perm] = qs_filter_from_constraints(self[perm], tokens)
+        return self.filters[perm]
+
+
 class ObjectPermissionBackend(ModelBackend):
+    # Incremented whenever any ObjectPermission or group membership changes, see `invalidate_object_permissions()`
+    generation = 0
+
+    @classmethod
+    def invalidate_object_permissions(cls):
+        """Discard any permissions (and their compiled filters) previously loaded for any user, in this process."""
+        cls.generation += 1
+
     def get_all_permissions(self, user_obj, obj=None):
         if not user_obj.is_active or user_obj.is_anonymous:
             return {}
-        if not hasattr(user_obj, "_object_perm_cache"):
+        perm_cache = getattr(user_obj, "_object_perm_cache", None)
+        if getattr(perm_cache, "generation", None) != self.generation:
             user_obj._object_perm_cache = self.get_object_permissions(user_obj)
         return user_obj._object_perm_cache
 
     def get_object_permissions(self, user_obj):
         """
-        Return all permissions granted to the user by an ObjectPermission.
+        Return all permissions granted to the user by an ObjectPermission, as an ObjectPermissionCache.
         """
         # Retrieve all assigned and enabled ObjectPermissions
         object_permissions = ObjectPermission.objects.filter(
@@ -38,7 +72,8 @@ class ObjectPermissionBackend(ModelBackend):
         ).prefetch_related("object_types")
 
         # Create a dictionary mapping permissions to their constraints
-        perms = defaultdict(list)
+        perms = ObjectPermissionCache()
+        perms.generation = self.generation
         for obj_perm in object_permissions:
             for object_type in obj_perm.object_types.all():
                 for action in obj_perm.actions:
@@ -82,11 +117,8 @@ class ObjectPermissionBackend(ModelBackend):
         if model._meta.label_lower != ".".join((app_label, model_name)):
             raise ValueError(f"Invalid permission {perm} for model {model}")
 
-        # Compile a QuerySet filter that matches all instances of the specified model
-        tokens = {
-            "$user": user_obj,
-        }
-        constraints = qs_filter_from_constraints(self.get_all_permissions(user_obj)[perm], tokens)
+        # Retrieve the (cached) QuerySet filter that matches all permitted instances of the specified model
+        constraints = self.get_all_permissions(user_obj).get_filter(perm, user_obj)
 
         # Permission to perform the requested action on the object depends on whether the specified object matches
         # the specified constraints. Note that this check is made against the *database* record representing the object,
@@ -117,6 +117,7 @@ PAGINATE_COUNT_DEFAULT = 50
 GLOBAL_SEARCH_EXCLUDE_LIST = [
     "anotherexamplemodel",
     "cablepath",
+    "cablepathnode",
     "circuittermination",
     "circuittype",
     "clustergroup",
@@ -1,5 +1,7 @@
 """Module providing for the publication of event notifications via mechanisms such as Redis, Kafka, syslog, etc."""
 
+from contextlib import contextmanager
+import contextvars
 import fnmatch
 import json
 import logging
@@ -15,6 +17,7 @@ from .syslog_broker import SyslogEventBroker
 
 _EVENT_BROKERS = []
 
+_event_buffer_state = contextvars.ContextVar("event_buffer_state", default=None)
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +88,75 @@ def is_topic_match(topic, patterns):
     return any(fnmatch.fnmatch(topic, pattern) for pattern in patterns)
 
 
+class EventBuffer:
+    """
+    Events published while `batched_event_publishing()` is active, pending delivery to each `EventBroker`.
+
+    Once `max_size` events are buffered, they are delivered immediately, so that the buffer does not grow without bound
+    and the publisher is held back until the brokers have caught up.
+    """
+
+    def __init__(self, max_size=1000):
+        self.max_size = max_size
+        # {id(event_broker): (event_broker, [(topic, payload), ...])}
+        self.events = {}
+        self.size = 0
+        # Statistics, for logging
+        self.published_count = 0
+        self.flush_count = 0
+
+    def add(self, event_broker, topic, payload):
+        """Buffer the given serialized event for delivery to the given broker."""
+        self.events.setdefault(id(event_broker), (event_broker, []))[1].append((topic, payload))
+        self.size += 1
+        if self.size >= self.max_size:
+            self.flush()
+
+    def flush(self):
+        """Deliver all buffered events to their brokers, with a single `publish_many()` call per broker."""
+        if not self.events:
+            return
+        events, self.events, self.size = self.events, {}, 0
+        for event_broker, broker_events in events.values():
+            event_broker.publish_many(broker_events)
+            self.published_count += len(broker_events)
+        self.flush_count += 1
+
+
+@contextmanager
+def batched_event_publishing(max_size=1000):
+    """
+    Buffer the events published within this context manager and deliver them to each `EventBroker` in batches, via
+    `EventBroker.publish_many()`, rather than one at a time. This is used when publishing the events for all of the
+    changes made by a single request or Job.
+
+    Buffered events are delivered when `max_size` events have accumulated, and when the context manager exits.
+
+    Example usage:
+
+    >>> from nautobot.core.events import batched_event_publishing, publish_event
+    >>> with batched_event_publishing():
+    ...     for device in devices:
+    ...         publish_event(topic="nautobot.custom.dcim.device", payload={"id": str(device.pk)})
+    """
+    if _event_buffer_state.get() is not None:
+        # Already buffered by an enclosing context manager
+        yield
+        return
+
+    event_buffer = EventBuffer(max_size=max_size)
+    token = _event_buffer_state.set(event_buffer)
+    try:
+        yield
+    finally:
+        _event_buffer_state.reset(token)
+        event_buffer.flush()
+        if event_buffer.published_count:
+            logger.debug(
+                "Published %d buffered events in %d batches", event_buffer.published_count, event_buffer.flush_count
+            )
+
+
 def publish_event(*, topic, payload):
     """Publish the given event payload to the given topic via all registered `EventBroker` instances.
 
@@ -98,11 +170,17 @@ def publish_event(*, topic, payload):
             While not all EventBrokers may actually use JSON as their data format, it makes for a reasonable
             lowest common denominator for serializability.
     """
+    serialized_payload = None
+    event_buffer = _event_buffer_state.get()
     for event_broker in _EVENT_BROKERS:
-        exclude_topics = event_broker.exclude_topics
-        include_topics = event_broker.include_topics
-        if is_topic_match(topic, include_topics) and not is_topic_match(topic, exclude_topics):
+        if not event_broker.is_topic_included(topic):
+            continue
+        if serialized_payload is None:
+            # Serialize the payload once, and only if at least one broker is interested in it
             serialized_payload = json.dumps(payload, cls=NautobotKombuJSONEncoder)
+        if event_buffer is not None:
+            event_buffer.add(event_broker, topic, serialized_payload)
+        else:
             event_broker.publish(topic=topic, payload=serialized_payload)
 
 
@@ -110,6 +188,7 @@ __all__ = (
     "EventBroker",
     "RedisEventBroker",
     "SyslogEventBroker",
+    "batched_event_publishing",
     "deregister_event_broker",
     "publish_event",
     "register_event_broker",
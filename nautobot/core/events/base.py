@@ -1,16 +1,56 @@
 """Base classes for Nautobot event notification framework."""
 
 from abc import ABC, abstractmethod
+import fnmatch
+import functools
+import re
+
+
+@functools.lru_cache(maxsize=None)
+def compile_topic_patterns(patterns):
+    """
+    Compile a tuple of `fnmatch`-style topic patterns into a single regular expression.
+
+    Returns:
+        (re.Pattern, None): A pattern matching any topic that matches any of the given patterns, or None if empty.
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
 
 
 class EventBroker(ABC):
     """Abstract base class for concrete implementations of event brokers such as syslog, Redis, Kafka, etc."""
 
+    # Maximum number of distinct topics whose include/exclude result is cached by `is_topic_included()`
+    topic_cache_size = 1024
+
     def __init__(self, *args, include_topics=None, exclude_topics=None, **kwargs) -> None:
         self.include_topics = include_topics or ["*"]
         self.exclude_topics = exclude_topics or []
         super().__init__(*args, **kwargs)
 
+    def is_topic_included(self, topic):
+        """
+        Return True if events of the given topic should be published to this broker.
+
+        A topic is included if it matches any of `include_topics` and none of `exclude_topics`. The patterns are
+        compiled once, and the result is cached per topic until the patterns are changed.
+        """
+        patterns = (tuple(self.include_topics), tuple(self.exclude_topics))
+        if getattr(self, "_topic_cache_patterns", None) != patterns or len(self._topic_cache) >= self.topic_cache_size:
+            self._topic_cache_patterns = patterns
+            self._topic_cache = {}
+        if topic not in self._topic_cache:
+            include_regex = compile_topic_patterns(patterns[0])
+            exclude_regex = compile_topic_patterns(patterns[1])
+            self._topic_cache[topic] = bool(
+                include_regex is not None
+                and include_regex.match(topic)
+                and (exclude_regex is None or not exclude_regex.match(topic))
+            )
+        return self._topic_cache[topic]
+
     @abstractmethod
     def publish(self, *, topic, payload):
         """
@@ -25,3 +65,16 @@ class EventBroker(ABC):
                 While not all EventBrokers may actually use JSON as their data format, it makes for a reasonable
                 lowest common denominator for serializability.
         """
+
+    def publish_many(self, events):
+        """
+        Publish a batch of events, as used by `batched_event_publishing()`.
+
+        The default implementation calls `publish()` for each event in turn; subclasses may override this to publish
+        the whole batch at once, such as in a single round trip to an external service.
+
+        Args:
+            events (list[tuple[str, str]]): The `(topic, payload)` of each event to publish, in order.
+        """
+        for topic, payload in events:
+            self.publish(topic=topic, payload=payload)
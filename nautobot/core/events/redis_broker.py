@@ -46,3 +46,10 @@ class RedisEventBroker(EventBroker):
 
     def publish(self, *, topic, payload):
         self.connection.publish(topic, payload)
+
+    def publish_many(self, events):
+        """Publish a batch of events in a single round trip to Redis, using a non-transactional pipeline."""
+        with self.connection.pipeline(transaction=False) as pipeline:
+            for topic, payload in events:
+                pipeline.publish(topic, payload)
+            pipeline.execute()
@@ -294,6 +294,28 @@ def generate_single_item_resolver(schema_type, resolver_name):
     return single_resolver
 
 
+def is_field_selected(info, field_name):
+    """
+    Determine whether the given field is directly selected on the object(s) being resolved.
+
+    Fields selected only via fragments are not detected.
+
+    Args:
+        info (ResolveInfo): GraphQL resolver info
+        field_name (str): name of the field to look for
+
+    Returns:
+        (bool): True if the field is selected
+    """
+    for field_ast in info.field_asts:
+        if field_ast.selection_set is None:
+            continue
+        for selection in field_ast.selection_set.selections:
+            if getattr(getattr(selection, "name", None), "value", None) == field_name:
+                return True
+    return False
+
+
 def generate_list_resolver(schema_type, resolver_name):
     """
     Generate resolver for a list of schema_type.
@@ -338,7 +360,12 @@ def generate_list_resolver(schema_type, resolver_name):
         if limit:
             qs = qs[:limit]
 
-        return gql_optimizer.query(qs, info)
+        qs = gql_optimizer.query(qs, info)
+        if hasattr(qs, "prefetch_config_contexts") and is_field_selected(info, "config_context"):
+            # Render the config contexts of all of the resolved objects in bulk, rather than one object at a time
+            qs = qs.prefetch_config_contexts(use_cache=True)
+
+        return qs
 
     list_resolver.__name__ = resolver_name
     return list_resolver
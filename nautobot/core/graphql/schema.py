@@ -45,6 +45,7 @@ from nautobot.dcim.graphql.types import (
     RearPortType,
 )
 from nautobot.extras.choices import CustomFieldTypeChoices, RelationshipSideChoices
+from nautobot.extras.config_contexts import prefetch_rendered_config_contexts
 from nautobot.extras.graphql.types import ContactAssociationType, DynamicGroupType, JobType, ScheduledJobType, TagType
 from nautobot.extras.models import ComputedField, CustomField, Relationship
 from nautobot.extras.registry import registry
@@ -372,6 +373,8 @@ def extend_schema_type_config_context(schema_type, model):
         return schema_type
 
     def resolve_config_context(self, args):
+        # Use the stored rendered config context, if CONFIG_CONTEXT_CACHE_ENABLED and not already rendered in bulk
+        prefetch_rendered_config_contexts([self])
         return self.get_config_context()
 
     schema_type._meta.fields["config_context"] = graphene.Field.mounted(generic.GenericScalar())
@@ -1,6 +1,7 @@
 import codecs
 import contextlib
 from io import BytesIO
+import tempfile
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
@@ -14,7 +15,7 @@ from rest_framework import exceptions as drf_exceptions
 from nautobot.core.api.exceptions import SerializerNotFound
 from nautobot.core.api.parsers import NautobotCSVParser
 from nautobot.core.api.renderers import NautobotCSVRenderer
-from nautobot.core.api.utils import get_serializer_for_model
+from nautobot.core.api.utils import get_serializer_for_model, iter_serialized_data
 from nautobot.core.celery import app, register_jobs
 from nautobot.core.exceptions import AbortTransaction
 from nautobot.core.jobs.bulk_actions import BulkDeleteObjects, BulkEditObjects
@@ -239,10 +240,20 @@ class ExportObjectList(Job):
             self.logger.info("Exporting %d objects to CSV. This may take some time.", object_count)
             # The force_csv=True attribute is a hack, but much easier than trying to construct a valid HttpRequest
             # object from scratch that passes all implicit and explicit assumptions in Django and DRF.
-            serializer = serializer_class(queryset, many=True, context={"request": None}, force_csv=True)
-            # Explicitly add UTF-8 BOM to the data so that Excel will understand non-ASCII characters correctly...
-            csv_data = codecs.BOM_UTF8 + renderer.render(serializer.data).encode("utf-8")
-            self.create_file(filename + ".csv", csv_data)
+            serializer_kwargs = {"context": {"request": None}, "force_csv": True}
+            custom_fields_field = serializer_class(**serializer_kwargs).fields.get("custom_fields")
+            # Serialize the objects a chunk at a time rather than holding all of their serialized data in memory at once
+            records = iter_serialized_data(serializer_class, queryset, **serializer_kwargs)
+            csv_lines = renderer.render_stream(
+                records, custom_field_keys=getattr(custom_fields_field, "custom_field_keys", None)
+            )
+            # Write the data to a temporary file as it is rendered, rather than joining it all together in memory
+            with tempfile.TemporaryFile() as csv_file:
+                # Explicitly add UTF-8 BOM to the data so that Excel will understand non-ASCII characters correctly...
+                csv_file.write(codecs.BOM_UTF8)
+                for line in csv_lines:
+                    csv_file.write(line.encode("utf-8"))
+                self.create_file(filename + ".csv", csv_file)
 
 
 class ImportObjects(Job):
@@ -22,6 +22,7 @@ from nautobot.core.settings_funcs import (
 from nautobot.core.views import server_error
 from nautobot.extras.choices import ObjectChangeEventContextChoices
 from nautobot.extras.context_managers import web_request_context
+from nautobot.ipam.context_managers import cached_closest_parents
 
 
 class RemoteUserMiddleware(RemoteUserMiddleware_):
@@ -102,11 +103,14 @@ class ObjectChangeMiddleware:
             return response
 
         # Process the request with change logging enabled
-        with web_request_context(
-            request.user,
-            context_detail=change_context_detail,
-            context=ObjectChangeEventContextChoices.CONTEXT_WEB,
-            request=request,
+        with (
+            web_request_context(
+                request.user,
+                context_detail=change_context_detail,
+                context=ObjectChangeEventContextChoices.CONTEXT_WEB,
+                request=request,
+            ),
+            cached_closest_parents(),
         ):
             response = self.get_response(request)
 
@@ -1,4 +1,4 @@
-from django.db.models import Count, OuterRef, Q, QuerySet, Subquery
+from django.db.models import Count, OuterRef, QuerySet, Subquery
 from django.db.models.functions import Coalesce
 
 from nautobot.core.models.utils import deconstruct_composite_key
@@ -130,12 +130,8 @@ class RestrictedQuerySet(CompositeKeyQuerySetMixin, QuerySet):
 
         # Filter the queryset to include only objects with allowed attributes
         else:
-            attrs = Q()
-            tokens = {
-                "$user": user,
-            }
-
-            attrs = permissions.qs_filter_from_constraints(user._object_perm_cache[permission_required], tokens)
+            # The filter compiled from the user's constraints for this permission is cached alongside the permissions
+            attrs = user._object_perm_cache.get_filter(permission_required, user)
             qs = self.filter(attrs)
 
         return qs
@@ -166,6 +162,27 @@ class RestrictedQuerySet(CompositeKeyQuerySetMixin, QuerySet):
 
         return self.restrict(user, action).filter(pk=pk).exists()
 
+    def check_perms_many(self, user, pks, *, action="view"):
+        """
+        Check whether the given user can perform the given action with regard to each of the given model instances.
+
+        Unlike calling `check_perms()` for each instance, this requires only a single query.
+
+        Args:
+          user (User): User instance
+          pks (Iterable[uuid]): Primary keys of the instances to check
+          action (str): The action which must be permitted (e.g. "view" for "dcim.view_location"); default is 'view'
+
+        Returns:
+            (dict): Mapping of each of the given primary keys to whether the action is permitted
+        """
+        pks = list(pks)
+        if not pks:
+            return {}
+        to_python = self.model._meta.pk.to_python
+        permitted_pks = set(self.restrict(user, action).filter(pk__in=pks).values_list("pk", flat=True))
+        return {pk: to_python(pk) in permitted_pks for pk in pks}
+
     def distinct_values_list(self, *fields, flat=False, named=False):
         """Wrapper for `QuerySet.values_list()` that adds the `distinct()` query to return a list of unique values.
 
@@ -82,6 +82,9 @@ if "NAUTOBOT_BANNER_LOGIN" in os.environ and os.environ["NAUTOBOT_BANNER_LOGIN"]
 if "NAUTOBOT_BANNER_TOP" in os.environ and os.environ["NAUTOBOT_BANNER_TOP"] != "":
     BANNER_TOP = os.environ["NAUTOBOT_BANNER_TOP"]
 
+# Enqueue job hooks and webhooks and publish events for logged changes in a Celery task, rather than in the request?
+CHANGELOG_ASYNC_PROCESSING_ENABLED = is_truthy(os.getenv("NAUTOBOT_CHANGELOG_ASYNC_PROCESSING_ENABLED", "False"))
+
 # Number of days to retain changelog entries. Set to 0 to retain changes indefinitely. Defaults to 90 if not set here.
 if "NAUTOBOT_CHANGELOG_RETENTION" in os.environ and os.environ["NAUTOBOT_CHANGELOG_RETENTION"] != "":
     CHANGELOG_RETENTION = int(os.environ["NAUTOBOT_CHANGELOG_RETENTION"])
@@ -90,6 +93,12 @@ if "NAUTOBOT_CHANGELOG_RETENTION" in os.environ and os.environ["NAUTOBOT_CHANGEL
 # when a large number of dynamic groups are present
 CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED = is_truthy(os.getenv("NAUTOBOT_CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED", "False"))
 
+# Store the rendered config context of each Device and Virtual Machine in the cache, for use by API and GraphQL queries?
+CONFIG_CONTEXT_CACHE_ENABLED = is_truthy(os.getenv("NAUTOBOT_CONFIG_CONTEXT_CACHE_ENABLED", "False"))
+
+# Number of seconds after which a stored rendered config context expires, even if nothing has invalidated it
+CONFIG_CONTEXT_CACHE_TIMEOUT = int(os.getenv("NAUTOBOT_CONFIG_CONTEXT_CACHE_TIMEOUT", "86400"))
+
 # UUID uniquely but anonymously identifying this Nautobot deployment.
 if "NAUTOBOT_DEPLOYMENT_ID" in os.environ and os.environ["NAUTOBOT_DEPLOYMENT_ID"] != "":
     DEPLOYMENT_ID = os.environ["NAUTOBOT_DEPLOYMENT_ID"]
@@ -101,6 +110,11 @@ if "NAUTOBOT_DEPLOYMENT_ID" in os.environ and os.environ["NAUTOBOT_DEPLOYMENT_ID
 if "NAUTOBOT_DEVICE_NAME_AS_NATURAL_KEY" in os.environ and os.environ["NAUTOBOT_DEVICE_NAME_AS_NATURAL_KEY"] != "":
     DEVICE_NAME_AS_NATURAL_KEY = is_truthy(os.environ["NAUTOBOT_DEVICE_NAME_AS_NATURAL_KEY"])
 
+# Incrementally update the cached members of dynamic groups for the objects changed by each request or Job?
+DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED = is_truthy(
+    os.getenv("NAUTOBOT_DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED", "False")
+)
+
 # Event Brokers
 EVENT_BROKERS = {}
 
@@ -187,10 +201,16 @@ if "NAUTOBOT_PER_PAGE_DEFAULTS" in os.environ and os.environ["NAUTOBOT_PER_PAGE_
 PLUGINS = []
 PLUGINS_CONFIG = {}
 
+# Use native PostgreSQL `inet` operators (and their GiST indexes) for IPAM containment queries?
+POSTGRESQL_INET_LOOKUPS_ENABLED = is_truthy(os.getenv("NAUTOBOT_POSTGRESQL_INET_LOOKUPS_ENABLED", "False"))
+
 # Prefer IPv6 addresses or IPv4 addresses in selecting a device's primary IP address? Default False
 if "NAUTOBOT_PREFER_IPV4" in os.environ and os.environ["NAUTOBOT_PREFER_IPV4"] != "":
     PREFER_IPV4 = is_truthy(os.environ["NAUTOBOT_PREFER_IPV4"])
 
+# Store the utilization of each Prefix in the database, updating it as Prefixes and IP addresses change?
+PREFIX_UTILIZATION_CACHE_ENABLED = is_truthy(os.getenv("NAUTOBOT_PREFIX_UTILIZATION_CACHE_ENABLED", "False"))
+
 # Publish a simple "no-index" robots.txt for Nautobot?
 PUBLISH_ROBOTS_TXT = is_truthy(os.getenv("NAUTOBOT_PUBLISH_ROBOTS_TXT", "True"))
 
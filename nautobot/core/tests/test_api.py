@@ -20,9 +20,10 @@ import yaml
 
 from nautobot.circuits.models import Provider
 from nautobot.core import testing
+from nautobot.core.api.pagination import OptionalLimitOffsetPagination
 from nautobot.core.api.parsers import NautobotCSVParser
 from nautobot.core.api.renderers import NautobotCSVRenderer
-from nautobot.core.api.utils import get_serializer_for_model, get_view_name
+from nautobot.core.api.utils import get_serializer_for_model, get_view_name, iter_serialized_data
 from nautobot.core.api.versioning import NautobotAPIVersioning
 from nautobot.core.api.views import ModelViewSet
 from nautobot.core.constants import COMPOSITE_KEY_SEPARATOR
@@ -189,6 +190,56 @@ class APIPaginationTestCase(testing.APITestCase):
         self.assertHttpStatus(response, 200)
         self.assertEqual(len(response.data["results"]), config.MAX_PAGE_SIZE)
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], PAGINATE_COUNT=5, MAX_PAGE_SIZE=10)
+    def test_pagination_without_count(self):
+        """With count=false, results are paginated as usual but not counted."""
+        provider_count = Provider.objects.count()
+        self.assertGreater(provider_count, 3)
+        response = self.client.get(f"{self.url}?limit=3&count=false", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertIsNone(response.data["count"])
+        self.assertEqual(len(response.data["results"]), 3)
+        self.assertIn("offset=3", response.data["next"])
+
+        response = self.client.get(f"{self.url}?limit=3&offset={provider_count - 1}&count=false", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertIsNone(response.data["next"])
+        self.assertIsNotNone(response.data["previous"])
+
+        response = self.client.get(f"{self.url}?limit=3&count=estimated", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertIsInstance(response.data["count"], int)
+        self.assertEqual(len(response.data["results"]), 3)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], PAGINATE_COUNT=5, MAX_PAGE_SIZE=10)
+    def test_cursor_pagination(self):
+        """Following the next link of cursor pagination retrieves every object exactly once, in primary key order."""
+        url = f"{self.url}?limit=3&cursor="
+        pks = []
+        while url:
+            response = self.client.get(url, **self.header)
+            self.assertHttpStatus(response, 200)
+            self.assertIsNone(response.data["count"])
+            self.assertIsNone(response.data["previous"])
+            self.assertLessEqual(len(response.data["results"]), 3)
+            pks.extend(result["id"] for result in response.data["results"])
+            url = response.data["next"]
+        self.assertEqual(pks, [str(pk) for pk in Provider.objects.order_by("pk").values_list("pk", flat=True)])
+
+        response = self.client.get(f"{self.url}?cursor=not-a-cursor", **self.header)
+        self.assertHttpStatus(response, 404)
+
+        # Cursor pagination always orders by primary key, so sorting is rejected rather than ignored
+        response = self.client.get(f"{self.url}?cursor=&sort=name", **self.header)
+        self.assertHttpStatus(response, 400)
+
+    def test_paginated_response_schema(self):
+        """The paginated response schema reflects that the count may be null."""
+        schema = OptionalLimitOffsetPagination().get_paginated_response_schema({"type": "array"})
+        self.assertTrue(schema["properties"]["count"]["nullable"])
+        self.assertEqual(schema["properties"]["results"], {"type": "array"})
+
 
 class APIVersioningTestCase(testing.APITestCase):
     """
@@ -519,6 +570,24 @@ class NautobotCSVRendererTest(TestCase):
         self.assertIn("parent__name", read_data)
         self.assertEqual(read_data["parent__name"], location_type.parent.name)
 
+    @override_settings(ALLOWED_HOSTS=["*"])
+    def test_render_stream(self):
+        """Streamed rendering of serialized data in chunks should match rendering all of it at once."""
+        queryset = dcim_models.Location.objects.all()
+        self.assertGreater(queryset.count(), 2)
+        request = RequestFactory().get(reverse("dcim-api:location-list"), ACCEPT="text/csv")
+        setattr(request, "accepted_media_type", ["text/csv"])
+        context = {"request": request, "depth": 0}
+        renderer = NautobotCSVRenderer()
+
+        expected = renderer.render(dcim_serializers.LocationSerializer(queryset, many=True, context=context).data)
+        records = iter_serialized_data(dcim_serializers.LocationSerializer, queryset, chunk_size=2, context=context)
+        custom_field_keys = extras_models.CustomField.objects.keys_for_model(dcim_models.Location)
+        csv_text = "".join(renderer.render_stream(records, custom_field_keys=custom_field_keys))
+        self.assertEqual(csv_text, expected)
+
+        self.assertEqual(list(renderer.render_stream([])), [])
+
 
 class ModelViewSetMixinTest(testing.APITestCase):
     """Unit tests for ModelViewSetMixin, base class for ModelViewSet/ReadOnlyModelViewSet classes."""
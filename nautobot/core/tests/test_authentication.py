@@ -664,3 +664,63 @@ class ObjectPermissionAPIViewTestCase(TestCase):
             response_user2.data["count"], ObjectChange.objects.filter(Q(user=obj_user2) | Q(action="delete")).count()
         )
         self.assertEqual(response_user2.data["results"][0]["user"]["id"], obj_user2.pk)
+
+
+class ObjectPermissionCacheTestCase(TestCase):
+    """Tests for the caching of users' object permissions and of the filters compiled from their constraints."""
+
+    def setUp(self):
+        self.user = User.objects.create(username="testuser")
+        self.locations = list(Location.objects.all()[:3])
+        self.obj_perm = ObjectPermission.objects.create(
+            name="Test permission", constraints={"pk": str(self.locations[0].pk)}, actions=["view"]
+        )
+        self.obj_perm.object_types.add(ContentType.objects.get_for_model(Location))
+        self.obj_perm.users.add(self.user)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+    def test_compiled_filter_cached_and_invalidated(self):
+        self.assertQuerysetEqual(Location.objects.restrict(self.user, "view"), [self.locations[0]])
+        perm_cache = self.user._object_perm_cache
+        compiled_filter = perm_cache.get_filter("dcim.view_location", self.user)
+        self.assertQuerysetEqual(Location.objects.restrict(self.user, "view"), [self.locations[0]])
+        self.assertIs(self.user._object_perm_cache, perm_cache)
+        self.assertIs(perm_cache.get_filter("dcim.view_location", self.user), compiled_filter)
+
+        # Changing the permission should discard the cached permissions and compiled filters
+        self.obj_perm.constraints = {"pk": str(self.locations[1].pk)}
+        self.obj_perm.save()
+        self.assertQuerysetEqual(Location.objects.restrict(self.user, "view"), [self.locations[1]])
+        self.assertIsNot(self.user._object_perm_cache, perm_cache)
+
+        # As should changing group membership
+        perm_cache = self.user._object_perm_cache
+        group = Group.objects.create(name="Test group")
+        group_perm = ObjectPermission.objects.create(
+            name="Test group permission", constraints={"pk": str(self.locations[2].pk)}, actions=["view"]
+        )
+        group_perm.object_types.add(ContentType.objects.get_for_model(Location))
+        group_perm.groups.add(group)
+        self.assertQuerysetEqual(Location.objects.restrict(self.user, "view"), [self.locations[1]])
+        self.user.groups.add(group)
+        self.assertQuerysetEqual(
+            Location.objects.restrict(self.user, "view"), [self.locations[1], self.locations[2]], ordered=False
+        )
+        self.assertIsNot(self.user._object_perm_cache, perm_cache)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+    def test_check_perms_many(self):
+        pks = [location.pk for location in self.locations]
+        self.user.get_all_permissions()  # load the user's permissions in advance of counting queries
+        with self.assertNumQueries(1):
+            result = Location.objects.check_perms_many(self.user, pks, action="view")
+        self.assertEqual(result, {pks[0]: True, pks[1]: False, pks[2]: False})
+        self.assertEqual(
+            Location.objects.check_perms_many(self.user, [str(pk) for pk in pks]),
+            {str(pks[0]): True, str(pks[1]): False, str(pks[2]): False},
+        )
+        self.assertEqual(Location.objects.check_perms_many(self.user, [], action="view"), {})
+        self.assertEqual(
+            Location.objects.check_perms_many(self.user, pks, action="change"),
+            {pks[0]: False, pks[1]: False, pks[2]: False},
+        )
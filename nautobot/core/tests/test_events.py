@@ -7,6 +7,7 @@ from django.conf import settings
 import redis
 
 from nautobot.core.events import (
+    batched_event_publishing,
     deregister_event_broker,
     EventBroker,
     load_event_brokers,
@@ -30,6 +31,16 @@ class TestEventBroker(EventBroker):
         self.events[topic].append(payload)
 
 
+class TestBatchingEventBroker(TestEventBroker):
+    def __init__(self, **kwargs):
+        self.batches = []
+        super().__init__(**kwargs)
+
+    def publish_many(self, events):
+        self.batches.append(events)
+        super().publish_many(events)
+
+
 class InvalidTestEventBroker:
     """Broker that do not inherit from EventBroker"""
 
@@ -98,6 +109,52 @@ class EventNotificationTest(TestCase):
         deregister_event_broker(event_broker)
         deregister_event_broker(event_broker_2)
 
+    def test_is_topic_included(self):
+        event_broker = TestEventBroker(include_topics=["nautobot.test.*", "nautobot.other"], exclude_topics=["*.skip"])
+        self.assertTrue(event_broker.is_topic_included("nautobot.test.event"))
+        self.assertTrue(event_broker.is_topic_included("nautobot.other"))
+        self.assertFalse(event_broker.is_topic_included("nautobot.other.event"))
+        self.assertFalse(event_broker.is_topic_included("nautobot.test.event.skip"))
+        self.assertFalse(event_broker.is_topic_included("nautobot.create.dcim.device"))
+
+        # Changes to the patterns take effect immediately
+        event_broker.exclude_topics = []
+        self.assertTrue(event_broker.is_topic_included("nautobot.test.event.skip"))
+        self.assertTrue(TestEventBroker().is_topic_included("nautobot.create.dcim.device"))
+
+    def test_batched_event_publishing(self):
+        event_broker = TestBatchingEventBroker(exclude_topics=["*.skip"])
+        register_event_broker(event_broker)
+        try:
+            with batched_event_publishing(max_size=3):
+                for i in range(4):
+                    publish_event(topic="nautobot.test.event", payload={"a": i})
+                publish_event(topic="nautobot.test.event.skip", payload={"b": 1})
+                # Nested usage is a no-op
+                with batched_event_publishing():
+                    publish_event(topic="nautobot.test.another_event", payload={"c": 1})
+                # The first batch is delivered as soon as the buffer is full, the remainder on exit
+                self.assertEqual(len(event_broker.batches), 1)
+                self.assertEqual(len(event_broker.events["nautobot.test.event"]), 3)
+            self.assertEqual(
+                event_broker.batches,
+                [
+                    [("nautobot.test.event", json.dumps({"a": i})) for i in range(3)],
+                    [
+                        ("nautobot.test.event", json.dumps({"a": 3})),
+                        ("nautobot.test.another_event", json.dumps({"c": 1})),
+                    ],
+                ],
+            )
+            self.assertNotIn("nautobot.test.event.skip", event_broker.events)
+
+            # Outside of the context manager, events are published immediately
+            publish_event(topic="nautobot.test.event", payload={"a": 4})
+            self.assertEqual(len(event_broker.batches), 2)
+            self.assertEqual(len(event_broker.events["nautobot.test.event"]), 5)
+        finally:
+            deregister_event_broker(event_broker)
+
     @load_event_broker_override_settings(
         EVENT_BROKERS={
             "SyslogEventBroker": {
@@ -208,6 +265,24 @@ class EventNotificationTest(TestCase):
             # Assert exclude topics are not published
             publish_event(topic="nautobot.test.event.no-publish", payload={"c": 3})
             self.assertIsNone(sub.get_message(timeout=5.0))
+
+            # Assert batched events are published in order
+            with batched_event_publishing():
+                publish_event(topic="nautobot.test.event", payload={"d": 4})
+                publish_event(topic="nautobot.test.another_event", payload={"e": 5})
+            self.assertEqual(
+                sub.get_message(timeout=5.0),
+                {"type": "pmessage", "pattern": "nautobot.*", "channel": "nautobot.test.event", "data": '{"d": 4}'},
+            )
+            self.assertEqual(
+                sub.get_message(timeout=5.0),
+                {
+                    "type": "pmessage",
+                    "pattern": "nautobot.*",
+                    "channel": "nautobot.test.another_event",
+                    "data": '{"e": 5}',
+                },
+            )
         finally:
             if sub is not None:
                 sub.close()
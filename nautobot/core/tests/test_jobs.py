@@ -17,11 +17,17 @@ from nautobot.core.jobs.cleanup import CleanupTypes
 from nautobot.core.testing import create_job_result_and_run_job, TransactionTestCase
 from nautobot.core.testing.context import load_event_broker_override_settings
 from nautobot.dcim.models import Device, DeviceType, Location, LocationType, Manufacturer
-from nautobot.extras.choices import JobResultStatusChoices, LogLevelChoices
+from nautobot.extras.choices import (
+    DynamicGroupOperatorChoices,
+    DynamicGroupTypeChoices,
+    JobResultStatusChoices,
+    LogLevelChoices,
+)
 from nautobot.extras.factory import JobResultFactory, ObjectChangeFactory
 from nautobot.extras.models import (
     Contact,
     ContactAssociation,
+    DynamicGroup,
     ExportTemplate,
     FileProxy,
     JobLogEntry,
@@ -29,6 +35,7 @@ from nautobot.extras.models import (
     ObjectChange,
     Role,
     SavedView,
+    StaticGroupAssociation,
     Status,
     Tag,
 )
@@ -732,6 +739,48 @@ class LogsCleanupTestCase(TransactionTestCase):
         self.assertTrue(ObjectChange.objects.filter(time__gte=cutoff).exists())
 
 
+class RefreshDynamicGroupCachesTestCase(TransactionTestCase):
+    """
+    Test the RefreshDynamicGroupCaches system job.
+    """
+
+    databases = ("default", "job_logs")
+
+    def test_refresh_dynamic_group_caches(self):
+        namespace_ct = ContentType.objects.get_for_model(Namespace)
+        namespaces = [Namespace.objects.create(name=f"Refresh Test Namespace {i}") for i in range(4)]
+        child_1 = DynamicGroup.objects.create(
+            name="Child 1", content_type=namespace_ct, filter={"name": [ns.name for ns in namespaces[:2]]}
+        )
+        child_2 = DynamicGroup.objects.create(
+            name="Child 2", content_type=namespace_ct, filter={"name": [ns.name for ns in namespaces[1:3]]}
+        )
+        parent = DynamicGroup.objects.create(
+            name="Parent", content_type=namespace_ct, group_type=DynamicGroupTypeChoices.TYPE_DYNAMIC_SET
+        )
+        parent.add_child(child_1, operator=DynamicGroupOperatorChoices.OPERATOR_UNION, weight=10)
+        parent.add_child(child_2, operator=DynamicGroupOperatorChoices.OPERATOR_DIFFERENCE, weight=20)
+        StaticGroupAssociation.all_objects.all().delete()
+
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs.groups", "RefreshDynamicGroupCaches", max_workers=2
+        )
+
+        self.assertJobResultStatus(job_result)
+        self.assertEqual(set(child_1.members), set(namespaces[:2]))
+        self.assertEqual(set(child_2.members), set(namespaces[1:3]))
+        self.assertEqual(set(parent.members), {namespaces[0]})
+        self.assertEqual(set(job_result.result["refresh_seconds"]), {"Child 1", "Child 2", "Parent"})
+        # Child groups are refreshed before their parent
+        refreshed_groups = list(
+            JobLogEntry.objects.filter(job_result=job_result, message__startswith="Cache refreshed successfully")
+            .order_by("created")
+            .values_list("log_object", flat=True)
+        )
+        self.assertEqual(len(refreshed_groups), 3)
+        self.assertEqual(refreshed_groups[-1], str(parent))
+
+
 class BulkEditTestCase(TransactionTestCase):
     """
     Test the BulkEdit system job.
@@ -0,0 +1,293 @@
+"""
+Bulk tracing of CablePaths using an in-memory model of the cabling topology.
+
+`CablePath.from_origin()` follows a path one hop at a time, with several queries per hop, which is appropriate when a
+single path but far too slow to (re)trace many paths at once. `CablePathTracer` instead loads the relevant Cables,
+FrontPort-to-RearPort mappings, and Circuit Termination pairings in bulk, then traces any number of paths with
+dictionary lookups and writes them to the database in bulk.
+"""
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from nautobot.dcim.models import Cable, CablePath, FrontPort, RearPort
+from nautobot.dcim.utils import compile_path_node
+
+
+class CablePathTracer:
+    """
+    In-memory model of Cables, pass-through ports, and Circuit Terminations, for tracing many CablePaths at once.
+
+    Nodes are represented as `(content_type_id, pk)` tuples throughout. The tracer reflects the database at the time
+    each part of the topology was loaded, so should be discarded once the paths of interest have been traced.
+
+    By default the entire topology is loaded up front, which suits (re)tracing every path in the database. With
+    `preload=False`, the topology is instead loaded on demand and retained, so that tracing a batch of related paths
+    (such as every path through the same RearPort) only loads their shared segments once.
+
+    Example usage:
+
+    >>> tracer = CablePathTracer()
+    >>> tracer.create_paths(Interface, Interface.objects.filter(cable__isnull=False).values_list("pk", flat=True))
+    """
+
+    def __init__(self, preload=True):
+        from nautobot.circuits.models import CircuitTermination  # avoid circular import
+
+        get_content_type_id = ContentType.objects.get_for_model
+        self.front_port_type_id = get_content_type_id(FrontPort).pk
+        self.rear_port_type_id = get_content_type_id(RearPort).pk
+        self.circuit_termination_type_id = get_content_type_id(CircuitTermination).pk
+        self.cable_type_id = get_content_type_id(Cable).pk
+        connected_status = Cable.STATUS_CONNECTED
+        self.connected_status_id = connected_status.pk if connected_status is not None else None
+        self.preload = preload
+
+        # {node: (cable_pk, is_connected, peer_node)}
+        self.cables = {}
+        # {front_port_pk: (rear_port_pk, rear_port_position)} and {(rear_port_pk, rear_port_position): front_port_pk}
+        self.front_port_mappings = {}
+        self.rear_port_mappings = {}
+        # {rear_port_pk: positions}
+        self.rear_port_positions = {}
+        # {circuit_termination_pk: peer_circuit_termination_pk}
+        self.circuit_termination_peers = {}
+        # Nodes and Circuit Terminations whose cable and peer respectively have been loaded, when not preloading
+        self._loaded_nodes = set()
+        self._loaded_circuit_terminations = set()
+
+        if preload:
+            self._add_cables(Cable.objects.all())
+            self.rear_port_positions.update(RearPort.objects.values_list("pk", "positions"))
+            self._add_front_ports(FrontPort.objects.all())
+            self._add_circuit_terminations(CircuitTermination.objects.all())
+
+    def _add_cables(self, queryset):
+        for cable_pk, a_type_id, a_id, b_type_id, b_id, status_id in queryset.values_list(
+            "pk", "termination_a_type", "termination_a_id", "termination_b_type", "termination_b_id", "status"
+        ):
+            is_connected = status_id == self.connected_status_id
+            self.cables[(a_type_id, a_id)] = (cable_pk, is_connected, (b_type_id, b_id))
+            self.cables[(b_type_id, b_id)] = (cable_pk, is_connected, (a_type_id, a_id))
+            self._loaded_nodes.update([(a_type_id, a_id), (b_type_id, b_id)])
+
+    def _add_front_ports(self, queryset):
+        front_port_pks = []
+        for front_port_pk, rear_port_pk, position in queryset.values_list("pk", "rear_port", "rear_port_position"):
+            self.front_port_mappings[front_port_pk] = (rear_port_pk, position)
+            self.rear_port_mappings[(rear_port_pk, position)] = front_port_pk
+            front_port_pks.append(front_port_pk)
+        return front_port_pks
+
+    def _add_circuit_terminations(self, queryset):
+        terminations_by_circuit = {}
+        for termination_pk, circuit_pk, term_side in queryset.values_list("pk", "circuit", "term_side"):
+            terminations_by_circuit.setdefault(circuit_pk, {})[term_side] = termination_pk
+            self._loaded_circuit_terminations.add(termination_pk)
+        for terminations in terminations_by_circuit.values():
+            if "A" in terminations and "Z" in terminations:
+                self.circuit_termination_peers[terminations["A"]] = terminations["Z"]
+                self.circuit_termination_peers[terminations["Z"]] = terminations["A"]
+
+    def _load_cables(self, nodes):
+        """Load the Cables attached to the given nodes, with one query per type of node plus one for the Cables."""
+        pks_by_type = {}
+        for node in nodes:
+            if node not in self._loaded_nodes:
+                pks_by_type.setdefault(node[0], set()).add(node[1])
+                self._loaded_nodes.add(node)
+        cable_pks = set()
+        for content_type_id, pks in pks_by_type.items():
+            # Use each termination's own `cable` (as `CablePath.from_origin()` does) rather than querying the Cable
+            # table, as the latter still contains a Cable that is in the process of being deleted.
+            model = ContentType.objects.get_for_id(content_type_id).model_class()
+            cable_pks.update(model.objects.filter(pk__in=pks, cable__isnull=False).values_list("cable", flat=True))
+        if cable_pks:
+            self._add_cables(Cable.objects.filter(pk__in=cable_pks))
+
+    def _load_rear_ports(self, rear_port_pks):
+        """Load the given RearPorts along with all of their FrontPorts, and the Cables attached to those FrontPorts."""
+        rear_port_pks = [pk for pk in rear_port_pks if pk not in self.rear_port_positions]
+        if not rear_port_pks:
+            return
+        self.rear_port_positions.update(RearPort.objects.filter(pk__in=rear_port_pks).values_list("pk", "positions"))
+        front_port_pks = self._add_front_ports(FrontPort.objects.filter(rear_port__in=rear_port_pks))
+        # Other paths through the same RearPort will continue through its other FrontPorts, so load them all at once
+        self._load_cables([(self.front_port_type_id, pk) for pk in front_port_pks])
+
+    def _get_cable(self, node):
+        if not self.preload and node not in self._loaded_nodes:
+            self._load_cables([node])
+        return self.cables.get(node)
+
+    def _get_front_port_mapping(self, front_port_pk):
+        if not self.preload and front_port_pk not in self.front_port_mappings:
+            self._load_rear_ports(FrontPort.objects.filter(pk=front_port_pk).values_list("rear_port", flat=True))
+        return self.front_port_mappings[front_port_pk]
+
+    def _get_rear_port_positions(self, rear_port_pk):
+        if not self.preload:
+            self._load_rear_ports([rear_port_pk])
+        return self.rear_port_positions[rear_port_pk]
+
+    def _get_circuit_termination_peer(self, circuit_termination_pk):
+        if not self.preload and circuit_termination_pk not in self._loaded_circuit_terminations:
+            from nautobot.circuits.models import CircuitTermination  # avoid circular import
+
+            circuits = CircuitTermination.objects.filter(pk=circuit_termination_pk).values("circuit")
+            self._add_circuit_terminations(CircuitTermination.objects.filter(circuit__in=circuits))
+        return self.circuit_termination_peers.get(circuit_termination_pk)
+
+    def trace(self, origin):
+        """
+        Trace the path originating from the given node, following the same rules as `CablePath.from_origin()`.
+
+        Args:
+            origin (tuple[int, uuid.UUID]): `(content_type_id, pk)` of a cabled PathEndpoint.
+
+        Returns:
+            (CablePath, None): An unsaved CablePath, or None if the origin is not cabled.
+
+        Raises:
+            ValidationError: if the path contains a loop.
+        """
+        if self._get_cable(origin) is None:
+            return None
+
+        destination = None
+        path = []
+        position_stack = []
+        is_active = True
+        is_split = False
+
+        node = origin
+        visited_nodes = set()
+        while self._get_cable(node) is not None:
+            if node[1] in visited_nodes:
+                raise ValidationError("a loop is detected in the path")
+            visited_nodes.add(node[1])
+            cable_pk, is_connected, peer = self._get_cable(node)
+            if not is_connected:
+                is_active = False
+
+            # Follow the cable to its far-end termination
+            path.append(compile_path_node(self.cable_type_id, cable_pk))
+            peer_type_id, peer_pk = peer
+
+            # Follow a FrontPort to its corresponding RearPort
+            if peer_type_id == self.front_port_type_id:
+                path.append(compile_path_node(*peer))
+                rear_port_pk, position = self._get_front_port_mapping(peer_pk)
+                if self._get_rear_port_positions(rear_port_pk) > 1:
+                    position_stack.append(position)
+                node = (self.rear_port_type_id, rear_port_pk)
+                path.append(compile_path_node(*node))
+
+            # Follow a RearPort to its corresponding FrontPort (if any)
+            elif peer_type_id == self.rear_port_type_id:
+                path.append(compile_path_node(*peer))
+
+                # Determine the peer FrontPort's position
+                if self._get_rear_port_positions(peer_pk) == 1:
+                    position = 1
+                elif position_stack:
+                    position = position_stack.pop()
+                else:
+                    # No position indicated: path has split, so we stop at the RearPort
+                    is_split = True
+                    break
+
+                front_port_pk = self.rear_port_mappings.get((peer_pk, position))
+                if front_port_pk is None:
+                    # No corresponding FrontPort found for the RearPort
+                    break
+                node = (self.front_port_type_id, front_port_pk)
+                path.append(compile_path_node(*node))
+
+            # Follow a Circuit Termination if there is a corresponding Circuit Termination
+            elif peer_type_id == self.circuit_termination_type_id:
+                peer_termination_pk = self._get_circuit_termination_peer(peer_pk)
+                # A Circuit Termination does not require a peer.
+                if peer_termination_pk is None:
+                    destination = peer
+                    break
+                node = (self.circuit_termination_type_id, peer_termination_pk)
+                path.append(compile_path_node(*peer))
+                path.append(compile_path_node(*node))
+
+            # Anything else marks the end of the path
+            else:
+                destination = peer
+                break
+
+        if destination is None:
+            is_active = False
+
+        return CablePath(
+            origin_type_id=origin[0],
+            origin_id=origin[1],
+            destination_type_id=destination[0] if destination else None,
+            destination_id=destination[1] if destination else None,
+            path=path,
+            is_active=is_active,
+            is_split=is_split,
+        )
+
+    def create_paths(self, model, pks, batch_size=1000):
+        """
+        Trace and save the CablePaths originating from the given PathEndpoints, replacing any existing paths.
+
+        Each batch of paths is written with a single `bulk_create()`, and the `_path` of each origin is updated with a
+        single `bulk_update()`. Origins that are not cabled have any existing path removed. The CablePathNode index is
+        updated accordingly.
+
+        Args:
+            model (type[PathEndpoint]): Model of the origins, such as `Interface`.
+            pks (Iterable[uuid.UUID]): Primary keys of the origins.
+            batch_size (int): Number of paths to write with each query.
+
+        Returns:
+            (int): The number of CablePaths created.
+        """
+        content_type_id = ContentType.objects.get_for_model(model).pk
+        pks = list(pks)
+        created_count = 0
+        for i in range(0, len(pks), batch_size):
+            batch = pks[i : i + batch_size]
+            if not self.preload:
+                self._load_cables([(content_type_id, pk) for pk in batch])
+            cable_paths = [self.trace((content_type_id, pk)) for pk in batch]
+            cable_paths = [cable_path for cable_path in cable_paths if cable_path is not None]
+            with transaction.atomic():
+                CablePath.objects.filter(origin_type_id=content_type_id, origin_id__in=batch).delete()
+                CablePath.objects.bulk_create(cable_paths, batch_size=batch_size)
+                CablePath.update_node_index(cable_paths)
+                model.objects.bulk_update(
+                    [model(pk=cable_path.origin_id, _path_id=cable_path.pk) for cable_path in cable_paths],
+                    ["_path"],
+                    batch_size=batch_size,
+                )
+            created_count += len(cable_paths)
+        return created_count
+
+    def rebuild_paths(self, origins, batch_size=1000):
+        """
+        Re-trace and replace the CablePaths originating from the given PathEndpoints of any type.
+
+        Args:
+            origins (Iterable[tuple[int, uuid.UUID]]): `(content_type_id, pk)` of each origin, such as the
+                `values_list("origin_type", "origin_id")` of a CablePath queryset.
+            batch_size (int): Number of paths to write with each query.
+
+        Returns:
+            (int): The number of CablePaths created.
+        """
+        pks_by_type = {}
+        for content_type_id, pk in origins:
+            pks_by_type.setdefault(content_type_id, []).append(pk)
+        created_count = 0
+        for content_type_id, pks in pks_by_type.items():
+            model = ContentType.objects.get_for_id(content_type_id).model_class()
+            created_count += self.create_paths(model, pks, batch_size=batch_size)
+        return created_count
@@ -3,6 +3,7 @@ from django.core.management.color import no_style
 from django.db import connection
 
 from nautobot.circuits.models import CircuitTermination
+from nautobot.dcim.cable_paths import CablePathTracer
 from nautobot.dcim.models import (
     CablePath,
     ConsolePort,
@@ -12,7 +13,6 @@ from nautobot.dcim.models import (
     PowerOutlet,
     PowerPort,
 )
-from nautobot.dcim.signals import create_cablepath
 
 ENDPOINT_MODELS = (
     CircuitTermination,
@@ -35,6 +35,12 @@ class Command(BaseCommand):
             dest="force",
             help="Force recalculation of all existing cable paths",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of cable paths to trace and write at a time (default: 1000)",
+        )
         parser.add_argument(
             "--no-input",
             action="store_true",
@@ -78,22 +84,23 @@ class Command(BaseCommand):
                 for sql in sequence_sql:
                     cursor.execute(sql)
 
-        # Retrace paths
+        # Retrace paths, using a single in-memory model of the cabling topology for all of them
+        self.stdout.write("Loading cable topology...")
+        tracer = CablePathTracer()
+        batch_size = options["batch_size"]
         for model in ENDPOINT_MODELS:
             origins = model.objects.filter(cable__isnull=False)
             if not options["force"]:
                 origins = origins.filter(_path__isnull=True)
-            origins_count = origins.count()
+            origin_pks = list(origins.values_list("pk", flat=True))
+            origins_count = len(origin_pks)
             if not origins_count:
                 self.stdout.write(f"Found no missing {model._meta.verbose_name} paths; skipping")
                 continue
             self.stdout.write(f"Retracing {origins_count} cabled {model._meta.verbose_name_plural}...")
-            i = 0
-            for i, obj in enumerate(origins, start=1):
-                create_cablepath(obj)
-                if not i % 100:
-                    self.draw_progress_bar(i * 100 / origins_count)
-            self.draw_progress_bar(100)
-            self.stdout.write(self.style.SUCCESS(f"\n  Retraced {i} {model._meta.verbose_name_plural}"))
+            for i in range(0, origins_count, batch_size):
+                tracer.create_paths(model, origin_pks[i : i + batch_size], batch_size=batch_size)
+                self.draw_progress_bar(min(i + batch_size, origins_count) * 100 / origins_count)
+            self.stdout.write(self.style.SUCCESS(f"\n  Retraced {origins_count} {model._meta.verbose_name_plural}"))
 
         self.stdout.write(self.style.SUCCESS("Finished."))
@@ -0,0 +1,64 @@
+# Generated by Django 4.2.24 on 2025-10-02 14:12
+
+import uuid
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_cable_path_nodes(apps, schema_editor):
+    """
+    Index the nodes of all existing CablePaths.
+    """
+    CablePath = apps.get_model("dcim", "CablePath")
+    CablePathNode = apps.get_model("dcim", "CablePathNode")
+
+    nodes = []
+    for cable_path_id, path in CablePath.objects.values_list("id", "path").iterator():
+        for node in path:
+            node_type_id, node_id = node.split(":")
+            nodes.append(CablePathNode(cable_path_id=cable_path_id, node_type_id=int(node_type_id), node_id=node_id))
+        if len(nodes) >= 1000:
+            CablePathNode.objects.bulk_create(nodes)
+            nodes = []
+    CablePathNode.objects.bulk_create(nodes)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("dcim", "0072_alter_powerfeed_options_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CablePathNode",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("node_id", models.UUIDField()),
+                (
+                    "cable_path",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="nodes", to="dcim.cablepath"
+                    ),
+                ),
+                (
+                    "node_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [models.Index(fields=["node_type", "node_id"], name="dcim_cablep_node_ty_adf4e2_idx")],
+            },
+        ),
+        migrations.RunPython(populate_cable_path_nodes, migrations.RunPython.noop),
+    ]
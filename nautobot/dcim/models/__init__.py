@@ -1,4 +1,4 @@
-from .cables import Cable, CablePath
+from .cables import Cable, CablePath, CablePathNode
 from .device_component_templates import (
     ConsolePortTemplate,
     ConsoleServerPortTemplate,
@@ -54,6 +54,7 @@ __all__ = (
     "BaseInterface",
     "Cable",
     "CablePath",
+    "CablePathNode",
     "CableTermination",
     "ConsolePort",
     "ConsolePortTemplate",
@@ -9,12 +9,14 @@ from django.db.models import Sum
 from django.utils.functional import classproperty
 
 from nautobot.core.constants import CHARFIELD_MAX_LENGTH
+from nautobot.core.models import BaseManager, RestrictedQuerySet
 from nautobot.core.models.fields import ColorField
 from nautobot.core.utils.data import to_meters
 from nautobot.dcim.choices import CableLengthUnitChoices, CableTypeChoices
 from nautobot.dcim.constants import CABLE_TERMINATION_MODELS, COMPATIBLE_TERMINATION_TYPES, NONCONNECTABLE_IFACE_TYPES
 from nautobot.dcim.fields import JSONPathField
 from nautobot.dcim.utils import (
+    compile_path_node,
     decompile_path_node,
     object_to_path_node,
     path_node_to_object,
@@ -34,6 +36,7 @@ from .devices import Device
 __all__ = (
     "Cable",
     "CablePath",
+    "CablePathNode",
 )
 
 logger = logging.getLogger(__name__)
@@ -284,6 +287,22 @@ class Cable(PrimaryModel):
         return COMPATIBLE_TERMINATION_TYPES[self.termination_a._meta.model_name]
 
 
+class CablePathQuerySet(RestrictedQuerySet):
+    """Queryset for CablePath objects."""
+
+    def traversing(self, obj):
+        """
+        Return all CablePaths whose `path` includes the given object, as found via the CablePathNode index.
+
+        This is equivalent to `filter(path__contains=obj)`, but uses an indexed lookup instead of scanning every path.
+        """
+        return self.filter(
+            pk__in=CablePathNode.objects.filter(
+                node_type=ContentType.objects.get_for_model(obj), node_id=obj.pk
+            ).values("cable_path")
+        )
+
+
 @extras_features("graphql")
 class CablePath(BaseModel):
     """
@@ -332,6 +351,8 @@ class CablePath(BaseModel):
 
     natural_key_field_names = ["pk"]
 
+    objects = BaseManager.from_queryset(CablePathQuerySet)()
+
     class Meta:
         unique_together = ("origin_type", "origin_id")
 
@@ -346,6 +367,25 @@ class CablePath(BaseModel):
         model = self.origin._meta.model
         model.objects.filter(pk=self.origin.pk).update(_path=self.pk)
 
+        CablePath.update_node_index([self])
+
+    @classmethod
+    def update_node_index(cls, cable_paths):
+        """
+        Replace the CablePathNode index entries of the given saved CablePaths with entries for their current `path`.
+
+        Must be called whenever `path` is changed other than through `save()`, such as by `bulk_create()` or `update()`.
+        """
+        CablePathNode.objects.filter(cable_path__in=cable_paths).delete()
+        CablePathNode.objects.bulk_create(
+            [
+                CablePathNode(cable_path=cable_path, node_type_id=node_type_id, node_id=node_id)
+                for cable_path in cable_paths
+                for node_type_id, node_id in map(decompile_path_node, cable_path.path)
+            ],
+            batch_size=1000,
+        )
+
     @property
     def segment_count(self):
         total_length = 1 + len(self.path) + (1 if self.destination else 0)
@@ -481,3 +521,28 @@ class CablePath(BaseModel):
         """
         rearport = path_node_to_object(self.path[-1])
         return FrontPort.objects.filter(rear_port=rearport)
+
+
+class CablePathNode(BaseModel):
+    """
+    An index of the nodes traversed by each CablePath, used to find the paths affected by a change to any given node.
+
+    There is one CablePathNode for each element of `CablePath.path`; these are maintained by `CablePath.save()` and
+    `CablePath.update_node_index()` and should not be modified directly.
+    """
+
+    cable_path = models.ForeignKey(to=CablePath, on_delete=models.CASCADE, related_name="nodes")
+    node_type = models.ForeignKey(to=ContentType, on_delete=models.CASCADE, related_name="+")
+    node_id = models.UUIDField()
+    node = GenericForeignKey(ct_field="node_type", fk_field="node_id")
+    is_metadata_associable_model = False
+
+    natural_key_field_names = ["pk"]
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["node_type", "node_id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.cable_path_id}: {compile_path_node(self.node_type_id, self.node_id)}"
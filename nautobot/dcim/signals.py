@@ -8,6 +8,7 @@ from django.dispatch import receiver
 
 from nautobot.core.signals import disable_for_loaddata
 
+from .cable_paths import CablePathTracer
 from .models import (
     Cable,
     CablePath,
@@ -47,13 +48,11 @@ def rebuild_paths(obj):
     """
     Rebuild all CablePaths which traverse the specified node
     """
-    cable_paths = CablePath.objects.filter(path__contains=obj)
+    origins = CablePath.objects.traversing(obj).values_list("origin_type", "origin_id")
 
     with transaction.atomic():
-        for cp in cable_paths:
-            cp.delete()
-            # Prevent looping back to rebuild_paths during the atomic transaction.
-            create_cablepath(cp.origin, rebuild=False)
+        # Paths through the same node share much of their topology, so trace them together with a single tracer.
+        CablePathTracer(preload=False).rebuild_paths(origins)
 
 
 #
@@ -238,7 +237,7 @@ def update_connected_endpoints(instance, created, raw=False, **kwargs):
         # may change in the future.) However, we do need to capture status changes and update
         # any CablePaths accordingly.
         if instance.status != Cable.STATUS_CONNECTED:
-            CablePath.objects.filter(path__contains=instance).update(is_active=False)
+            CablePath.objects.traversing(instance).update(is_active=False)
         else:
             rebuild_paths(instance)
 
@@ -263,18 +262,8 @@ def nullify_connected_endpoints(instance, **kwargs):
         instance.termination_b.save()
 
     # Delete and retrace any dependent cable paths
-    for cablepath in CablePath.objects.filter(path__contains=instance):
-        cp = CablePath.from_origin(cablepath.origin)
-        if cp:
-            CablePath.objects.filter(pk=cablepath.pk).update(
-                path=cp.path,
-                destination_type=ContentType.objects.get_for_model(cp.destination) if cp.destination else None,
-                destination_id=cp.destination.pk if cp.destination else None,
-                is_active=cp.is_active,
-                is_split=cp.is_split,
-            )
-        else:
-            cablepath.delete()
+    origins = CablePath.objects.traversing(instance).values_list("origin_type", "origin_id")
+    CablePathTracer(preload=False).rebuild_paths(origins)
 
 
 #
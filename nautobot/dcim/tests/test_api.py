@@ -5,6 +5,7 @@ from unittest import skip
 from constance.test import override_config
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
@@ -71,6 +72,7 @@ from nautobot.dcim.models import (
     VirtualChassis,
     VirtualDeviceContext,
 )
+from nautobot.extras.config_contexts import get_rendered_config_context_cache_key
 from nautobot.extras.models import ConfigContextSchema, ExternalIntegration, Role, SecretsGroup, Status
 from nautobot.ipam.models import IPAddress, Namespace, Prefix, VLAN, VLANGroup
 from nautobot.tenancy.models import Tenant
@@ -1618,6 +1620,30 @@ class DeviceTest(APIViewTestCases.APIViewTestCase):
         self.assertIn("config_context", response.data["results"][0])
         self.assertEqual(response.data["results"][0]["config_context"], {"A": 1})
 
+    @override_settings(CONFIG_CONTEXT_CACHE_ENABLED=True)
+    def test_config_context_included_from_cache(self):
+        """
+        Check that config context data can be read from the cache by passing ?config_context_cache=true.
+        """
+        self.add_permissions("dcim.view_device")
+        url = reverse("dcim-api:device-list") + "?include=config_context&config_context_cache=true"
+        response = self.client.get(url, **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["config_context"], {"A": 1})
+        device = Device.objects.get(pk=response.data["results"][0]["id"])
+        cache_key = get_rendered_config_context_cache_key(Device, device.pk)
+        self.assertEqual(cache.get(cache_key), {"A": 1})
+
+        # The stored data, rather than a freshly rendered config context, should be returned
+        cache.set(cache_key, {"Z": 26}, timeout=None)
+        url = reverse("dcim-api:device-detail", kwargs={"pk": device.pk})
+        response = self.client.get(url + "?include=config_context&config_context_cache=true", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data["config_context"], {"Z": 26})
+        response = self.client.get(url + "?include=config_context", **self.header)
+        self.assertEqual(response.data["config_context"], {"A": 1})
+
     def test_unique_name_per_location_constraint(self):
         """
         Check that creating a device with a duplicate name within a location fails.
@@ -3,6 +3,7 @@ from django.core.exceptions import ValidationError
 from django.test import TestCase
 
 from nautobot.circuits.models import Circuit, CircuitTermination, CircuitType, Provider
+from nautobot.dcim.cable_paths import CablePathTracer
 from nautobot.dcim.models import (
     Cable,
     CablePath,
@@ -33,6 +34,7 @@ class CablePathTestCase(TestCase):
         1XX: Test direct connections between different endpoint types
         2XX: Test different cable topologies
         3XX: Test responses to changes in existing objects
+        4XX: Test bulk tracing of paths
     """
 
     @classmethod
@@ -139,7 +141,9 @@ class CablePathTestCase(TestCase):
         """
         for part, count in path_parts.items():
             self.assertEqual(CablePath.objects.filter(path__contains=part).count(), count)
+            self.assertEqual(CablePath.objects.traversing(part).count(), count)
         self.assertEqual(CablePath.objects.filter(path__contains=self.dneCable).count(), 0)
+        self.assertEqual(CablePath.objects.traversing(self.dneCable).count(), 0)
 
     def test_101_interface_to_interface(self):
         """
@@ -1494,3 +1498,116 @@ class CablePathTestCase(TestCase):
                 rearport1: 2,
             }
         )
+
+    def test_401_bulk_trace_matches_from_origin(self):
+        """
+        [IF1] --C1-- [FP1:1] [RP1] --C3-- [RP2] [FP2:1] --C4-- [IF3]
+        [IF2] --C2-- [FP1:2]                    [FP2:2] --C5-- [CT1A] [CT1Z] --C6-- [IF4]
+        [IF5] --C7-- [FP3:1] [RP3] --C8 (planned)-- [RP4]
+        """
+        interfaces = [
+            Interface.objects.create(device=self.device, name=f"Interface {i}", status=self.interface_status)
+            for i in range(1, 6)
+        ]
+        rearports = [
+            RearPort.objects.create(device=self.device, name=f"Rear Port {i}", positions=4) for i in range(1, 5)
+        ]
+        frontports = {
+            (rp, position): FrontPort.objects.create(
+                device=self.device,
+                name=f"Front Port {rp}:{position}",
+                rear_port=rearports[rp - 1],
+                rear_port_position=position,
+            )
+            for rp, position in [(1, 1), (1, 2), (2, 1), (2, 2), (3, 1)]
+        }
+        circuittermination1 = CircuitTermination.objects.create(
+            circuit=self.circuit, location=self.location, term_side="A"
+        )
+        circuittermination2 = CircuitTermination.objects.create(
+            circuit=self.circuit, location=self.location, term_side="Z"
+        )
+        for termination_a, termination_b, status in [
+            (interfaces[0], frontports[(1, 1)], self.status),
+            (interfaces[1], frontports[(1, 2)], self.status),
+            (rearports[0], rearports[1], self.status),
+            (frontports[(2, 1)], interfaces[2], self.status),
+            (frontports[(2, 2)], circuittermination1, self.status),
+            (circuittermination2, interfaces[3], self.status),
+            (interfaces[4], frontports[(3, 1)], self.status),
+            (rearports[2], rearports[3], self.status_planned),
+        ]:
+            Cable.objects.create(termination_a=termination_a, termination_b=termination_b, status=status)
+
+        fields = ["origin_type", "origin_id", "destination_type", "destination_id", "path", "is_active", "is_split"]
+        expected_paths = sorted(CablePath.objects.values_list(*fields), key=str)
+        self.assertEqual(len(expected_paths), 7)
+        CablePath.objects.all().delete()
+
+        tracer = CablePathTracer()
+        created_count = 0
+        for model in (CircuitTermination, Interface):
+            created_count += tracer.create_paths(model, model.objects.values_list("pk", flat=True), batch_size=2)
+        self.assertEqual(created_count, 7)
+        self.assertEqual(sorted(CablePath.objects.values_list(*fields), key=str), expected_paths)
+        for interface in Interface.objects.filter(device=self.device):
+            self.assertPathIsSet(interface, CablePath.objects.get(origin_id=interface.pk))
+
+    def test_402_lazy_tracer_rebuild_matches_from_origin(self):
+        """
+        [IF1] --C1-- [FP1:1] [RP1] --C3-- [RP2] [FP2:1] --C4-- [IF3]
+        [IF2] --C2-- [FP1:2]                    [FP2:2] --C5-- [IF4]
+        """
+        interfaces = [
+            Interface.objects.create(device=self.device, name=f"Interface {i}", status=self.interface_status)
+            for i in range(1, 5)
+        ]
+        rearports = [
+            RearPort.objects.create(device=self.device, name=f"Rear Port {i}", positions=2) for i in range(1, 3)
+        ]
+        frontports = {
+            (rp, position): FrontPort.objects.create(
+                device=self.device,
+                name=f"Front Port {rp}:{position}",
+                rear_port=rearports[rp - 1],
+                rear_port_position=position,
+            )
+            for rp in (1, 2)
+            for position in (1, 2)
+        }
+        for termination_a, termination_b in [
+            (interfaces[0], frontports[(1, 1)]),
+            (interfaces[1], frontports[(1, 2)]),
+            (frontports[(2, 1)], interfaces[2]),
+            (frontports[(2, 2)], interfaces[3]),
+        ]:
+            Cable.objects.create(termination_a=termination_a, termination_b=termination_b, status=self.status)
+        # Creating the trunk cable rebuilds all four (previously incomplete) paths through the rear ports
+        Cable.objects.create(termination_a=rearports[0], termination_b=rearports[1], status=self.status)
+
+        for interface in interfaces:
+            interface.refresh_from_db()
+            expected = CablePath.from_origin(interface)
+            cablepath = CablePath.objects.get(origin_id=interface.pk)
+            self.assertEqual(cablepath.path, expected.path)
+            self.assertEqual(cablepath.destination, expected.destination)
+            self.assertTrue(cablepath.is_active)
+            self.assertPathIsSet(interface, cablepath)
+            self.assertEqual(
+                sorted(f"{node.node_type_id}:{node.node_id}" for node in cablepath.nodes.all()),
+                sorted(cablepath.path),
+            )
+        self.assertEqual(CablePath.objects.traversing(rearports[0]).count(), 4)
+
+        # Tracing one path through the rear ports loads the topology shared by the others
+        interface_type_id = ContentType.objects.get_for_model(Interface).pk
+        tracer = CablePathTracer(preload=False)
+        tracer.trace((interface_type_id, interfaces[0].pk))
+        expected_paths = {interface.pk: interface._path.path for interface in interfaces[1:]}
+        with self.assertNumQueries(0):
+            for interface in interfaces[1:]:
+                self.assertEqual(tracer.trace((interface_type_id, interface.pk)).path, expected_paths[interface.pk])
+
+        origins = CablePath.objects.traversing(rearports[0]).values_list("origin_type", "origin_id")
+        self.assertEqual(tracer.rebuild_paths(origins), 4)
+        self.assertEqual(CablePath.objects.traversing(rearports[1]).count(), 4)
@@ -3692,7 +3692,7 @@ class PathTraceView(generic.ObjectView):
 
         # Otherwise, find all CablePaths which traverse the specified object
         else:
-            related_paths = CablePath.objects.filter(path__contains=instance).prefetch_related("origin")
+            related_paths = CablePath.objects.traversing(instance).prefetch_related("origin")
             # Check for specification of a particular path (when tracing pass-through ports)
 
             cablepath_id = request.GET.get("cablepath_id")
@@ -13,7 +13,7 @@ from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import MethodNotAllowed, PermissionDenied, ValidationError
 from rest_framework.parsers import JSONParser, MultiPartParser
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, SAFE_METHODS
 from rest_framework.response import Response
 
 from nautobot.core.api.authentication import TokenPermissions
@@ -32,6 +32,7 @@ from nautobot.core.exceptions import CeleryWorkerNotRunningException
 from nautobot.core.graphql import execute_saved_query
 from nautobot.core.models.querysets import count_related
 from nautobot.core.models.utils import serialize_object_v2
+from nautobot.core.settings_funcs import is_truthy
 from nautobot.extras import filters
 from nautobot.extras.choices import JobExecutionType, JobQueueTypeChoices
 from nautobot.extras.filters import RoleFilterSet
@@ -169,13 +170,18 @@ class ConfigContextQuerySetMixin:
         """
         Build the proper queryset based on the request context
 
-        If the `include` query param includes `config_context`, return the queryset annotated with config context.
+        If the `include` query param includes `config_context`, return a queryset that renders the config contexts of
+        the retrieved objects in bulk, reading them from the rendered config context cache if the `config_context_cache`
+        query param is truthy. For requests that modify data, return the queryset annotated with config context instead.
 
         Else, return the base queryset.
         """
         queryset = super().get_queryset()
         request = self.get_serializer_context()["request"]
         if request is not None and "config_context" in request.query_params.get("include", []):
+            if request.method in SAFE_METHODS:
+                use_cache = is_truthy(request.query_params.get("config_context_cache", "false"))
+                return queryset.prefetch_config_contexts(use_cache=use_cache)
             return queryset.annotate_config_context_data()
         return queryset
 
@@ -0,0 +1,389 @@
+"""
+Bulk rendering and storage of rendered (fully merged) config context data for Devices and Virtual Machines.
+
+`ConfigContextEvaluator` renders the config contexts of many objects at once, with a fixed number of queries
+regardless of the number of objects, rather than the per-object queries of `ConfigContextQuerySet.get_for_object()`
+or the deeply joined subquery of `ConfigContextModelQuerySet.annotate_config_context_data()`.
+
+When `settings.CONFIG_CONTEXT_CACHE_ENABLED` is True, the rendered config context of each object is additionally stored
+in the cache under a per-object key once it has been computed, and is discarded again whenever anything that could
+affect it changes. Reading the rendered config contexts of many objects then costs a single cache lookup.
+
+Each cache key includes the current "generation" of stored data, itself stored in the cache. Changes that could affect
+any number of objects switch to a new generation rather than deleting the stored data, so that data stored from a
+since-outdated database state can never be read again. Stored data expires after
+`settings.CONFIG_CONTEXT_CACHE_TIMEOUT` seconds in any case.
+"""
+
+import contextlib
+import copy
+import logging
+import uuid
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import transaction
+import redis.exceptions
+
+from nautobot.core.utils.data import deepmerge
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "nautobot.extras.config_contexts.rendered"
+GENERATION_CACHE_KEY = f"{CACHE_KEY_PREFIX}.generation"
+
+# For each single-valued ConfigContext assignment field, the lookup of the corresponding related object's ID on each
+# model that supports config contexts. A lookup of None means that objects of that model are never related to any
+# object in that field, so only ConfigContexts without assignments in that field apply to them.
+CONFIG_CONTEXT_ASSIGNMENT_LOOKUPS = {
+    "dcim.device": {
+        "locations": "location_id",
+        "roles": "role_id",
+        "device_types": "device_type_id",
+        "device_redundancy_groups": "device_redundancy_group_id",
+        "platforms": "platform_id",
+        "cluster_groups": "cluster__cluster_group_id",
+        "clusters": "cluster_id",
+        "tenant_groups": "tenant__tenant_group_id",
+        "tenants": "tenant_id",
+    },
+    "virtualization.virtualmachine": {
+        "locations": "cluster__location_id",
+        "roles": "role_id",
+        "device_types": None,
+        "device_redundancy_groups": None,
+        "platforms": "platform_id",
+        "cluster_groups": "cluster__cluster_group_id",
+        "clusters": "cluster_id",
+        "tenant_groups": "tenant__tenant_group_id",
+        "tenants": "tenant_id",
+    },
+}
+
+# Assignment fields whose related objects form a tree, such that a ConfigContext assigned to a given object also
+# applies to any object related to one of its descendants
+CONFIG_CONTEXT_TREE_ASSIGNMENT_FIELDS = ("locations", "tenant_groups")
+
+# For each model traversed by the lookups above, the fields whose change may change the ConfigContexts that apply to
+# any number of Devices and Virtual Machines
+CONFIG_CONTEXT_RELATED_MODEL_FIELDS = {
+    "dcim.location": ("parent_id",),
+    "tenancy.tenant": ("tenant_group_id",),
+    "tenancy.tenantgroup": ("parent_id",),
+    "virtualization.cluster": ("cluster_group_id", "location_id"),
+}
+
+
+class ConfigContextEvaluator:
+    """
+    Renders the config contexts of many Devices or Virtual Machines in bulk.
+
+    All active ConfigContexts are loaded once, in (weight, name) order, and their assignments are indexed as integer
+    bitmasks, where bit `i` represents the `i`-th ConfigContext. For each assignment field (locations, roles, tags,
+    etc.) an object matches the ConfigContexts assigned to any of its related objects in that field, plus all
+    ConfigContexts that have no assignments in that field; the ConfigContexts applicable to the object are the
+    intersection of these across all fields. Objects with the same applicable ConfigContexts share a single merge.
+
+    An evaluator reflects the ConfigContexts at the time it was created, so should not be kept for longer than a single
+    request or Job.
+
+    Example usage:
+
+    >>> evaluator = ConfigContextEvaluator(Device)
+    >>> rendered = evaluator.evaluate(Device.objects.filter(location=location).values_list("pk", flat=True))
+    """
+
+    def __init__(self, model):
+        from nautobot.extras.models import ConfigContext  # avoid circular import
+
+        self.model = model
+        contexts = ConfigContext.objects.filter(is_active=True).order_by("weight", "name").values_list("pk", "data")
+        contexts = list(contexts)
+        self.context_data = [data for _, data in contexts]
+        self.all_mask = (1 << len(contexts)) - 1
+        context_masks = {pk: 1 << i for i, (pk, _) in enumerate(contexts)}
+
+        field_names = [*CONFIG_CONTEXT_ASSIGNMENT_LOOKUPS[model._meta.label_lower], "tags"]
+        if settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED:
+            field_names.append("dynamic_groups")
+
+        # {field_name: (mask of ConfigContexts without assignments in that field, {related_pk: mask})}
+        self.assignments = {}
+        for field_name in field_names:
+            field = ConfigContext._meta.get_field(field_name)
+            assigned_masks = {}
+            assigned_mask = 0
+            through_rows = field.remote_field.through.objects.filter(
+                **{f"{field.m2m_field_name()}__is_active": True}
+            ).values_list(field.m2m_column_name(), field.m2m_reverse_name())
+            for context_pk, related_pk in through_rows:
+                assigned_masks[related_pk] = assigned_masks.get(related_pk, 0) | context_masks[context_pk]
+                assigned_mask |= context_masks[context_pk]
+            if assigned_mask:
+                # Fields without any assignments don't restrict the applicable ConfigContexts, so can be skipped
+                self.assignments[field_name] = (self.all_mask & ~assigned_mask, assigned_masks)
+
+        # {field_name: {related_pk: parent_pk}} for each tree field with assignments
+        self.parents = {}
+        for field_name in CONFIG_CONTEXT_TREE_ASSIGNMENT_FIELDS:
+            if field_name in self.assignments:
+                tree_model = ConfigContext._meta.get_field(field_name).related_model
+                self.parents[field_name] = dict(tree_model.objects.values_list("pk", "parent"))
+        # {field_name: {related_pk: mask including ancestors}}, filled in on demand
+        self._tree_masks = {field_name: {} for field_name in self.parents}
+        # {applicable ConfigContexts mask: merged data}, filled in on demand
+        self._merged_data = {}
+
+    def _get_tree_mask(self, field_name, pk):
+        """Return the mask of ConfigContexts assigned to the given tree node or any of its ancestors."""
+        tree_masks = self._tree_masks[field_name]
+        parents = self.parents[field_name]
+        assigned_masks = self.assignments[field_name][1]
+        # Walk up the tree to the nearest node whose mask is already known, then back down again
+        path = []
+        while pk is not None and pk not in tree_masks:
+            path.append(pk)
+            pk = parents.get(pk)
+        mask = tree_masks.get(pk, 0)
+        for node_pk in reversed(path):
+            mask |= assigned_masks.get(node_pk, 0)
+            tree_masks[node_pk] = mask
+        return mask
+
+    def _get_mask(self, field_name, related_pks):
+        """Return the mask of ConfigContexts that apply to an object related to the given objects in a given field."""
+        unassigned_mask, assigned_masks = self.assignments[field_name]
+        mask = unassigned_mask
+        for related_pk in related_pks:
+            if related_pk is None:
+                continue
+            if field_name in self.parents:
+                mask |= self._get_tree_mask(field_name, related_pk)
+            else:
+                mask |= assigned_masks.get(related_pk, 0)
+        return mask
+
+    def _get_merged_data(self, mask):
+        """Return the merged data of the ConfigContexts in the given mask, lowest weight first."""
+        if mask not in self._merged_data:
+            data = {}
+            for i, context_data in enumerate(self.context_data):
+                if mask >> i & 1:
+                    data = deepmerge(data, context_data)
+            self._merged_data[mask] = data
+        return self._merged_data[mask]
+
+    def _get_multi_valued_related_pks(self, pks):
+        """Return `{field_name: {pk: [related_pk, ...]}}` for the tags and dynamic groups of the given objects."""
+        from nautobot.extras.models import StaticGroupAssociation, TaggedItem  # avoid circular import
+
+        content_type = ContentType.objects.get_for_model(self.model)
+        querysets = {
+            "tags": TaggedItem.objects.filter(content_type=content_type, object_id__in=pks).values_list(
+                "object_id", "tag_id"
+            ),
+            "dynamic_groups": StaticGroupAssociation.all_objects.filter(
+                associated_object_type=content_type, associated_object_id__in=pks
+            ).values_list("associated_object_id", "dynamic_group_id"),
+        }
+        related_pks = {}
+        for field_name, queryset in querysets.items():
+            if field_name in self.assignments:
+                related_pks[field_name] = {}
+                for pk, related_pk in queryset:
+                    related_pks[field_name].setdefault(pk, []).append(related_pk)
+        return related_pks
+
+    def evaluate(self, pks, batch_size=1000):
+        """
+        Render the config contexts of the objects with the given primary keys.
+
+        Args:
+            pks (Iterable[uuid.UUID]): Primary keys of Devices or Virtual Machines of this evaluator's model.
+            batch_size (int): Maximum number of objects to retrieve with each query.
+
+        Returns:
+            (dict): `{pk: data}` for each of the given objects that exists. Each `data` is a distinct dict.
+        """
+        lookups = {}
+        # Fields in which objects of this model are never related to anything match only the unassigned ConfigContexts
+        base_mask = self.all_mask
+        for field_name, lookup in CONFIG_CONTEXT_ASSIGNMENT_LOOKUPS[self.model._meta.label_lower].items():
+            if field_name not in self.assignments:
+                continue
+            if lookup is None:
+                base_mask &= self._get_mask(field_name, [None])
+            else:
+                lookups[field_name] = lookup
+        pks = list(pks)
+        rendered = {}
+        for i in range(0, len(pks), batch_size):
+            batch = pks[i : i + batch_size]
+            multi_valued_related_pks = self._get_multi_valued_related_pks(batch)
+            rows = self.model.objects.filter(pk__in=batch).values_list(
+                "pk", "local_config_context_data", *lookups.values()
+            )
+            for pk, local_data, *related_pks in rows:
+                mask = base_mask
+                for field_name, related_pk in zip(lookups, related_pks):
+                    mask &= self._get_mask(field_name, [related_pk])
+                for field_name, related_pks_by_object in multi_valued_related_pks.items():
+                    mask &= self._get_mask(field_name, related_pks_by_object.get(pk, []))
+                data = copy.deepcopy(self._get_merged_data(mask))
+                if local_data:
+                    data = deepmerge(data, local_data)
+                rendered[pk] = data
+        return rendered
+
+
+def evaluate_config_contexts(objects):
+    """
+    Render the config context of each of the given objects in bulk, to be returned by its `get_config_context()`.
+
+    Objects that already have a rendered config context attached, such as by `prefetch_rendered_config_contexts()`,
+    are skipped.
+
+    Args:
+        objects (Iterable[ConfigContextModel]): Saved Devices and/or Virtual Machines.
+    """
+    objects_by_model = {}
+    for obj in objects:
+        if not hasattr(obj, "_rendered_config_context"):
+            objects_by_model.setdefault(type(obj), []).append(obj)
+    for model, model_objects in objects_by_model.items():
+        rendered = ConfigContextEvaluator(model).evaluate([obj.pk for obj in model_objects])
+        for obj in model_objects:
+            if obj.pk in rendered:
+                obj._rendered_config_context = rendered[obj.pk]
+
+
+def get_rendered_config_context_generation():
+    """Return the current generation of stored rendered config contexts, starting a new one if there is none."""
+    return cache.get_or_set(GENERATION_CACHE_KEY, lambda: uuid.uuid4().hex, timeout=None)
+
+
+def get_rendered_config_context_cache_key(model, pk, generation=None):
+    """Return the cache key under which the rendered config context of the given object is stored."""
+    if generation is None:
+        generation = get_rendered_config_context_generation()
+    return f"{CACHE_KEY_PREFIX}.{generation}.{model._meta.label_lower}.{pk}"
+
+
+def is_config_context_cache_enabled(model=None):
+    """Return True if the rendered config context store is enabled, optionally for the given model class."""
+    from nautobot.extras.models import ConfigContextModel  # avoid circular import
+
+    if not settings.CONFIG_CONTEXT_CACHE_ENABLED:
+        return False
+    return model is None or issubclass(model, ConfigContextModel)
+
+
+def _store_config_contexts(model, rendered, generation):
+    with contextlib.suppress(redis.exceptions.ConnectionError):
+        cache.set_many(
+            {get_rendered_config_context_cache_key(model, pk, generation): data for pk, data in rendered.items()},
+            timeout=settings.CONFIG_CONTEXT_CACHE_TIMEOUT,
+        )
+
+
+def get_rendered_config_contexts(model, pks):
+    """
+    Return the rendered config context data of each of the given objects, as a dict of `{pk: data}`.
+
+    Stored data is used where available; the config contexts of any other objects are rendered in bulk and stored.
+    Primary keys of objects that do not exist are omitted from the returned dict.
+
+    Args:
+        model (type[ConfigContextModel]): `Device` or `VirtualMachine`.
+        pks (Iterable[uuid.UUID]): Primary keys of the objects of interest.
+    """
+    pks = list(pks)
+    rendered = {}
+    # The generation must be retrieved before rendering, so that data rendered from the database state prior to a
+    # concurrent change is stored under the generation that the change discards
+    generation = None
+    with contextlib.suppress(redis.exceptions.ConnectionError):
+        generation = get_rendered_config_context_generation()
+        keys = {get_rendered_config_context_cache_key(model, pk, generation): pk for pk in pks}
+        rendered = {keys[key]: data for key, data in cache.get_many(keys).items()}
+    missing = [pk for pk in pks if pk not in rendered]
+    if missing:
+        newly_rendered = ConfigContextEvaluator(model).evaluate(missing)
+        if generation is not None:
+            _store_config_contexts(model, newly_rendered, generation)
+        rendered.update(newly_rendered)
+    return rendered
+
+
+def prefetch_rendered_config_contexts(objects):
+    """
+    Attach the stored rendered config context to each of the given objects, to be returned by `get_config_context()`.
+
+    Objects of the same model are looked up with a single cache query, and any that are not stored are rendered
+    in bulk. Objects that already have a rendered config context attached are skipped. Does nothing unless the
+    rendered config context store is enabled.
+
+    Args:
+        objects (Iterable[ConfigContextModel]): Saved Devices and/or Virtual Machines.
+    """
+    objects_by_model = {}
+    for obj in objects:
+        if not hasattr(obj, "_rendered_config_context"):
+            objects_by_model.setdefault(type(obj), []).append(obj)
+    for model, model_objects in objects_by_model.items():
+        if not is_config_context_cache_enabled(model):
+            continue
+        rendered = get_rendered_config_contexts(model, [obj.pk for obj in model_objects])
+        for obj in model_objects:
+            if obj.pk in rendered:
+                obj._rendered_config_context = rendered[obj.pk]
+
+
+def rebuild_rendered_config_contexts(queryset, batch_size=1000):
+    """
+    Render and store the config context of every object in the given queryset, replacing any stored data.
+
+    Args:
+        queryset (ConfigContextModelQuerySet): Devices or Virtual Machines to render config contexts for.
+        batch_size (int): Number of objects to render with each query.
+
+    Returns:
+        (int): The number of objects whose rendered config context was stored.
+    """
+    model = queryset.model
+    generation = get_rendered_config_context_generation()
+    evaluator = ConfigContextEvaluator(model)
+    pks = list(queryset.values_list("pk", flat=True))
+    for i in range(0, len(pks), batch_size):
+        _store_config_contexts(model, evaluator.evaluate(pks[i : i + batch_size], batch_size=batch_size), generation)
+    return len(pks)
+
+
+def invalidate_rendered_config_contexts(model=None, pks=None):
+    """
+    Discard stored rendered config context data, so that it is rendered afresh when next requested.
+
+    If called within a transaction, the data is discarded once the transaction is committed, as otherwise it could be
+    rendered and stored again from the database state prior to the commit in the meantime. Unless specific objects are
+    given, all stored data is discarded at once by starting a new generation, leaving the previous data to expire.
+
+    Args:
+        model (type[ConfigContextModel], optional): Only discard data for objects of this model.
+        pks (Iterable[uuid.UUID], optional): Only discard data for the objects of `model` with these primary keys.
+    """
+    if not is_config_context_cache_enabled(model):
+        return
+    if pks is not None:
+        pks = list(pks)
+
+    def discard():
+        with contextlib.suppress(redis.exceptions.ConnectionError):
+            if pks is None:
+                logger.debug("Discarding all stored rendered config contexts")
+                cache.set(GENERATION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+            else:
+                generation = get_rendered_config_context_generation()
+                cache.delete_many([get_rendered_config_context_cache_key(model, pk, generation) for pk in pks])
+
+    transaction.on_commit(discard)
@@ -1,17 +1,20 @@
 from contextlib import contextmanager
+from functools import partial
 import uuid
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 from django.db import transaction
 from django.test.client import RequestFactory
 
-from nautobot.core.events import publish_event
+from nautobot.core.events import batched_event_publishing, publish_event
 from nautobot.extras.choices import ObjectChangeEventContextChoices
 from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
-from nautobot.extras.models import ObjectChange
+from nautobot.extras.models import DynamicGroup, ObjectChange
 from nautobot.extras.signals import change_context_state, get_user_if_authenticated
-from nautobot.extras.webhooks import enqueue_webhooks
+from nautobot.extras.tasks import process_object_changes as process_object_changes_task
+from nautobot.extras.webhooks import enqueue_webhooks, WebhookBatcher
 
 
 class ChangeContext:
@@ -34,6 +37,7 @@ class ChangeContext:
     """
 
     defer_object_changes = False  # advanced usage, for creating object changes in bulk
+    bulk_deleting = False  # set by bulk_delete_with_bulk_change_logging(), which creates its own object changes
 
     def __init__(
         self,
@@ -108,7 +112,8 @@ class ChangeContext:
             create_object_changes = []
             for key in self._object_change_batch(batch_size):
                 for entry in self.deferred_object_changes[key]:
-                    objectchange = entry["instance"].to_objectchange(entry["action"])
+                    # Deleted objects are serialized before their deletion, as they can no longer be serialized now
+                    objectchange = entry.get("objectchange") or entry["instance"].to_objectchange(entry["action"])
                     if objectchange is not None:
                         objectchange.user = entry["user"]
                         objectchange.user_name = objectchange.user.username
@@ -182,6 +187,9 @@ def web_request_context(
     By default, when working with the Django ORM, neither change logging nor webhook processing occur
     unless manually invoked and this context manager handles those functions. A valid User object must be provided.
 
+    If `settings.CHANGELOG_ASYNC_PROCESSING_ENABLED` is True, job hooks, webhooks and events are instead processed by
+    a Celery task that is enqueued once the changes made inside this context manager are committed.
+
     Example usage:
 
     >>> from nautobot.extras.context_managers import web_request_context
@@ -199,8 +207,6 @@ def web_request_context(
         Valid choices are in `nautobot.extras.choices.ObjectChangeEventContextChoices`.
     :param request: Optional web request instance, one will be generated if not supplied
     """
-    from nautobot.extras.jobs import enqueue_job_hooks  # prevent circular import
-
     valid_contexts = {
         ObjectChangeEventContextChoices.CONTEXT_JOB: JobChangeContext,
         ObjectChangeEventContextChoices.CONTEXT_JOB_HOOK: JobHookChangeContext,
@@ -225,25 +231,66 @@ def web_request_context(
             change_context = change_context_state.get()
             pre_object_data, pre_object_data_v2 = change_context.pre_object_data, change_context.pre_object_data_v2
     finally:
-        jobs_reloaded = False
-        # In bulk operations, we are performing the same action (create/update/delete) on the same content-type.
-        # Save some repeated database queries by reusing the same evaluated querysets where applicable:
-        jobhook_queryset = None
-        webhook_queryset = None
-        last_action = None
-        last_content_type = None
-        # enqueue jobhooks and webhooks, use change_context.change_id in case change_id was not supplied
+        # use change_context.change_id in case change_id was not supplied
+        if settings.CHANGELOG_ASYNC_PROCESSING_ENABLED:
+            # Only enqueue a task if any changes were actually made
+            if ObjectChange.objects.filter(request_id=change_context.change_id).exists():
+                transaction.on_commit(
+                    partial(
+                        process_object_changes_task.delay,
+                        change_context.change_id,
+                        pre_object_data=pre_object_data,
+                        pre_object_data_v2=pre_object_data_v2,
+                    )
+                )
+        else:
+            process_object_changes(
+                change_context.change_id, pre_object_data=pre_object_data, pre_object_data_v2=pre_object_data_v2
+            )
+
+
+def process_object_changes(change_id, pre_object_data=None, pre_object_data_v2=None, batch_size=1000):
+    """
+    Enqueue the job hooks and webhooks, and publish the events, triggered by the ObjectChanges of the given `change_id`.
+
+    This is called at the end of `web_request_context()`, or by the `process_object_changes` Celery task after the
+    changes are committed if `settings.CHANGELOG_ASYNC_PROCESSING_ENABLED` is True.
+
+    :param change_id: The `request_id` of the ObjectChanges to process
+    :param pre_object_data: Optional dictionary of serialized object data, keyed by object ID, used in the snapshots
+    :param pre_object_data_v2: Optional dictionary of serialized object data, keyed by object ID, used in the snapshots
+    :param batch_size: Number of ObjectChanges to retrieve from the database at a time
+
+    If `settings.DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED` is True, the cached members of the dynamic groups of each
+    changed content type are also updated for the changed objects.
+    """
+    from nautobot.extras.jobs import enqueue_job_hooks  # prevent circular import
+
+    jobs_reloaded = False
+    # In bulk operations, we are performing the same action (create/update/delete) on the same content-type.
+    # Save some repeated database queries by reusing the same evaluated querysets where applicable:
+    jobhook_queryset = None
+    webhook_queryset = None
+    last_action = None
+    last_content_type = None
+    prior_changes = None
+    webhook_batcher = WebhookBatcher()
+    # {content_type: {changed_object_id, ...}}, for incremental dynamic group membership updates
+    changed_object_ids = {}
+    # enqueue jobhooks and webhooks, and publish events in batches
+    with batched_event_publishing():
         for oc in (
             ObjectChange.objects.select_related("changed_object_type", "user")
-            .filter(request_id=change_context.change_id)
+            .filter(request_id=change_id)
             .order_by("time")  # default ordering is -time but we want oldest first not newest first
-            .iterator()
+            .iterator(chunk_size=batch_size)
         ):
             if oc.action != last_action or oc.changed_object_type != last_content_type:
                 jobhook_queryset = None
                 webhook_queryset = None
 
-            if context != ObjectChangeEventContextChoices.CONTEXT_JOB_HOOK:
+            # Job hooks cannot trigger other job hooks
+            if oc.change_context != ObjectChangeEventContextChoices.CONTEXT_JOB_HOOK:
                 # Make sure JobHooks are up to date (only once) before calling them
                 did_reload_jobs, jobhook_queryset = enqueue_job_hooks(
                     oc, may_reload_jobs=(not jobs_reloaded), jobhook_queryset=jobhook_queryset
@@ -251,13 +298,17 @@ def web_request_context(
                 if did_reload_jobs:
                     jobs_reloaded = True
 
-            # TODO: get_snapshots() currently requires a DB query per object change processed.
-            # We need to develop a more efficient approach: https://github.com/nautobot/nautobot/issues/6303
+            if prior_changes is None:
+                # Look up the previous change of every changed object at once, rather than once per object change
+                prior_changes = ObjectChange.get_prior_changes(change_id)
             snapshots = oc.get_snapshots(
                 pre_object_data.get(str(oc.changed_object_id), None) if pre_object_data else None,
                 pre_object_data_v2.get(str(oc.changed_object_id), None) if pre_object_data_v2 else None,
+                prior_changes=prior_changes,
+            )
+            webhook_queryset = enqueue_webhooks(
+                oc, snapshots=snapshots, webhook_queryset=webhook_queryset, webhook_batcher=webhook_batcher
             )
-            webhook_queryset = enqueue_webhooks(oc, snapshots=snapshots, webhook_queryset=webhook_queryset)
 
             # topic examples: "nautobot.change.dcim.device", "nautobot.add.ipam.ipaddress"
             event_topic = f"nautobot.{oc.action}.{oc.changed_object_type.app_label}.{oc.changed_object_type.model}"
@@ -273,6 +324,15 @@ def web_request_context(
 
             last_action = oc.action
             last_content_type = oc.changed_object_type
+            if settings.DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED:
+                changed_object_ids.setdefault(oc.changed_object_type, set()).add(oc.changed_object_id)
+
+    webhook_batcher.flush()
+
+    for content_type, object_ids in changed_object_ids.items():
+        model = content_type.model_class()
+        if model is not None and getattr(model, "is_dynamic_group_associable_model", False):
+            DynamicGroup.objects.update_cached_members_for_objects(model, object_ids)
 
 
 @contextmanager
@@ -286,6 +346,12 @@ def deferred_change_logging_for_bulk_operation():
     if change_context is None:
         raise ValueError("Change logging must be enabled before using deferred_change_logging_for_bulk_operation")
 
+    if change_context.defer_object_changes:
+        # Already deferred by an enclosing context manager, which will create the ObjectChanges
+        with transaction.atomic():
+            yield
+        return
+
     with transaction.atomic():
         try:
             change_context.defer_object_changes = True
@@ -2380,6 +2380,7 @@ class WebhookForm(BootstrapMixin, forms.ModelForm):
             "http_content_type",
             "additional_headers",
             "body_template",
+            "batch_size",
             "secret",
             "ssl_verification",
             "ca_file_path",
@@ -1,6 +1,7 @@
 """Jobs functionality - consolidates and replaces legacy "custom scripts" and "reports" features."""
 
 from collections import OrderedDict
+import contextlib
 import functools
 import inspect
 import json
@@ -21,7 +22,7 @@ from django.apps import apps
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.core.files.uploadedfile import UploadedFile
 from django.core.validators import RegexValidator
 from django.db.models import Model
@@ -47,7 +48,7 @@ from nautobot.extras.choices import (
     ObjectChangeActionChoices,
     ObjectChangeEventContextChoices,
 )
-from nautobot.extras.context_managers import web_request_context
+from nautobot.extras.context_managers import deferred_change_logging_for_bulk_operation, web_request_context
 from nautobot.extras.forms import JobForm
 from nautobot.extras.models import (
     FileProxy,
@@ -59,6 +60,7 @@ from nautobot.extras.models import (
 )
 from nautobot.extras.registry import registry
 from nautobot.extras.utils import change_logged_models_queryset
+from nautobot.ipam.context_managers import cached_closest_parents
 from nautobot.ipam.formfields import IPAddressFormField, IPNetworkFormField
 from nautobot.ipam.validators import (
     MaxPrefixLengthValidator,
@@ -118,6 +120,7 @@ class BaseJob:
         - template_name (str)
         - time_limit (int)
         - is_singleton (bool)
+        - defer_change_logging (bool)
         """
 
     def __init__(self):
@@ -140,7 +143,16 @@ class BaseJob:
         else:
             change_context = ObjectChangeEventContextChoices.CONTEXT_JOB
 
-        with web_request_context(user=self.user, context_detail=self.class_path, context=change_context):
+        if self.defer_change_logging:
+            change_logging_context = deferred_change_logging_for_bulk_operation
+        else:
+            change_logging_context = contextlib.nullcontext
+
+        with (
+            web_request_context(user=self.user, context_detail=self.class_path, context=change_context),
+            cached_closest_parents(),
+            change_logging_context(),
+        ):
             if self.celery_kwargs.get("nautobot_job_profile", False) is True:
                 import cProfile
 
@@ -353,6 +365,11 @@ class BaseJob:
     def read_only(cls) -> bool:  # pylint: disable=no-self-argument
         return cls._get_meta_attr_and_assert_type("read_only", False, expected_type=bool)
 
+    @final
+    @classproperty
+    def defer_change_logging(cls) -> bool:  # pylint: disable=no-self-argument
+        return cls._get_meta_attr_and_assert_type("defer_change_logging", False, expected_type=bool)
+
     @final
     @classproperty
     def approval_required(cls) -> bool:  # pylint: disable=no-self-argument
@@ -743,7 +760,8 @@ class BaseJob:
 
         Args:
             filename (str): Name of the file to create, including extension
-            content (str, bytes): Content to populate the created file with.
+            content (str, bytes, file): Content to populate the created file with, or a binary file object
+                (such as a `tempfile.TemporaryFile()`) to copy the content of, from its beginning.
 
         Raises:
             (ValueError): if the provided content exceeds JOB_CREATE_FILE_MAX_SIZE in length
@@ -753,13 +771,17 @@ class BaseJob:
         """
         if isinstance(content, str):
             content = content.encode("utf-8")
+        if isinstance(content, bytes):
+            actual_size = len(content)
+            file = ContentFile(content, name=filename)
+        else:
+            actual_size = content.seek(0, os.SEEK_END)
+            content.seek(0)
+            file = File(content, name=filename)
         max_size = get_settings_or_config("JOB_CREATE_FILE_MAX_SIZE", fallback=10 << 20)
-        actual_size = len(content)
         if actual_size > max_size:
             raise ValueError(f"Provided {actual_size} bytes of content, but JOB_CREATE_FILE_MAX_SIZE is {max_size}")
-        fp = FileProxy.objects.create(
-            name=filename, job_result=self.job_result, file=ContentFile(content, name=filename)
-        )
+        fp = FileProxy.objects.create(name=filename, job_result=self.job_result, file=file)
         self.logger.info("Created file [%s](%s)", filename, fp.file.url)
         return fp
 
@@ -0,0 +1,65 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from nautobot.extras.choices import ObjectChangeActionChoices
+from nautobot.extras.models import Webhook
+from nautobot.extras.tasks import _check_webhook_response, get_webhook_context, send_webhook_request
+
+
+class Command(BaseCommand):
+    help = """Measure the throughput of webhook delivery to a receiver.
+
+    The requested number of synthetic change events are sent to the given URL in the same way as by the
+    `process_webhook` and `process_webhook_batch` tasks, using a single worker. No database objects are created.
+    Typically used together with `nautobot-server webhook_receiver --no-headers`."""
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="http://localhost:9000/", help="URL of the webhook receiver.")
+        parser.add_argument("--events", type=int, default=1000, help="Total number of change events to send.")
+        parser.add_argument(
+            "--batch-size", type=int, default=1, help="Maximum number of change events to send in each request."
+        )
+
+    def handle(self, *args, **options):
+        if options["events"] < 1 or options["batch_size"] < 1:
+            raise CommandError("--events and --batch-size must be positive integers.")
+
+        webhook = Webhook(name="Webhook benchmark", payload_url=options["url"], batch_size=options["batch_size"])
+        changes = [
+            {
+                "data": {"id": str(uuid.uuid4()), "name": f"Benchmark object {i}"},
+                "model_name": "benchmark",
+                "event": ObjectChangeActionChoices.ACTION_UPDATE,
+                "timestamp": str(timezone.now()),
+                "username": "benchmark",
+                "request_id": str(uuid.uuid4()),
+                "snapshots": None,
+            }
+            for i in range(options["events"])
+        ]
+        self.stdout.write(
+            f"Sending {options['events']} change event(s) to {webhook.payload_url} "
+            f"in batches of up to {webhook.batch_size}..."
+        )
+
+        requests_sent = 0
+        start = time.monotonic()
+        for i in range(0, len(changes), webhook.batch_size):
+            batch = changes[i : i + webhook.batch_size]
+            if webhook.batch_size > 1:
+                context = {"events": [get_webhook_context(**change) for change in batch]}
+            else:
+                context = get_webhook_context(**batch[0])
+            _check_webhook_response(send_webhook_request(webhook, context))
+            requests_sent += 1
+        elapsed = time.monotonic() - start
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Sent {options['events']} change event(s) in {requests_sent} request(s) in {elapsed:.2f} seconds: "
+                f"{requests_sent / elapsed:.1f} requests/second, {options['events'] / elapsed:.1f} events/second"
+            )
+        )
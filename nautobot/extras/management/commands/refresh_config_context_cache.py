@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from nautobot.dcim.models import Device
+from nautobot.extras.config_contexts import invalidate_rendered_config_contexts, rebuild_rendered_config_contexts
+from nautobot.virtualization.models import VirtualMachine
+
+
+class Command(BaseCommand):
+    help = "Render and store the config context of every Device and Virtual Machine."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of objects to render config contexts for with each query (default: 1000)",
+        )
+
+    def handle(self, *args, **kwargs):
+        """Discard any stored rendered config contexts, then render and store them afresh."""
+
+        if not settings.CONFIG_CONTEXT_CACHE_ENABLED:
+            self.stdout.write(self.style.NOTICE("CONFIG_CONTEXT_CACHE_ENABLED is False; skipping cache refresh"))
+            return
+
+        self.stdout.write(self.style.NOTICE("Refreshing rendered config context cache..."))
+
+        invalidate_rendered_config_contexts()
+        for model in (Device, VirtualMachine):
+            count = rebuild_rendered_config_contexts(model.objects.all(), batch_size=kwargs["batch_size"])
+            self.stdout.write(f"Stored the rendered config contexts of {count} {model._meta.verbose_name_plural}")
@@ -6,6 +6,14 @@ from nautobot.extras.models import DynamicGroup
 class Command(BaseCommand):
     help = "Update the member caches for all DynamicGroups."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Maximum number of independent groups to refresh in parallel (default: 1)",
+        )
+
     def handle(self, *args, **kwargs):
         """Run through all Dynamic Groups and ensure their member caches are up to date."""
 
@@ -13,5 +21,5 @@ class Command(BaseCommand):
 
         dynamic_groups = DynamicGroup.objects.all()
 
-        for dynamic_group in dynamic_groups:
-            dynamic_group.update_cached_members()
+        for dynamic_group, elapsed in dynamic_groups.refresh_cached_members(max_workers=kwargs["workers"]):
+            self.stdout.write(f"Refreshed {dynamic_group} in {elapsed:.2f} seconds")
@@ -7,6 +7,8 @@ request_counter = 1
 
 
 class WebhookHandler(BaseHTTPRequestHandler):
+    # Support keep-alive connections, as used by Nautobot when sending webhooks
+    protocol_version = "HTTP/1.1"
     show_headers = True
 
     def __getattr__(self, item):
@@ -25,9 +27,11 @@ class WebhookHandler(BaseHTTPRequestHandler):
         global request_counter
 
         # Send a 200 response regardless of the request content
+        response_body = b"Webhook received!\n"
         self.send_response(200)
+        self.send_header("Content-Length", str(len(response_body)))
         self.end_headers()
-        self.wfile.write(b"Webhook received!\n")
+        self.wfile.write(response_body)
 
         request_counter += 1
 
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.23 on 2026-10-18 12:00
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0124_add_joblogentry_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="webhook",
+            name="batch_size",
+            field=models.PositiveIntegerField(
+                default=1,
+                help_text="Maximum number of changes to send in a single request. If greater than 1, the changes made by a single web request or Job are sent together, in requests of up to this many changes, with the context of each change available as a list of <code>events</code>.",
+                validators=[django.core.validators.MinValueValidator(1)],
+            ),
+        ),
+    ]
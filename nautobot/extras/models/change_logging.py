@@ -2,7 +2,7 @@ from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db import models
+from django.db import connections, models, router
 from django.urls import NoReverseMatch, reverse
 
 from nautobot.core.celery import NautobotKombuJSONEncoder
@@ -193,11 +193,53 @@ class ObjectChange(BaseModel):
             return related_changes.restrict(user, permission)
         return related_changes
 
-    def get_snapshots(self, pre_object_data=None, pre_object_data_v2=None):
+    @classmethod
+    def get_prior_changes(cls, request_id):
+        """
+        Return the previous change (if any) of the changed object of each ObjectChange with the given `request_id`.
+
+        This is the bulk equivalent of calling `get_prev_change()` on each ObjectChange of a request, using a single
+        query with a window function over the changes of every object that was changed by the request. Only the
+        `object_data` and `object_data_v2` fields of the previous changes are loaded.
+
+        Returns:
+            (dict): `{object_change_pk: previous ObjectChange}`, omitting ObjectChanges that have no previous change.
+        """
+        using = router.db_for_read(cls)
+        connection = connections[using]
+        table = connection.ops.quote_name(cls._meta.db_table)
+        request_id = cls._meta.get_field("request_id").get_db_prep_value(request_id, connection)
+        # Only the quoted table name is interpolated; the request ID is passed as a parameter
+        sql = f"""
+            SELECT prior.id, prior.object_data, prior.object_data_v2, changes.id AS next_change_id
+            FROM (
+                SELECT oc.id, oc.request_id, LAG(oc.id) OVER (
+                    PARTITION BY oc.changed_object_type_id, oc.changed_object_id ORDER BY oc.time
+                ) AS prior_id
+                FROM {table} oc
+                JOIN (
+                    SELECT DISTINCT changed_object_type_id, changed_object_id FROM {table} WHERE request_id = %s
+                ) changed_objects
+                ON oc.changed_object_type_id = changed_objects.changed_object_type_id
+                AND oc.changed_object_id = changed_objects.changed_object_id
+            ) changes
+            JOIN {table} prior ON prior.id = changes.prior_id
+            WHERE changes.request_id = %s
+        """  # noqa: S608
+        pk_field = cls._meta.pk
+        return {
+            pk_field.to_python(prior_change.next_change_id): prior_change
+            for prior_change in cls.objects.using(using).raw(sql, [request_id, request_id])
+        }
+
+    def get_snapshots(self, pre_object_data=None, pre_object_data_v2=None, prior_changes=None):
         """
         Return a dictionary with the changed object's serialized data before and after this change
         occurred and a key with a shallow diff of those dictionaries.
 
+        If `prior_changes` (as returned by `ObjectChange.get_prior_changes()`) is provided, the previous change is
+        looked up there rather than queried from the database.
+
         Returns:
         {
             "prechange": dict(),
@@ -214,7 +256,10 @@ class ObjectChange(BaseModel):
 
         # Populate the prechange field, create actions do not need to have a prechange field
         if self.action != ObjectChangeActionChoices.ACTION_CREATE:
-            prior_change = self.get_prev_change(only=["object_data_v2", "object_data"])
+            if prior_changes is not None:
+                prior_change = prior_changes.get(self.pk)
+            else:
+                prior_change = self.get_prev_change(only=["object_data_v2", "object_data"])
             # Deal with the cases where we are trying to capture an object deletion/update and there is no prior change record.
             # This can happen when the object is first created and the changelog for that object creation action is deleted.
             if prior_change is not None:
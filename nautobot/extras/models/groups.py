@@ -4,6 +4,7 @@ import logging
 from typing import Optional
 
 from django import forms
+from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
@@ -24,8 +25,14 @@ from nautobot.core.utils.data import is_uuid
 from nautobot.core.utils.deprecation import method_deprecated, method_deprecated_in_favor_of
 from nautobot.core.utils.lookup import get_filterset_for_model, get_form_for_model
 from nautobot.extras.choices import DynamicGroupOperatorChoices, DynamicGroupTypeChoices
+from nautobot.extras.config_contexts import invalidate_rendered_config_contexts
 from nautobot.extras.querysets import DynamicGroupMembershipQuerySet, DynamicGroupQuerySet
-from nautobot.extras.utils import extras_features, FeatureQuery
+from nautobot.extras.utils import (
+    bulk_create_with_bulk_change_logging,
+    bulk_delete_with_bulk_change_logging,
+    extras_features,
+    FeatureQuery,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -317,24 +324,30 @@ class DynamicGroup(PrimaryModel):
             )
         return self._set_members(value)
 
+    def _get_pks(self, objects):
+        """Check that the given list or QuerySet contains only objects of this group's model and return their PKs."""
+        if isinstance(objects, models.QuerySet):
+            if objects.model != self.model:
+                raise TypeError(f"QuerySet does not contain {self.model._meta.label_lower} objects")
+            return set(objects.values_list("pk", flat=True))
+        for obj in objects:
+            if not isinstance(obj, self.model):
+                raise TypeError(f"{obj} is not a {self.model._meta.label_lower}")
+        return {obj.pk for obj in objects}
+
+    def _get_member_pks(self):
+        """Return the set of PKs of the (cached) member objects of this group."""
+        return set(
+            # pylint: disable=no-member  # false positive about self.static_group_associations
+            self.static_group_associations(manager="all_objects").values_list("associated_object_id", flat=True)
+        )
+
     def _set_members(self, value):
         """Internal API for updating the static/cached members of this group."""
-        if isinstance(value, models.QuerySet):
-            if value.model != self.model:
-                raise TypeError(f"QuerySet does not contain {self.model._meta.label_lower} objects")
-            to_remove = self.members.only("id").difference(value.only("id"))
-            self._remove_members(to_remove)
-            to_add = value.only("id").difference(self.members.only("id"))
-            self._add_members(to_add)
-        else:
-            for obj in value:
-                if not isinstance(obj, self.model):
-                    raise TypeError(f"{obj} is not a {self.model._meta.label_lower}")
-            existing_members = self.members
-            to_remove = [obj for obj in existing_members if obj not in value]
-            self._remove_members(to_remove)
-            to_add = [obj for obj in value if obj not in existing_members]
-            self._add_members(to_add)
+        pks = self._get_pks(value)
+        existing_pks = self._get_member_pks()
+        self._remove_member_pks(existing_pks - pks)
+        self._add_member_pks(pks - existing_pks)
 
         return self.members
 
@@ -344,17 +357,7 @@ class DynamicGroup(PrimaryModel):
         """Add the given list or QuerySet of objects to this staticly defined group."""
         if self.group_type != DynamicGroupTypeChoices.TYPE_STATIC:
             raise ValidationError(f"Group {self} is not staticly defined, adding members directly is not permitted.")
-        if isinstance(objects_to_add, models.QuerySet):
-            if objects_to_add.model != self.model:
-                raise TypeError(f"QuerySet does not contain {self.model._meta.label_lower} objects")
-            objects_to_add = objects_to_add.only("id").difference(self.members.only("id"))
-        else:
-            for obj in objects_to_add:
-                if not isinstance(obj, self.model):
-                    raise TypeError(f"{obj} is not a {self.model._meta.label_lower}")
-            existing_members = self.members
-            objects_to_add = [obj for obj in objects_to_add if obj not in existing_members]
-        return self._add_members(objects_to_add)
+        return self._add_member_pks(self._get_pks(objects_to_add) - self._get_member_pks())
 
     add_members.alters_data = True
 
@@ -364,43 +367,60 @@ class DynamicGroup(PrimaryModel):
 
         Assumes that objects_to_add has already been filtered to exclude any existing member objects.
         """
+        if isinstance(objects_to_add, models.QuerySet):
+            return self._add_member_pks(objects_to_add.values_list("pk", flat=True))
+        return self._add_member_pks([obj.pk for obj in objects_to_add])
+
+    _add_members.alters_data = True
+
+    def _add_member_pks(self, pks_to_add, batch_size=1000):
+        """
+        Internal API for adding the objects with the given PKs to the cached/static members of this group.
+
+        Assumes that pks_to_add has already been filtered to exclude any existing member objects.
+        """
+        content_type = self.content_type
+        pks_to_add = list(pks_to_add)
+        sgas = [
+            StaticGroupAssociation(dynamic_group=self, associated_object_type=content_type, associated_object_id=pk)
+            for pk in pks_to_add
+        ]
         if self.group_type == DynamicGroupTypeChoices.TYPE_STATIC:
-            for obj in objects_to_add:
-                # We don't use `.bulk_create()` currently because we want change logging for these creates.
-                # Might be a good future performance improvement though.
-                StaticGroupAssociation.all_objects.create(
-                    dynamic_group=self, associated_object_type=self.content_type, associated_object_id=obj.pk
-                )
+            # Change logged, but in bulk rather than one object at a time
+            bulk_create_with_bulk_change_logging(StaticGroupAssociation, sgas, batch_size=batch_size)
         else:
             # Cached/hidden static group associations, so we can use bulk-create to bypass change logging.
-            sgas = [
-                StaticGroupAssociation(
-                    dynamic_group=self, associated_object_type=self.content_type, associated_object_id=obj.pk
-                )
-                for obj in objects_to_add
-            ]
-            StaticGroupAssociation.all_objects.bulk_create(sgas, batch_size=1000)
+            StaticGroupAssociation.all_objects.bulk_create(sgas, batch_size=batch_size)
+        self._invalidate_rendered_config_contexts(pks_to_add)
 
-    _add_members.alters_data = True
+    _add_member_pks.alters_data = True
 
     def remove_members(self, objects_to_remove):
         """Remove the given list or QuerySet of objects from this staticly defined group."""
         if self.group_type != DynamicGroupTypeChoices.TYPE_STATIC:
             raise ValidationError(f"Group {self} is not staticly defined, removing members directly is not permitted.")
-        if isinstance(objects_to_remove, models.QuerySet):
-            if objects_to_remove.model != self.model:
-                raise TypeError(f"QuerySet does not contain {self.model._meta.label_lower} objects")
-        else:
-            for obj in objects_to_remove:
-                if not isinstance(obj, self.model):
-                    raise TypeError(f"{obj} is not a {self.model._meta.label_lower}")
-        return self._remove_members(objects_to_remove)
+        return self._remove_member_pks(self._get_pks(objects_to_remove))
 
     remove_members.alters_data = True
 
     def _remove_members(self, objects_to_remove):
         """Internal API for removing the given list or QuerySet from the cached/static members of this Group."""
-        from nautobot.extras.signals import _handle_deleted_object  # avoid circular import
+        if isinstance(objects_to_remove, models.QuerySet):
+            return self._remove_member_pks(objects_to_remove.values_list("pk", flat=True))
+        return self._remove_member_pks([obj.pk for obj in objects_to_remove])
+
+    _remove_members.alters_data = True
+
+    def _remove_member_pks(self, pks_to_remove, batch_size=1000):
+        """Internal API for removing the objects with the given PKs from the cached/static members of this Group."""
+        from nautobot.extras.signals import _handle_deleted_object, change_context_state  # avoid circular import
+
+        if isinstance(pks_to_remove, models.QuerySet):
+            # Let the database evaluate the subquery rather than retrieving all of the PKs
+            batches = [pks_to_remove]
+        else:
+            pks_to_remove = list(pks_to_remove)
+            batches = [pks_to_remove[i : i + batch_size] for i in range(0, len(pks_to_remove), batch_size)]
 
         # For non-static groups, we aren't going to change log the StaticGroupAssociation deletes anyway,
         # so save some performance on signals -- important especially when we're dealing with thousands of records
@@ -408,25 +428,29 @@ class DynamicGroup(PrimaryModel):
             logger.debug("Temporarily disconnecting the _handle_deleted_object signal for performance")
             pre_delete.disconnect(_handle_deleted_object)
         try:
-            if isinstance(objects_to_remove, models.QuerySet):
-                StaticGroupAssociation.all_objects.filter(
-                    dynamic_group=self,
-                    associated_object_type=self.content_type,
-                    associated_object_id__in=objects_to_remove.values_list("id", flat=True),
-                ).delete()
-            else:
-                pks_to_remove = [obj.id for obj in objects_to_remove]
-                StaticGroupAssociation.all_objects.filter(
+            for batch in batches:
+                sgas = StaticGroupAssociation.all_objects.filter(
                     dynamic_group=self,
                     associated_object_type=self.content_type,
-                    associated_object_id__in=pks_to_remove,
-                ).delete()
+                    associated_object_id__in=batch,
+                )
+                if self.group_type == DynamicGroupTypeChoices.TYPE_STATIC and change_context_state.get() is not None:
+                    # Change logged, but in bulk rather than one object at a time
+                    bulk_delete_with_bulk_change_logging(sgas.select_related("dynamic_group"), batch_size=batch_size)
+                else:
+                    sgas.delete()
         finally:
             if self.group_type != DynamicGroupTypeChoices.TYPE_STATIC:
                 logger.debug("Re-connecting the _handle_deleted_object signal")
                 pre_delete.connect(_handle_deleted_object)
+        self._invalidate_rendered_config_contexts(None if isinstance(pks_to_remove, models.QuerySet) else pks_to_remove)
 
-    _remove_members.alters_data = True
+    _remove_member_pks.alters_data = True
+
+    def _invalidate_rendered_config_contexts(self, pks):
+        """Discard the stored rendered config contexts of the given members (or all members, if `pks` is None)."""
+        if settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED and self.model is not None and (pks is None or pks):
+            invalidate_rendered_config_contexts(self.model, pks)
 
     @property
     @method_deprecated("Members are now cached in the database via StaticGroupAssociations rather than in Redis.")
@@ -808,6 +832,32 @@ class DynamicGroup(PrimaryModel):
         query = self.generate_query()
         return self.model.objects.filter(query)
 
+    def _generate_query_from_cached_children(self, child_pks):
+        """
+        Return a `Q` object like `generate_query()`, but using the cached members of the child groups in `child_pks`.
+
+        Rather than recursively re-evaluating the definitions of those child groups, their membership is looked up
+        from their StaticGroupAssociations, so this is only correct once their caches have been refreshed.
+
+        Args:
+            child_pks (Container[uuid.UUID]): PKs of child groups whose cached members are up to date.
+        """
+        if self.group_type != DynamicGroupTypeChoices.TYPE_DYNAMIC_SET:
+            return self.generate_query()
+
+        query = models.Q()
+        for membership in self.dynamic_group_memberships.select_related("group"):
+            group = membership.group
+            if group.pk in child_pks:
+                next_set = models.Q(
+                    pk__in=StaticGroupAssociation.all_objects.filter(dynamic_group=group).values("associated_object_id")
+                )
+            else:
+                next_set = group.generate_query()
+            query = self._perform_membership_set_operation(membership.operator, query, next_set)
+
+        return query
+
     # TODO: unused in core
     def add_child(self, child, operator, weight):
         """
@@ -203,6 +203,10 @@ class ConfigContextModel(models.Model, ConfigContextSchemaValidationMixin):
         """
         Return the rendered configuration context for a device or VM.
         """
+        if hasattr(self, "_rendered_config_context"):
+            # Previously rendered and attached by `nautobot.extras.config_contexts.prefetch_rendered_config_contexts()`
+            return self._rendered_config_context
+
         if not hasattr(self, "config_context_data"):
             # Annotation not available, so fall back to manually querying for the config context
             config_context_data = ConfigContext.objects.get_for_object(self).values_list("data", flat=True)
@@ -1005,6 +1009,13 @@ class Webhook(
         "Leave blank to use the system defaults.",
         default="",
     )
+    batch_size = models.PositiveIntegerField(
+        default=1,
+        validators=[MinValueValidator(1)],
+        help_text="Maximum number of changes to send in a single request. If greater than 1, the changes made by a "
+        "single web request or Job are sent together, in requests of up to this many changes, with the context of "
+        "each change available as a list of <code>events</code>.",
+    )
 
     class Meta:
         ordering = ("name",)
@@ -1,10 +1,22 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import time
+
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import F, Model, OuterRef, ProtectedError, Q, Subquery
+from django.db import connections
+from django.db.models import Exists, F, Model, OuterRef, ProtectedError, Q, Subquery
 from django.db.models.functions import JSONObject
+from django.db.models.query import ModelIterable
+from django.db.models.signals import pre_delete
 
 from nautobot.core.models.query_functions import EmptyGroupByJSONBAgg
 from nautobot.core.models.querysets import RestrictedQuerySet
+from nautobot.extras.choices import DynamicGroupTypeChoices
+from nautobot.extras.config_contexts import (
+    evaluate_config_contexts,
+    invalidate_rendered_config_contexts,
+    prefetch_rendered_config_contexts,
+)
 from nautobot.extras.models.tags import TaggedItem
 
 
@@ -77,8 +89,42 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
     multiple objects.
 
     This allows the annotation to be entirely optional.
+
+    Alternatively, `prefetch_config_contexts()` renders the config contexts of all retrieved objects in bulk with
+    `nautobot.extras.config_contexts.ConfigContextEvaluator`, once the queryset is evaluated.
     """
 
+    _config_context_prefetch = None
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._config_context_prefetch = self._config_context_prefetch
+        return clone
+
+    def _fetch_all(self):
+        fetched = self._result_cache is None
+        super()._fetch_all()
+        if fetched and self._config_context_prefetch is not None and self._iterable_class is ModelIterable:
+            if self._config_context_prefetch["use_cache"]:
+                prefetch_rendered_config_contexts(self._result_cache)
+            evaluate_config_contexts(self._result_cache)
+
+    def prefetch_config_contexts(self, use_cache=False):
+        """
+        Render the config contexts of the retrieved objects in bulk when this queryset is evaluated.
+
+        Each retrieved object's `get_config_context()` then returns its pre-rendered config context without any further
+        queries. Unlike `annotate_config_context_data()`, this accounts for dynamic group assignments when
+        `settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED` is True.
+
+        Args:
+            use_cache (bool): If True, and `settings.CONFIG_CONTEXT_CACHE_ENABLED` is True, read stored rendered config
+                contexts from the cache where available, and store those that are newly rendered.
+        """
+        clone = self._chain()
+        clone._config_context_prefetch = {"use_cache": use_cache}
+        return clone
+
     def annotate_config_context_data(self):
         """
         Attach the subquery annotation to the base queryset.
@@ -202,6 +248,182 @@ class DynamicGroupQuerySet(RestrictedQuerySet):
     def get_by_natural_key(self, slug):
         return self.get(slug=slug)
 
+    def update_cached_members_for_objects(self, model, pk_list):
+        """
+        Update the cached members of the filter-based and set-based groups in this queryset, for the given objects only.
+
+        Each given object is evaluated against the definition of every such group of its content type in a single
+        query, and the cached memberships of those objects are added or removed to match; objects that no longer
+        exist are removed from every group. This is far cheaper than `update_cached_members()` when only a few objects
+        have changed, but unlike that method it does not detect membership changes of *other* objects, such as those
+        caused by a change to a related object that a group's filter refers to.
+
+        Args:
+            model (type[Model]): The model class of the given objects.
+            pk_list (Iterable[uuid.UUID]): The primary keys of the objects to re-evaluate.
+
+        Returns:
+            (tuple[int, int]): The number of memberships added and removed.
+        """
+        from nautobot.extras.models import DynamicGroupMembership, StaticGroupAssociation  # avoid circular import
+        from nautobot.extras.signals import _handle_deleted_object  # avoid circular import
+
+        pk_list = set(pk_list)
+        model = model._meta.concrete_model
+        content_type = ContentType.objects.get_for_model(model)
+        groups = list(
+            self.filter(content_type=content_type)
+            .exclude(group_type=DynamicGroupTypeChoices.TYPE_STATIC)
+            .select_related("content_type")
+        )
+        if not groups or not pk_list:
+            return 0, 0
+
+        # Load the child groups of all set-based groups of this content type at once, rather than recursively per group
+        memberships_by_parent = {}
+        if any(group.group_type == DynamicGroupTypeChoices.TYPE_DYNAMIC_SET for group in groups):
+            memberships = DynamicGroupMembership.objects.filter(parent_group__content_type=content_type).select_related(
+                "group__content_type"
+            )
+            for membership in memberships:
+                memberships_by_parent.setdefault(membership.parent_group_id, []).append(membership)
+
+        queries = {}
+
+        def generate_query(group):
+            """Equivalent to `group.generate_query()`, but using the preloaded memberships."""
+            if group.pk not in queries:
+                if group.group_type == DynamicGroupTypeChoices.TYPE_DYNAMIC_SET:
+                    query = Q()
+                    for membership in memberships_by_parent.get(group.pk, []):
+                        next_set = generate_query(membership.group)
+                        query = group._perform_membership_set_operation(membership.operator, query, next_set)
+                    queries[group.pk] = query
+                else:
+                    queries[group.pk] = group.generate_query()
+            return queries[group.pk]
+
+        # Evaluate every group for every object at once, with an EXISTS subquery per group
+        annotations = {
+            f"is_member_{i}": Exists(model.objects.filter(generate_query(group), pk=OuterRef("pk")))
+            for i, group in enumerate(groups)
+        }
+        members = set()
+        queryset = model.objects.filter(pk__in=pk_list).annotate(**annotations).values_list("pk", *annotations)
+        for pk, *is_member in queryset:
+            members.update((group.pk, pk) for group, is_group_member in zip(groups, is_member) if is_group_member)
+        cached_members = set(
+            StaticGroupAssociation.all_objects.filter(
+                dynamic_group__in=groups, associated_object_id__in=pk_list
+            ).values_list("dynamic_group_id", "associated_object_id")
+        )
+
+        to_add = members - cached_members
+        StaticGroupAssociation.all_objects.bulk_create(
+            [
+                StaticGroupAssociation(
+                    dynamic_group_id=group_pk, associated_object_type=content_type, associated_object_id=pk
+                )
+                for group_pk, pk in to_add
+            ],
+            batch_size=1000,
+        )
+
+        to_remove = cached_members - members
+        if to_remove:
+            pks_to_remove_by_group = {}
+            for group_pk, pk in to_remove:
+                pks_to_remove_by_group.setdefault(group_pk, []).append(pk)
+            query = Q()
+            for group_pk, pks in pks_to_remove_by_group.items():
+                query |= Q(dynamic_group_id=group_pk, associated_object_id__in=pks)
+            # As in `DynamicGroup._remove_members()`, cached associations aren't change-logged, so skip the signal
+            pre_delete.disconnect(_handle_deleted_object)
+            try:
+                StaticGroupAssociation.all_objects.filter(query).delete()
+            finally:
+                pre_delete.connect(_handle_deleted_object)
+
+        if settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED and (to_add or to_remove):
+            invalidate_rendered_config_contexts(model, {pk for _, pk in to_add | to_remove})
+
+        return len(to_add), len(to_remove)
+
+    update_cached_members_for_objects.alters_data = True
+
+    def refresh_cached_members(self, max_workers=1):
+        """
+        Refresh the cached members of all filter-based and set-based groups in this queryset, children before parents.
+
+        Groups are refreshed in dependency order, so that once all of a set-based group's child groups in this queryset
+        have been refreshed, its own membership is computed from their freshly cached members rather than by
+        re-evaluating their definitions recursively. Groups that do not depend on one another may be refreshed in
+        parallel, in up to `max_workers` threads, each with its own database connection.
+
+        Args:
+            max_workers (int): Maximum number of groups to refresh concurrently.
+
+        Yields:
+            (tuple[DynamicGroup, float]): Each refreshed group and the time in seconds taken to refresh it, in the
+                order that they complete.
+        """
+        from nautobot.extras.models import DynamicGroupMembership  # avoid circular import
+
+        groups = {group.pk: group for group in self.exclude(group_type=DynamicGroupTypeChoices.TYPE_STATIC)}
+        # {parent_pk: {child_pk, ...}} of the child groups yet to be refreshed, and {child_pk: {parent_pk, ...}}
+        pending_children = {pk: set() for pk in groups}
+        parents = {pk: set() for pk in groups}
+        for parent_pk, child_pk in DynamicGroupMembership.objects.filter(
+            parent_group__in=groups.keys(), group__in=groups.keys()
+        ).values_list("parent_group_id", "group_id"):
+            pending_children[parent_pk].add(child_pk)
+            parents[child_pk].add(parent_pk)
+        refreshed_pks = set()
+
+        def refresh(group, child_pks, in_thread):
+            start = time.monotonic()
+            try:
+                query = group._generate_query_from_cached_children(child_pks)
+                group.update_cached_members(members=group.model.objects.filter(query))
+            finally:
+                if in_thread:
+                    # Each worker thread uses its own database connections, which are not closed automatically
+                    connections.close_all()
+            return group, time.monotonic() - start
+
+        def complete(group):
+            """Record the given group as refreshed and return the PKs of any parent groups that are now ready."""
+            refreshed_pks.add(group.pk)
+            ready_pks = []
+            for parent_pk in parents[group.pk]:
+                pending_children[parent_pk].discard(group.pk)
+                if not pending_children[parent_pk]:
+                    ready_pks.append(parent_pk)
+            return ready_pks
+
+        ready_pks = [pk for pk, children in pending_children.items() if not children]
+        if max_workers <= 1:
+            while ready_pks:
+                group, elapsed = refresh(groups[ready_pks.pop(0)], refreshed_pks, in_thread=False)
+                ready_pks.extend(complete(group))
+                yield group, elapsed
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            def submit(pk):
+                return executor.submit(refresh, groups[pk], frozenset(refreshed_pks), in_thread=True)
+
+            futures = {submit(pk) for pk in ready_pks}
+            while futures:
+                done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    group, elapsed = future.result()
+                    futures.update(submit(pk) for pk in complete(group))
+                    yield group, elapsed
+
+    refresh_cached_members.alters_data = True
+
 
 class DynamicGroupMembershipQuerySet(RestrictedQuerySet):
     """Queryset for `DynamicGroupMembership` objects."""
@@ -24,9 +24,12 @@ from nautobot.core.celery import app, import_jobs
 from nautobot.core.models import BaseModel
 from nautobot.core.utils.logging import sanitize
 from nautobot.extras.choices import JobResultStatusChoices, ObjectChangeActionChoices
+from nautobot.extras.config_contexts import CONFIG_CONTEXT_RELATED_MODEL_FIELDS, invalidate_rendered_config_contexts
 from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
 from nautobot.extras.models import (
     ComputedField,
+    ConfigContext,
+    ConfigContextModel,
     ContactAssociation,
     CustomField,
     CustomFieldChoice,
@@ -39,6 +42,7 @@ from nautobot.extras.models import (
     MetadataType,
     ObjectChange,
     Relationship,
+    TaggedItem,
 )
 from nautobot.extras.querysets import NotesQuerySet
 from nautobot.extras.tasks import delete_custom_field_data, provision_field
@@ -333,6 +337,15 @@ def _handle_deleted_object(sender, instance, **kwargs):
             cached_related_change = change_context.deferred_object_changes[unique_object_change_id][-1]
             if cached_related_change["action"] != ObjectChangeActionChoices.ACTION_CREATE:
                 cached_related_change["action"] = ObjectChangeActionChoices.ACTION_DELETE
+                if change_context.defer_object_changes and not change_context.bulk_deleting:
+                    # The object can no longer be serialized once it has been deleted
+                    cached_related_change.update(
+                        {
+                            "objectchange": instance.to_objectchange(ObjectChangeActionChoices.ACTION_DELETE),
+                            "changed_object_id": changed_object_id,
+                            "changed_object_type": changed_object_type,
+                        }
+                    )
                 save_new_objectchange = False
 
             related_changes = ObjectChange.objects.filter(
@@ -355,14 +368,20 @@ def _handle_deleted_object(sender, instance, **kwargs):
                         save_new_objectchange = False
 
         if save_new_objectchange:
+            deferred_object_change = {
+                "action": ObjectChangeActionChoices.ACTION_DELETE,
+                "instance": instance,
+                "user": user,
+                "changed_object_id": changed_object_id,
+                "changed_object_type": changed_object_type,
+            }
+            if change_context.defer_object_changes and not change_context.bulk_deleting:
+                # The object can no longer be serialized once it has been deleted
+                deferred_object_change["objectchange"] = instance.to_objectchange(
+                    ObjectChangeActionChoices.ACTION_DELETE
+                )
             change_context.deferred_object_changes.setdefault(unique_object_change_id, []).append(
-                {
-                    "action": ObjectChangeActionChoices.ACTION_DELETE,
-                    "instance": instance,
-                    "user": user,
-                    "changed_object_id": changed_object_id,
-                    "changed_object_type": changed_object_type,
-                }
+                deferred_object_change
             )
             if not change_context.defer_object_changes:
                 objectchange = instance.to_objectchange(ObjectChangeActionChoices.ACTION_DELETE)
@@ -382,6 +401,88 @@ def _handle_deleted_object(sender, instance, **kwargs):
     model_deletes.labels(instance._meta.model_name).inc()
 
 
+#
+# Config contexts
+#
+
+
+@receiver(post_save, sender=ConfigContext)
+@receiver(post_delete, sender=ConfigContext)
+@receiver(post_delete, sender="dcim.Location")
+@receiver(post_delete, sender="tenancy.Tenant")
+@receiver(post_delete, sender="tenancy.TenantGroup")
+@receiver(post_delete, sender="virtualization.Cluster")
+def invalidate_all_rendered_config_contexts(sender, raw=False, **kwargs):
+    """Discard all stored rendered config contexts when a change is made that could affect any number of them."""
+    if raw:
+        return
+    invalidate_rendered_config_contexts()
+
+
+@receiver(pre_save, sender="dcim.Location")
+@receiver(pre_save, sender="tenancy.Tenant")
+@receiver(pre_save, sender="tenancy.TenantGroup")
+@receiver(pre_save, sender="virtualization.Cluster")
+def check_config_context_related_object_change(sender, instance, raw=False, **kwargs):
+    """Record whether a change to an existing object may change the config contexts of the Devices/VMs related to it."""
+    if raw or instance._state.adding or not settings.CONFIG_CONTEXT_CACHE_ENABLED:
+        return
+    field_names = CONFIG_CONTEXT_RELATED_MODEL_FIELDS[sender._meta.label_lower]
+    previous_values = sender.objects.filter(pk=instance.pk).values_list(*field_names).first()
+    instance._config_context_related_fields_changed = previous_values != tuple(
+        getattr(instance, field_name) for field_name in field_names
+    )
+
+
+@receiver(post_save, sender="dcim.Location")
+@receiver(post_save, sender="tenancy.Tenant")
+@receiver(post_save, sender="tenancy.TenantGroup")
+@receiver(post_save, sender="virtualization.Cluster")
+def invalidate_rendered_config_contexts_for_related_object(sender, instance, created=False, raw=False, **kwargs):
+    """
+    Discard all stored rendered config contexts when an object's hierarchy or grouping is changed.
+
+    Newly created objects aren't yet related to any Device or VM, and changes to any other fields, such as the
+    description, don't affect which config contexts apply, so neither require stored data to be discarded.
+    """
+    if raw or created:
+        return
+    if getattr(instance, "_config_context_related_fields_changed", True):
+        invalidate_rendered_config_contexts()
+
+
+@receiver(post_save, sender="dcim.Device")
+@receiver(post_delete, sender="dcim.Device")
+@receiver(post_save, sender="virtualization.VirtualMachine")
+@receiver(post_delete, sender="virtualization.VirtualMachine")
+def invalidate_rendered_config_context(sender, instance, raw=False, **kwargs):
+    """Discard the stored rendered config context of a Device or VirtualMachine when it is changed or deleted."""
+    if raw:
+        return
+    invalidate_rendered_config_contexts(sender, [instance.pk])
+
+
+@receiver(post_delete, sender=TaggedItem)
+def invalidate_rendered_config_context_for_tagged_item(sender, instance, **kwargs):
+    """Discard the stored rendered config context of a Device or VirtualMachine when a tag is removed from it."""
+    if not settings.CONFIG_CONTEXT_CACHE_ENABLED:
+        return
+    model = instance.content_type.model_class()
+    if model is not None:
+        invalidate_rendered_config_contexts(model, [instance.object_id])
+
+
+@receiver(m2m_changed)
+def invalidate_rendered_config_contexts_for_m2m_change(sender, instance, action, **kwargs):
+    """Discard stored rendered config contexts when a ConfigContext's assignments or a Device/VM's tags change."""
+    if not settings.CONFIG_CONTEXT_CACHE_ENABLED or action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if isinstance(instance, ConfigContext):
+        invalidate_rendered_config_contexts()
+    elif isinstance(instance, ConfigContextModel):
+        invalidate_rendered_config_contexts(type(instance), [instance.pk])
+
+
 #
 # Content types
 #
@@ -1,4 +1,5 @@
 from logging import getLogger
+import threading
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
@@ -175,15 +176,40 @@ def provision_field(field_id, content_type_pk_set, change_context=None):
 
 
 @nautobot_task
-def process_webhook(webhook_pk, data, model_name, event, timestamp, username, request_id, snapshots):
+def process_object_changes(change_id, pre_object_data=None, pre_object_data_v2=None):
     """
-    Make a POST request to the defined Webhook
+    Enqueue the job hooks and webhooks, and publish the events, triggered by the ObjectChanges of a request or Job.
+
+    This is enqueued by `web_request_context()` once its changes are committed, if
+    `settings.CHANGELOG_ASYNC_PROCESSING_ENABLED` is True.
+
+    Args:
+        change_id (uuid4): The `request_id` of the ObjectChanges to process
+        pre_object_data (dict): Optional serialized object data, keyed by object ID, used in the snapshots
+        pre_object_data_v2 (dict): Optional serialized object data, keyed by object ID, used in the snapshots
     """
-    from nautobot.extras.models import Webhook  # avoiding circular import
+    # Circular Import
+    from nautobot.extras.context_managers import process_object_changes as _process_object_changes
 
-    webhook = Webhook.objects.get(pk=webhook_pk)
+    _process_object_changes(change_id, pre_object_data=pre_object_data, pre_object_data_v2=pre_object_data_v2)
+
+
+# Each worker (thread) reuses a single Session, so that requests to the same receiver reuse pooled keep-alive connections
+_webhook_session_state = threading.local()
 
-    context = {
+
+def _get_webhook_session():
+    """Return the pooled `requests.Session` used to send webhook requests from the current worker thread."""
+    session = getattr(_webhook_session_state, "session", None)
+    if session is None:
+        session = requests.Session()
+        _webhook_session_state.session = session
+    return session
+
+
+def get_webhook_context(data, model_name, event, timestamp, username, request_id, snapshots):
+    """Return the context used to render the headers and body of a webhook request for a single change."""
+    return {
         "event": dict(ObjectChangeActionChoices)[event].lower(),
         "timestamp": timestamp,
         "model": model_name,
@@ -193,6 +219,14 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         "snapshots": snapshots,
     }
 
+
+def send_webhook_request(webhook, context):
+    """
+    Render and send a webhook request with the given context, using a pooled keep-alive session.
+
+    Returns:
+        (requests.Response): The response to the webhook request.
+    """
     # Build the headers for the HTTP request
     headers = {
         "Content-Type": webhook.http_content_type,
@@ -217,7 +251,12 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         "headers": headers,
         "data": body.encode("utf8"),
     }
-    logger.info("Sending %s request to %s (%s %s)", params["method"], params["url"], context["model"], context["event"])
+    if "events" in context:
+        logger.info("Sending %s request to %s (%d changes)", params["method"], params["url"], len(context["events"]))
+    else:
+        logger.info(
+            "Sending %s request to %s (%s %s)", params["method"], params["url"], context["model"], context["event"]
+        )
     logger.debug("%s", params)
     try:
         prepared_request = requests.Request(**params).prepare()
@@ -230,12 +269,13 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         prepared_request.headers["X-Hook-Signature"] = generate_signature(prepared_request.body, webhook.secret)
 
     # Send the request
-    with requests.Session() as session:
-        session.verify = webhook.ssl_verification
-        if webhook.ca_file_path:
-            session.verify = webhook.ca_file_path
-        response = session.send(prepared_request, proxies=settings.HTTP_PROXIES)
+    verify = webhook.ssl_verification
+    if webhook.ca_file_path:
+        verify = webhook.ca_file_path
+    return _get_webhook_session().send(prepared_request, proxies=settings.HTTP_PROXIES, verify=verify)
+
 
+def _check_webhook_response(response):
     if response.ok:
         logger.info("Request succeeded; response status %s", response.status_code)
         return f"Status {response.status_code} returned, webhook successfully processed."
@@ -244,3 +284,32 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         raise requests.exceptions.RequestException(
             f"Status {response.status_code} returned with content '{response.content}', webhook FAILED to process."
         )
+
+
+@nautobot_task
+def process_webhook(webhook_pk, data, model_name, event, timestamp, username, request_id, snapshots):
+    """
+    Make a POST request to the defined Webhook
+    """
+    from nautobot.extras.models import Webhook  # avoiding circular import
+
+    webhook = Webhook.objects.get(pk=webhook_pk)
+    context = get_webhook_context(data, model_name, event, timestamp, username, request_id, snapshots)
+    return _check_webhook_response(send_webhook_request(webhook, context))
+
+
+@nautobot_task
+def process_webhook_batch(webhook_pk, changes):
+    """
+    Make a single request to the defined Webhook for a batch of changes.
+
+    Args:
+        webhook_pk (uuid4): The PK of the Webhook
+        changes (list[dict]): The `data`, `model_name`, `event`, `timestamp`, `username`, `request_id` and
+            `snapshots` of each change, as passed individually to `process_webhook`
+    """
+    from nautobot.extras.models import Webhook  # avoiding circular import
+
+    webhook = Webhook.objects.get(pk=webhook_pk)
+    context = {"events": [get_webhook_context(**change) for change in changes]}
+    return _check_webhook_response(send_webhook_request(webhook, context))
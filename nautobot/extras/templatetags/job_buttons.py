@@ -74,10 +74,13 @@ CONFIRM_MODAL = """
 SAFE_EMPTY_STR = mark_safe("")  # noqa: S308  # suspicious-mark-safe-usage -- this one is safe
 
 
-def _render_job_button_for_obj(job_button, obj, context, content_type):
+def _render_job_button_for_obj(job_button, obj, context, content_type, has_run_perm):
     """
     Helper method for job_buttons templatetag to reduce repetition of code.
 
+    Args:
+        has_run_perm (bool): Whether the user has permission to run the underlying Job.
+
     Returns:
        (str, str): (button_html, form_html)
     """
@@ -105,8 +108,6 @@ def _render_job_button_for_obj(job_button, obj, context, content_type):
     if not text_rendered:
         return (SAFE_EMPTY_STR, SAFE_EMPTY_STR)
 
-    # Disable buttons if the user doesn't have permission to run the underlying Job.
-    has_run_perm = Job.objects.check_perms(context["user"], instance=job_button.job, action="run")
     try:
         job_queues = job_button.job.job_queues.all()
         _job_queue = job_queues[0]
@@ -154,6 +155,9 @@ def job_buttons(context, obj):
     if not buttons:
         return SAFE_EMPTY_STR
 
+    # Disable buttons if the user doesn't have permission to run the underlying Job.
+    run_permitted = Job.objects.check_perms_many(context["user"], {jb.job_id for jb in buttons}, action="run")
+
     buttons_html = forms_html = SAFE_EMPTY_STR
     group_names = OrderedDict()
 
@@ -164,7 +168,9 @@ def job_buttons(context, obj):
 
         # Render and add non-grouped buttons
         else:
-            button_html, form_html = _render_job_button_for_obj(jb, obj, context, content_type)
+            button_html, form_html = _render_job_button_for_obj(
+                jb, obj, context, content_type, run_permitted[jb.job_id]
+            )
             buttons_html += button_html
             forms_html += form_html
 
@@ -176,7 +182,9 @@ def job_buttons(context, obj):
 
         for jb in buttons:
             # Render grouped buttons as list items
-            button_html, form_html = _render_job_button_for_obj(jb, obj, context, content_type)
+            button_html, form_html = _render_job_button_for_obj(
+                jb, obj, context, content_type, run_permitted[jb.job_id]
+            )
             buttons_rendered += format_html("<li>{}</li>", button_html)
             forms_html += form_html
 
@@ -1,5 +1,9 @@
+import uuid
+
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.html import escape
 from rest_framework import status
@@ -387,6 +391,73 @@ class ChangeLogAPITest(APITestCase):
         self.assertEqual(oc.object_data["tags"], sorted([tag.name for tag in self.tags[:2]]))
         self.assertEqual(oc.user_id, self.user.pk)
 
+    def _count_object_change_inserts(self, captured_queries):
+        table = ObjectChange._meta.db_table
+        return len(
+            [
+                query
+                for query in captured_queries
+                if query["sql"].startswith("INSERT INTO") and table in query["sql"].split("(", 1)[0]
+            ]
+        )
+
+    def test_bulk_operations_defer_change_logging(self):
+        """Bulk REST API operations should create their ObjectChanges in bulk rather than one at a time."""
+        location_type = LocationType.objects.get(name="Campus")
+        self.add_permissions(
+            "dcim.add_location",
+            "dcim.change_location",
+            "dcim.delete_location",
+            "dcim.view_locationtype",
+            "extras.view_status",
+            "extras.view_tag",
+        )
+        url = reverse("dcim-api:location-list")
+
+        with self.subTest("bulk create"):
+            data = [
+                {
+                    "name": f"Bulk Location {i}",
+                    "status": self.statuses[0].pk,
+                    "location_type": location_type.pk,
+                    "tags": [self.tags[0].pk],
+                }
+                for i in range(5)
+            ]
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(url, data, format="json", **self.header)
+            self.assertHttpStatus(response, status.HTTP_201_CREATED)
+            self.assertEqual(self._count_object_change_inserts(queries.captured_queries), 1)
+            locations = Location.objects.filter(name__startswith="Bulk Location")
+            for location in locations:
+                oc = get_changes_for_model(location).get()
+                self.assertEqual(oc.action, ObjectChangeActionChoices.ACTION_CREATE)
+                self.assertEqual(oc.object_data["tags"], [self.tags[0].name])
+                self.assertEqual(oc.user_id, self.user.pk)
+
+        with self.subTest("bulk update"):
+            data = [{"id": str(location.pk), "description": "bulk updated"} for location in locations]
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.patch(url, data, format="json", **self.header)
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+            self.assertEqual(self._count_object_change_inserts(queries.captured_queries), 1)
+            for location in locations:
+                oc = get_changes_for_model(location).filter(action=ObjectChangeActionChoices.ACTION_UPDATE).get()
+                self.assertEqual(oc.object_data["description"], "bulk updated")
+
+        with self.subTest("bulk delete"):
+            location_pks = [location.pk for location in locations]
+            data = [{"id": str(pk)} for pk in location_pks]
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.delete(url, data, format="json", **self.header)
+            self.assertHttpStatus(response, status.HTTP_204_NO_CONTENT)
+            self.assertEqual(self._count_object_change_inserts(queries.captured_queries), 1)
+            for pk in location_pks:
+                oc = ObjectChange.objects.get(changed_object_id=pk, action=ObjectChangeActionChoices.ACTION_DELETE)
+                # Deleted objects must be serialized before their deletion
+                self.assertEqual(oc.object_data["id"], str(pk))
+                self.assertEqual(oc.object_data["tags"], [self.tags[0].name])
+
     @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
     def test_get_graphql_object(self):
         """Test GET with changelogs via GraphQL."""
@@ -593,3 +664,36 @@ class ObjectChangeModelTest(TestCase):  # TODO: change to BaseModelTestCase once
             self.assertIsNone(snapshots["postchange"])
             self.assertEqual(snapshots["differences"]["removed"], oc_with_object_data_v2.object_data_v2)
             self.assertIsNone(snapshots["differences"]["added"])
+
+    def test_get_prior_changes(self):
+        location_type = LocationType.objects.get(name="Campus")
+        with context_managers.web_request_context(self.user):
+            location_1 = Location.objects.create(
+                name="Prior Changes 1", status=self.location_status, location_type=location_type
+            )
+            location_2 = Location.objects.create(
+                name="Prior Changes 2", status=self.location_status, location_type=location_type
+            )
+        request_id = uuid.uuid4()
+        with context_managers.web_request_context(self.user, change_id=request_id):
+            location_1.description = "changed once"
+            location_1.validated_save()
+            location_1.description = "changed twice"
+            location_1.validated_save()
+            location_2.delete()
+            Location.objects.create(name="Prior Changes 3", status=self.location_status, location_type=location_type)
+
+        object_changes = ObjectChange.objects.filter(request_id=request_id)
+        with self.assertNumQueries(1):
+            prior_changes = ObjectChange.get_prior_changes(request_id)
+        for object_change in object_changes:
+            with self.subTest(object_change=object_change):
+                expected = object_change.get_prev_change()
+                if expected is None:
+                    self.assertNotIn(object_change.pk, prior_changes)
+                else:
+                    self.assertEqual(prior_changes[object_change.pk].pk, expected.pk)
+                    self.assertEqual(prior_changes[object_change.pk].object_data_v2, expected.object_data_v2)
+                self.assertEqual(
+                    object_change.get_snapshots(prior_changes=prior_changes), object_change.get_snapshots()
+                )
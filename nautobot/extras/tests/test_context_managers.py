@@ -1,9 +1,10 @@
 from unittest import mock
+import uuid
 
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.test import override_settings, TestCase
 
 from nautobot.core.celery import app
 from nautobot.core.testing import get_job_class_and_model, TransactionTestCase
@@ -24,6 +25,7 @@ from nautobot.extras.context_managers import (
     web_request_context,
 )
 from nautobot.extras.models import JobHook, Status, Webhook
+from nautobot.extras.tasks import process_object_changes
 from nautobot.extras.utils import bulk_delete_with_bulk_change_logging
 
 # Use the proper swappable User model
@@ -101,11 +103,56 @@ class WebRequestContextTestCase(TestCase):
         )
         mock_enqueue_webhooks.assert_has_calls(
             [
-                mock.call(oc_list[0], snapshots=oc_list[0].get_snapshots(), webhook_queryset=None),
-                mock.call(oc_list[1], snapshots=oc_list[1].get_snapshots(), webhook_queryset=None),
+                mock.call(
+                    oc_list[0],
+                    snapshots=oc_list[0].get_snapshots(),
+                    webhook_queryset=None,
+                    webhook_batcher=mock.ANY,
+                ),
+                mock.call(
+                    oc_list[1],
+                    snapshots=oc_list[1].get_snapshots(),
+                    webhook_queryset=None,
+                    webhook_batcher=mock.ANY,
+                ),
             ]
         )
 
+    @override_settings(CHANGELOG_ASYNC_PROCESSING_ENABLED=True)
+    @mock.patch("nautobot.extras.context_managers.enqueue_webhooks", return_value=None)
+    @mock.patch("nautobot.extras.context_managers.process_object_changes_task.delay")
+    def test_async_processing(self, mock_delay, mock_enqueue_webhooks):
+        """Test that changes are processed by a Celery task once committed, if CHANGELOG_ASYNC_PROCESSING_ENABLED."""
+        location_type = LocationType.objects.get(name="Campus")
+        location_status = Status.objects.get_for_model(Location).first()
+
+        with self.subTest("no changes made"):
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                with web_request_context(self.user):
+                    Location.objects.first()
+            self.assertEqual(callbacks, [])
+            mock_delay.assert_not_called()
+
+        with self.subTest("changes made"):
+            change_id = uuid.uuid4()
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                with web_request_context(self.user, change_id=change_id):
+                    location = Location(name="Test Location 1", location_type=location_type, status=location_status)
+                    location.save()
+            # Nothing is processed until the changes are committed
+            mock_delay.assert_not_called()
+            self.assertEqual(len(callbacks), 1)
+            callbacks[0]()
+            mock_delay.assert_called_once_with(change_id, pre_object_data=mock.ANY, pre_object_data_v2=mock.ANY)
+            mock_enqueue_webhooks.assert_not_called()
+
+        with self.subTest("task processes the changes"):
+            process_object_changes(change_id)
+            oc = get_changes_for_model(location).get()
+            mock_enqueue_webhooks.assert_called_once_with(
+                oc, snapshots=oc.get_snapshots(), webhook_queryset=None, webhook_batcher=mock.ANY
+            )
+
     def test_update_then_delete(self):
         """Test that an update followed by a delete is logged as a single delete"""
         location_type = LocationType.objects.get(name="Campus")
@@ -307,6 +354,18 @@ class BulkEditDeleteChangeLogging(TestCase):
         self.assertEqual(oc_list[0].user, self.user)
         self.assertEqual(oc_list[0].user_name, self.user.username)
 
+    def test_bulk_delete_serializes_each_object_once(self):
+        """Test that objects deleted in bulk are not additionally serialized by the `pre_delete` signal handler."""
+        location_type = LocationType.objects.get(name="Campus")
+        location_status = Status.objects.get_for_model(Location).first()
+        with web_request_context(self.user):
+            location = Location(name="Test Location 1", location_type=location_type, status=location_status)
+            location.save()
+            to_objectchange = Location.to_objectchange
+            with mock.patch.object(Location, "to_objectchange", autospec=True, side_effect=to_objectchange) as mocked:
+                bulk_delete_with_bulk_change_logging(Location.objects.filter(pk=location.pk))
+        self.assertEqual(mocked.call_count, 1)
+
     def test_create_then_update(self):
         """Test that a create followed by an update is logged as a single create"""
         location_type = LocationType.objects.get(name="Campus")
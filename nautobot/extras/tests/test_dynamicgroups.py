@@ -1,9 +1,11 @@
 import random
+import uuid
 
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db.models import ProtectedError, QuerySet
+from django.test import override_settings
 from django.urls import reverse
 
 from nautobot.core.forms.fields import MultiMatchModelMultipleChoiceField, MultiValueCharField
@@ -28,16 +30,20 @@ from nautobot.extras.choices import (
     CustomFieldTypeChoices,
     DynamicGroupOperatorChoices,
     DynamicGroupTypeChoices,
+    ObjectChangeActionChoices,
     RelationshipTypeChoices,
 )
+from nautobot.extras.context_managers import web_request_context
 from nautobot.extras.filters import DynamicGroupFilterSet, DynamicGroupMembershipFilterSet
 from nautobot.extras.models import (
     CustomField,
     DynamicGroup,
     DynamicGroupMembership,
+    ObjectChange,
     Relationship,
     RelationshipAssociation,
     Role,
+    StaticGroupAssociation,
     Status,
     Tag,
 )
@@ -343,6 +349,36 @@ class DynamicGroupModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mi
         self.assertIsInstance(Prefix.objects.filter(ip_version=6).first().dynamic_groups, QuerySet)
         self.assertIn(sg, list(Prefix.objects.filter(ip_version=6).first().dynamic_groups))
 
+    def test_static_member_operations_change_logging(self):
+        """Changes to the members of a static group are change-logged, in bulk."""
+        sg = DynamicGroup.objects.create(
+            name="Change Logged Prefixes",
+            content_type=ContentType.objects.get_for_model(Prefix),
+            group_type=DynamicGroupTypeChoices.TYPE_STATIC,
+        )
+        prefixes = Prefix.objects.filter(ip_version=4)
+        sga_changes = ObjectChange.objects.filter(
+            changed_object_type=ContentType.objects.get_for_model(StaticGroupAssociation)
+        )
+
+        change_id = uuid.uuid4()
+        with web_request_context(self.user, change_id=change_id):
+            sg.add_members(prefixes)
+            # Re-adding existing members is a no-op
+            sg.add_members(list(prefixes))
+        self.assertQuerysetEqualAndNotEmpty(sg.members, prefixes)
+        created = sga_changes.filter(action=ObjectChangeActionChoices.ACTION_CREATE, request_id=change_id)
+        self.assertEqual(created.count(), prefixes.count())
+        self.assertEqual(set(created.values_list("user_name", flat=True)), {self.user.username})
+
+        removed_prefix = prefixes.first()
+        change_id = uuid.uuid4()
+        with web_request_context(self.user, change_id=change_id):
+            sg.members = list(prefixes.exclude(pk=removed_prefix.pk))
+        deleted = sga_changes.filter(action=ObjectChangeActionChoices.ACTION_DELETE, request_id=change_id)
+        self.assertEqual(deleted.count(), 1)
+        self.assertQuerysetEqualAndNotEmpty(sg.members, prefixes.exclude(pk=removed_prefix.pk))
+
     # TODO negative test that members=, add_members(), remove_members() raise appropriate errors for non-static groups
 
     def test_members_fail_closed(self):
@@ -435,6 +471,82 @@ class DynamicGroupModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mi
         # Test idempotence
         group.update_cached_members()
 
+    def assertCachedMembersUpToDate(self):
+        for group in self.groups:
+            self.assertEqual(
+                set(group.members.values_list("pk", flat=True)),
+                set(group._get_group_queryset().values_list("pk", flat=True)),
+                group.name,
+            )
+
+    def test_update_cached_members_for_objects(self):
+        """Test `DynamicGroup.objects.update_cached_members_for_objects()`."""
+        for group in self.groups:
+            group.update_cached_members()
+        device = self.devices[1]
+        device.location = self.locations[0]
+        device.status = self.status_2
+        device.save()
+        self.assertFalse(self.first_child.has_member(device))
+
+        with self.assertApproximateNumQueries(minimum=4, maximum=10):
+            added, removed = DynamicGroup.objects.update_cached_members_for_objects(Device, [device.pk])
+        self.assertTrue(self.first_child.has_member(device))
+        self.assertFalse(self.nested_child.has_member(device))
+        self.assertGreater(added, 0)
+        self.assertGreater(removed, 0)
+        self.assertCachedMembersUpToDate()
+
+        # Test idempotence; all groups are evaluated in a single query, after loading the groups and their memberships
+        with self.assertNumQueries(4):
+            self.assertEqual(DynamicGroup.objects.update_cached_members_for_objects(Device, [device.pk]), (0, 0))
+
+        # Only the groups in the queryset are updated
+        device.location = self.locations[2]
+        device.save()
+        DynamicGroup.objects.filter(pk=self.second_child.pk).update_cached_members_for_objects(Device, [device.pk])
+        self.assertTrue(self.second_child.has_member(device))
+        self.assertTrue(self.first_child.has_member(device))
+
+    def test_refresh_cached_members(self):
+        """Test `DynamicGroup.objects.refresh_cached_members()`."""
+        StaticGroupAssociation.all_objects.filter(dynamic_group__in=self.groups).delete()
+
+        groups = DynamicGroup.objects.filter(pk__in=[group.pk for group in self.groups])
+        refreshed = [group for group, _elapsed in groups.refresh_cached_members()]
+
+        self.assertEqual(sorted(group.name for group in refreshed), sorted(group.name for group in self.groups))
+        # Child groups are refreshed before their parents
+        refreshed_pks = [group.pk for group in refreshed]
+        for membership in self.memberships:
+            self.assertLess(refreshed_pks.index(membership.group.pk), refreshed_pks.index(membership.parent_group.pk))
+        self.assertCachedMembersUpToDate()
+
+    @override_settings(DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED=True)
+    def test_incremental_updates_on_change(self):
+        """Test that changed objects are re-evaluated when `DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED` is set."""
+        for group in self.groups:
+            group.update_cached_members()
+        device = self.devices[2]
+        self.assertTrue(self.second_child.has_member(device))
+
+        with web_request_context(self.user):
+            device.location = self.locations[0]
+            device.save()
+            new_device = Device.objects.create(
+                name="device-location-new",
+                status=self.status_1,
+                role=self.device_role,
+                device_type=self.device_type,
+                location=self.locations[2],
+            )
+
+        self.assertFalse(self.second_child.has_member(device))
+        self.assertTrue(self.first_child.has_member(device))
+        self.assertTrue(self.second_child.has_member(new_device))
+        self.assertTrue(self.nested_child.has_member(new_device))
+        self.assertCachedMembersUpToDate()
+
     def test_count(self):
         """Test `DynamicGroup.count`."""
         expected = {
@@ -10,6 +10,7 @@ from zoneinfo import ZoneInfo
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db.models import ProtectedError
@@ -44,6 +45,12 @@ from nautobot.extras.choices import (
     SecretsGroupAccessTypeChoices,
     SecretsGroupSecretTypeChoices,
 )
+from nautobot.extras.config_contexts import (
+    ConfigContextEvaluator,
+    get_rendered_config_context_cache_key,
+    get_rendered_config_contexts,
+    prefetch_rendered_config_contexts,
+)
 from nautobot.extras.constants import (
     JOB_LOG_MAX_ABSOLUTE_URL_LENGTH,
     JOB_LOG_MAX_GROUPING_LENGTH,
@@ -643,6 +650,150 @@ class ConfigContextTest(ModelTestCases.BaseModelTestCase):
         self.assertIn("dynamic context 2", device2.get_config_context().values())
         self.assertNotIn("dynamic context 1", device2.get_config_context().values())
 
+    @override_settings(CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED=True)
+    def test_evaluator_same_as_get_for_object(self):
+        """
+        Assert that ConfigContextEvaluator renders the same config contexts as get_for_object(), for every kind of
+        assignment and for both Devices and VirtualMachines, and that prefetch_config_contexts() makes use of it.
+        """
+        cluster_group = ClusterGroup.objects.create(name="Cluster Group")
+        cluster = Cluster.objects.create(
+            name="Cluster",
+            cluster_group=cluster_group,
+            cluster_type=ClusterType.objects.create(name="Cluster Type 1"),
+            location=self.location,
+        )
+        assignments = {
+            "root_location": ("locations", self.root_location),
+            "location": ("locations", self.location),
+            "role": ("roles", self.devicerole),
+            "device_type": ("device_types", self.devicetype),
+            "platform": ("platforms", self.platform),
+            "cluster_group": ("cluster_groups", cluster_group),
+            "cluster": ("clusters", cluster),
+            "parent_tenant_group": ("tenant_groups", self.parent_tenantgroup),
+            "tenant": ("tenants", self.child_tenant),
+            "tag": ("tags", self.tag),
+            "dynamic_group": ("dynamic_groups", self.dynamic_groups),
+            "dynamic_group_2": ("dynamic_groups", self.dynamic_group_2),
+            "vm_dynamic_group": ("dynamic_groups", self.vm_dynamic_group),
+        }
+        for i, (key, (field_name, related_object)) in enumerate(assignments.items()):
+            context = ConfigContext.objects.create(name=key, weight=i, data={key: 1, "nested": {key: i, "weight": i}})
+            getattr(context, field_name).add(related_object)
+        mismatched_context = ConfigContext.objects.create(name="mismatched", data={"mismatched": 1})
+        mismatched_context.locations.add(self.location)
+        mismatched_context.device_types.add(DeviceType.objects.exclude(pk=self.devicetype.pk).first())
+        ConfigContext.objects.create(name="inactive", data={"inactive": 1}, is_active=False)
+
+        device = Device.objects.create(
+            name="Device 2",
+            location=self.location,
+            tenant=self.child_tenant,
+            platform=self.platform,
+            role=self.devicerole,
+            status=self.device_status,
+            device_type=self.devicetype,
+            cluster=cluster,
+            local_config_context_data={"nested": {"local": 1}},
+        )
+        device.tags.add(self.tag)
+        virtual_machine = VirtualMachine.objects.create(
+            name="VM 1",
+            cluster=cluster,
+            tenant=self.child_tenant,
+            platform=self.platform,
+            role=self.devicerole,
+            status=Status.objects.get_for_model(VirtualMachine).first(),
+        )
+        virtual_machine.tags.add(self.tag2)
+        for group in (self.dynamic_groups, self.dynamic_group_2, self.vm_dynamic_group):
+            group.update_cached_members()
+
+        devices = [self.device, device]
+        rendered = ConfigContextEvaluator(Device).evaluate([obj.pk for obj in devices])
+        for obj in devices:
+            self.assertEqual(rendered[obj.pk], obj.get_config_context())
+        self.assertNotIn("tenant", rendered[self.device.pk])
+        self.assertNotIn("dynamic_group_2", rendered[self.device.pk])
+        for key in ["root_location", "location", "cluster", "parent_tenant_group", "tenant", "tag", "dynamic_group_2"]:
+            self.assertIn(key, rendered[device.pk])
+        for key in ["mismatched", "inactive", "vm_dynamic_group"]:
+            self.assertNotIn(key, rendered[device.pk])
+        self.assertIn("local", rendered[device.pk]["nested"])
+
+        rendered = ConfigContextEvaluator(VirtualMachine).evaluate([virtual_machine.pk])
+        self.assertEqual(rendered[virtual_machine.pk], virtual_machine.get_config_context())
+        for key in ["root_location", "location", "cluster_group", "cluster", "platform", "vm_dynamic_group"]:
+            self.assertIn(key, rendered[virtual_machine.pk])
+        for key in ["device_type", "tag", "dynamic_group"]:
+            self.assertNotIn(key, rendered[virtual_machine.pk])
+
+        expected = {obj.pk: obj.get_config_context() for obj in devices}
+        prefetched_devices = list(Device.objects.filter(pk__in=expected).prefetch_config_contexts())
+        self.assertEqual(len(prefetched_devices), 2)
+        with self.assertNumQueries(0):
+            for obj in prefetched_devices:
+                self.assertEqual(obj.get_config_context(), expected[obj.pk])
+
+    @override_settings(CONFIG_CONTEXT_CACHE_ENABLED=True)
+    def test_rendered_config_context_cache(self):
+        """
+        Assert that rendered config contexts are stored and reused, and are discarded by changes that may affect them.
+        """
+
+        def get_stored_config_context():
+            # The cache key changes whenever all stored data is discarded
+            return cache.get(get_rendered_config_context_cache_key(Device, self.device.pk))
+
+        def get_rendered_config_context():
+            return get_rendered_config_contexts(Device, [self.device.pk])[self.device.pk]
+
+        self.assertEqual(get_rendered_config_context(), {"a": 123, "b": 456, "c": 777})
+        self.assertEqual(get_stored_config_context(), {"a": 123, "b": 456, "c": 777})
+        device = Device.objects.get(pk=self.device.pk)
+        prefetch_rendered_config_contexts([device])
+        with self.assertNumQueries(0):
+            self.assertEqual(device.get_config_context(), {"a": 123, "b": 456, "c": 777})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            context = ConfigContext.objects.create(name="context 2", weight=200, data={"b": 999})
+            # Stored data is only discarded once the transaction is committed
+            self.assertIsNotNone(get_stored_config_context())
+        self.assertIsNone(get_stored_config_context())
+        self.assertEqual(get_rendered_config_context(), {"a": 123, "b": 999, "c": 777})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            context.tags.add(self.tag)
+        self.assertIsNone(get_stored_config_context())
+        self.assertEqual(get_rendered_config_context(), {"a": 123, "b": 456, "c": 777})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.device.tags.add(self.tag)
+        self.assertIsNone(get_stored_config_context())
+        self.assertEqual(get_rendered_config_context(), {"a": 123, "b": 999, "c": 777})
+
+        self.device.local_config_context_data = {"c": 0}
+        with self.captureOnCommitCallbacks(execute=True):
+            self.device.save()
+        self.assertIsNone(get_stored_config_context())
+        self.assertEqual(get_rendered_config_context(), {"a": 123, "b": 999, "c": 0})
+
+        # Changes that don't affect which config contexts apply keep the stored data
+        self.root_location.description = "Changed"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.root_location.save()
+        self.assertEqual(get_stored_config_context(), {"a": 123, "b": 999, "c": 0})
+
+        new_root_location = Location.objects.create(
+            name="New Root Location", location_type=self.root_location.location_type, status=self.root_location.status
+        )
+        self.assertEqual(get_stored_config_context(), {"a": 123, "b": 999, "c": 0})
+        self.parent_location.parent = new_root_location
+        with self.captureOnCommitCallbacks(execute=True):
+            self.parent_location.save()
+        self.assertIsNone(get_stored_config_context())
+
 
 class ConfigContextSchemaTestCase(ModelTestCases.BaseModelTestCase):
     """
@@ -1,6 +1,6 @@
 from copy import deepcopy
 import json
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 import uuid
 
 from django.apps import apps
@@ -20,7 +20,7 @@ from nautobot.extras.context_managers import web_request_context
 from nautobot.extras.models import Tag, Webhook
 from nautobot.extras.models.statuses import Status
 from nautobot.extras.registry import registry
-from nautobot.extras.tasks import process_webhook
+from nautobot.extras.tasks import process_webhook, process_webhook_batch
 from nautobot.extras.utils import generate_signature
 
 User = get_user_model()
@@ -346,7 +346,87 @@ class WebhookTest(APITestCase):
         all_changes = get_changes_for_model(location)
         self.assertEqual(all_changes.count(), 1)
         change = all_changes.first()
-        mock_enqueue_webhooks.assert_called_once_with(change, snapshots=change.get_snapshots(), webhook_queryset=None)
+        mock_enqueue_webhooks.assert_called_once_with(
+            change, snapshots=change.get_snapshots(), webhook_queryset=None, webhook_batcher=ANY
+        )
+
+    @patch("nautobot.extras.tasks.process_webhook_batch.apply_async")
+    @patch("nautobot.extras.tasks.process_webhook.apply_async")
+    def test_enqueue_webhooks_batched(self, mock_async, mock_batch_async):
+        """
+        Make sure that the changes in a single change context are enqueued in batches for a Webhook with a batch_size.
+        """
+        webhook = Webhook.objects.get(type_create=True)
+        webhook.batch_size = 2
+        webhook.save()
+        request_id = uuid.uuid4()
+        location_type = LocationType.objects.get(name="Campus")
+
+        with web_request_context(self.user, change_id=request_id):
+            for i in range(3):
+                Location.objects.create(name=f"Location {i}", location_type=location_type, status=self.statuses[0])
+
+        mock_async.assert_not_called()
+        self.assertEqual(mock_batch_async.call_count, 2)
+        batches = [call[1]["args"] for call in mock_batch_async.call_args_list]
+        self.assertEqual([batch[0] for batch in batches], [webhook.pk, webhook.pk])
+        self.assertEqual([len(batch[1]) for batch in batches], [2, 1])
+        changes = batches[0][1] + batches[1][1]
+        self.assertEqual(
+            sorted(change["data"]["name"] for change in changes), ["Location 0", "Location 1", "Location 2"]
+        )
+        for change in changes:
+            self.assertEqual(change["model_name"], "location")
+            self.assertEqual(change["event"], ObjectChangeActionChoices.ACTION_CREATE)
+            self.assertEqual(change["username"], self.user.username)
+            self.assertEqual(change["request_id"], request_id)
+            self.assertEqual(change["snapshots"]["postchange"]["name"], change["data"]["name"])
+
+    def test_webhooks_process_webhook_batch(self):
+        """
+        Mock a Session.send to inspect the result of `process_webhook_batch()`.
+        """
+        request_id = uuid.uuid4()
+        webhook = Webhook.objects.get(type_create=True)
+        timestamp = str(timezone.now())
+        changes = [
+            {
+                "data": {"name": f"Location {i}"},
+                "model_name": "location",
+                "event": ObjectChangeActionChoices.ACTION_CREATE,
+                "timestamp": timestamp,
+                "username": self.user.username,
+                "request_id": request_id,
+                "snapshots": None,
+            }
+            for i in range(2)
+        ]
+        sent_requests = []
+
+        def mock_send(_, request, **kwargs):
+            sent_requests.append(request)
+
+            class FakeResponse:
+                ok = True
+                status_code = 200
+
+            return FakeResponse()
+
+        with patch.object(Session, "send", mock_send):
+            process_webhook_batch(webhook.pk, changes)
+
+        self.assertEqual(len(sent_requests), 1)
+        request = sent_requests[0]
+        self.assertEqual(request.headers["X-Hook-Signature"], generate_signature(request.body, webhook.secret))
+        self.assertEqual(request.headers["X-Foo"], "Bar")
+        body = json.loads(request.body)
+        self.assertEqual([event["data"]["name"] for event in body["events"]], ["Location 0", "Location 1"])
+        for event in body["events"]:
+            self.assertEqual(event["event"], "created")
+            self.assertEqual(event["timestamp"], timestamp)
+            self.assertEqual(event["model"], "location")
+            self.assertEqual(event["username"], self.user.username)
+            self.assertEqual(event["request_id"], str(request_id))
 
     def test_all_webhook_supported_models(self):
         """
@@ -853,6 +853,50 @@ def migrate_role_data(
         )
 
 
+def bulk_create_with_bulk_change_logging(model, objs, batch_size=1000):
+    """
+    Creates the provided (unsaved) objects with `bulk_create()` and, if change logging is enabled, creates the
+    corresponding ObjectChange instances in bulk as well, to improve performance. This operation is wrapped in an
+    atomic transaction.
+
+    Note that as with `bulk_create()`, the `save()` method of each object is not called and no `post_save` signals are
+    sent for them.
+    """
+    from nautobot.extras.models import ObjectChange
+    from nautobot.extras.signals import change_context_state
+
+    change_context = change_context_state.get()
+    with transaction.atomic():
+        created_objs = model._base_manager.bulk_create(objs, batch_size=batch_size)
+        if change_context is None or not hasattr(model, "to_objectchange"):
+            return created_objs
+
+        user = change_context.get_user()
+        content_type = ContentType.objects.get_for_model(model)
+        queued_object_changes = []
+        for obj in created_objs:
+            if user is not None:
+                unique_object_change_id = f"{content_type.pk}__{obj.pk}__{user.pk}"
+            else:
+                unique_object_change_id = f"{content_type.pk}__{obj.pk}"
+            # Record the change in the change context, as the `post_save` signal handler would have done
+            change_context.deferred_object_changes[unique_object_change_id] = [
+                {"action": ObjectChangeActionChoices.ACTION_CREATE, "instance": obj, "user": user}
+            ]
+            if change_context.defer_object_changes:
+                continue
+            oc = obj.to_objectchange(ObjectChangeActionChoices.ACTION_CREATE)
+            if oc is not None:
+                oc.user = user
+                oc.user_name = user.username if user is not None else "Undefined"
+                oc.request_id = change_context.change_id
+                oc.change_context = change_context.context
+                oc.change_context_detail = change_context.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
+                queued_object_changes.append(oc)
+        ObjectChange.objects.bulk_create(queued_object_changes, batch_size=batch_size)
+        return created_objs
+
+
 def bulk_delete_with_bulk_change_logging(qs, batch_size=1000):
     """
     Deletes objects in the provided queryset and creates ObjectChange instances in bulk to improve performance.
@@ -865,10 +909,16 @@ def bulk_delete_with_bulk_change_logging(qs, batch_size=1000):
     if change_context is None:
         raise ValueError("Change logging must be enabled before using bulk_delete_with_bulk_change_logging")
 
+    was_deferring_object_changes = change_context.defer_object_changes
+    was_bulk_deleting = change_context.bulk_deleting
     with transaction.atomic():
         try:
+            # Create any ObjectChanges already deferred by an enclosing operation, as they are discarded below
+            change_context.flush_deferred_object_changes()
             queued_object_changes = []
             change_context.defer_object_changes = True
+            # The ObjectChanges are created here, so the `pre_delete` signal handler needn't serialize the objects
+            change_context.bulk_deleting = True
             for obj in qs.iterator():
                 if not hasattr(obj, "to_objectchange"):
                     break
@@ -886,7 +936,8 @@ def bulk_delete_with_bulk_change_logging(qs, batch_size=1000):
             ObjectChange.objects.bulk_create(queued_object_changes)
             return qs.delete()
         finally:
-            change_context.defer_object_changes = False
+            change_context.defer_object_changes = was_deferring_object_changes
+            change_context.bulk_deleting = was_bulk_deleting
             change_context.reset_deferred_object_changes()
 
 
@@ -2952,7 +2952,7 @@ class WebhookUIViewSet(NautobotUIViewSet):
                 label="HTTP",
                 section=SectionChoices.LEFT_HALF,
                 weight=100,
-                fields=("http_method", "http_content_type", "payload_url", "additional_headers"),
+                fields=("http_method", "http_content_type", "payload_url", "additional_headers", "batch_size"),
                 value_transforms={"additional_headers": [helpers.pre_tag]},
             ),
             ObjectFieldsPanel(
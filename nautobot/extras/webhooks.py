@@ -3,10 +3,39 @@ from django.utils import timezone
 from nautobot.extras.choices import ObjectChangeActionChoices
 from nautobot.extras.models import Webhook
 from nautobot.extras.registry import registry
-from nautobot.extras.tasks import process_webhook
+from nautobot.extras.tasks import process_webhook, process_webhook_batch
 
 
-def enqueue_webhooks(object_change, snapshots=None, webhook_queryset=None):
+class WebhookBatcher:
+    """
+    Coalesce the changes that trigger each Webhook with a `batch_size` greater than 1 into batches.
+
+    A `process_webhook_batch` task is enqueued as soon as a Webhook's batch is full, and for any remaining partial
+    batches when `flush()` is called.
+    """
+
+    def __init__(self):
+        # {webhook_pk: (webhook, [change, ...])}
+        self.batches = {}
+
+    def add(self, webhook, change):
+        """Add a change, as a dict of `process_webhook` keyword arguments, to the given Webhook's batch."""
+        _, changes = self.batches.setdefault(webhook.pk, (webhook, []))
+        changes.append(change)
+        if len(changes) >= webhook.batch_size:
+            self._enqueue(webhook.pk)
+
+    def flush(self):
+        """Enqueue all remaining partial batches."""
+        for webhook_pk in list(self.batches):
+            self._enqueue(webhook_pk)
+
+    def _enqueue(self, webhook_pk):
+        _, changes = self.batches.pop(webhook_pk)
+        process_webhook_batch.apply_async(args=[webhook_pk, changes])
+
+
+def enqueue_webhooks(object_change, snapshots=None, webhook_queryset=None, webhook_batcher=None):
     """
     Find Webhook(s) assigned to this instance + action and enqueue them to be processed.
 
@@ -14,6 +43,8 @@ def enqueue_webhooks(object_change, snapshots=None, webhook_queryset=None):
         object_change (ObjectChange): The change that may trigger Webhooks to be sent.
         snapshots (list): The before/after data snapshots corresponding to the object_change.
         webhook_queryset (QuerySet): Previously retrieved set of Webhooks to potentially send.
+        webhook_batcher (WebhookBatcher): If provided, changes that trigger Webhooks with a `batch_size` greater than 1
+            are added to their batches rather than being sent individually. The caller must `flush()` it when done.
 
     Returns:
         webhook_queryset (QuerySet): for reuse when processing multiple ObjectChange with the same content-type+action.
@@ -44,6 +75,18 @@ def enqueue_webhooks(object_change, snapshots=None, webhook_queryset=None):
 
         # Enqueue the webhooks
         for webhook in webhook_queryset:
+            if webhook_batcher is not None and webhook.batch_size > 1:
+                change = {
+                    "data": serialized_data,
+                    "model_name": model_name,
+                    "event": object_change.action,
+                    "timestamp": str(timezone.now()),
+                    "username": object_change.user_name,
+                    "request_id": object_change.request_id,
+                    "snapshots": snapshots,
+                }
+                webhook_batcher.add(webhook, change)
+                continue
             args = [
                 webhook.pk,
                 serialized_data,
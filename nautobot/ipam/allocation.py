@@ -0,0 +1,150 @@
+"""
+Helpers for allocating and organizing IP addresses, prefixes and other integer ranges.
+
+All functions in this module operate on inclusive `(first, last)` integer ranges and accept *sorted* iterables of
+used ranges, such as those streamed from the database by `Prefix.get_allocated_ip_ranges()` and
+`Prefix.get_allocated_prefix_ranges()`. They never materialize the full set of used or free values, so memory usage
+is bounded by the number of ranges being actively considered rather than by the size of the containing range.
+"""
+
+import heapq
+
+
+def merge_ranges(ranges):
+    """
+    Merge a sorted iterable of inclusive `(first, last)` ranges, coalescing any that overlap or are adjacent.
+
+    Args:
+        ranges (Iterable[tuple[int, int]]): Ranges sorted by their `first` value.
+
+    Yields:
+        (tuple[int, int]): Non-overlapping, non-adjacent ranges in ascending order.
+    """
+    current_first = current_last = None
+    for first, last in ranges:
+        if current_first is None:
+            current_first, current_last = first, last
+        elif first <= current_last + 1:
+            current_last = max(current_last, last)
+        else:
+            yield current_first, current_last
+            current_first, current_last = first, last
+    if current_first is not None:
+        yield current_first, current_last
+
+
+def iter_free_ranges(first, last, used_ranges):
+    """
+    Yield the inclusive gaps between `first` and `last` that are not covered by any of `used_ranges`.
+
+    Args:
+        first (int): First usable value of the containing range.
+        last (int): Last usable value of the containing range.
+        used_ranges (Iterable[tuple[int, int]]): Used ranges sorted by their `first` value. May overlap or nest.
+
+    Yields:
+        (tuple[int, int]): Free ranges in ascending order.
+    """
+    cursor = first
+    for used_first, used_last in merge_ranges(used_ranges):
+        if used_last < cursor:
+            continue
+        if used_first > last:
+            break
+        if used_first > cursor:
+            yield cursor, min(used_first - 1, last)
+        cursor = used_last + 1
+        if cursor > last:
+            return
+    if cursor <= last:
+        yield cursor, last
+
+
+def iter_free_values(free_ranges):
+    """Yield each individual value within the given free ranges, in order."""
+    for first, last in free_ranges:
+        yield from range(first, last + 1)
+
+
+def find_free_block(free_ranges, size):
+    """
+    Find the first block of `size` values, aligned on a multiple of `size`, that fits entirely within a free range.
+
+    Args:
+        free_ranges (Iterable[tuple[int, int]]): Free ranges in ascending order.
+        size (int): Number of values in the requested block; for CIDR allocation this is a power of two.
+
+    Returns:
+        (int, None): The first value of the block, or None if no such block is available.
+    """
+    for first, last in free_ranges:
+        block_start = -(-first // size) * size  # round up to the next multiple of `size`
+        if block_start + size - 1 <= last:
+            return block_start
+    return None
+
+
+def allocate_free_blocks(first, last, used_ranges, sizes):
+    """
+    Allocate one aligned block per requested size, in order, from the space between `first` and `last`.
+
+    Blocks allocated earlier in the same call are treated as used for the subsequent requests.
+    The database-backed `used_ranges` are re-read for each request, so this accepts a callable returning a
+    fresh sorted iterable rather than a single (consumable) iterator.
+
+    Args:
+        first (int): First usable value of the containing range.
+        last (int): Last usable value of the containing range.
+        used_ranges (Callable[[], Iterable[tuple[int, int]]]): Returns the existing used ranges, sorted.
+        sizes (Iterable[int]): Size of each requested block.
+
+    Returns:
+        (list[int, None]): The first value of each allocated block, or None for each request that could not be met.
+    """
+    allocated = []
+    results = []
+    for size in sizes:
+        pending = sorted(allocated)
+        free_ranges = iter_free_ranges(first, last, heapq.merge(used_ranges(), pending))
+        block_start = find_free_block(free_ranges, size)
+        if block_start is not None:
+            allocated.append((block_start, block_start + size - 1))
+        results.append(block_start)
+    return results
+
+
+def iter_nested_parents(ranges, points=()):
+    """
+    Determine the innermost enclosing range of each of a set of nested ranges and points in a single sorted sweep.
+
+    A stack of the currently "open" ranges is maintained, so memory usage is bounded by the nesting depth.
+
+    Args:
+        ranges (Iterable[tuple[int, int, Any]]): `(first, last, item)` tuples, sorted by `first` ascending and then
+            by size descending (for prefixes, by network and then by prefix length). Ranges must either nest or be
+            disjoint; partially overlapping ranges are not supported.
+        points (Iterable[tuple[int, Any]]): `(value, item)` tuples, sorted by `value`.
+
+    Yields:
+        (tuple[Any, Any]): `(item, parent_item)` for every range and point, where `parent_item` is the item of the
+            innermost range enclosing it (a range is not considered to enclose itself), or None.
+    """
+    stack = []
+    ranges = iter(ranges)
+    points = iter(points)
+    next_range = next(ranges, None)
+    next_point = next(points, None)
+    while next_range is not None or next_point is not None:
+        if next_range is not None and (next_point is None or next_range[0] <= next_point[0]):
+            first, last, item = next_range
+            while stack and stack[-1][0] < first:
+                stack.pop()
+            yield item, stack[-1][1] if stack else None
+            stack.append((last, item))
+            next_range = next(ranges, None)
+        else:
+            value, item = next_point
+            while stack and stack[-1][0] < value:
+                stack.pop()
+            yield item, stack[-1][1] if stack else None
+            next_point = next(points, None)
@@ -1,5 +1,6 @@
 from collections import OrderedDict
 
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 from rest_framework.validators import UniqueTogetherValidator
@@ -203,6 +204,9 @@ class PrefixSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):
         view_name="dcim-api:location-detail",
         write_only=True,
     )
+    utilization = serializers.SerializerMethodField(
+        help_text="Percentage of this prefix's address space that is in use"
+    )
 
     def get_field_names(self, declared_fields, info):
         """Add reverse M2M for VRF's to the fields for this serializer."""
@@ -210,6 +214,14 @@ class PrefixSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):
         self.extend_field_names(field_names, "vrfs")
         return field_names
 
+    @extend_schema_field(serializers.FloatField)
+    def get_utilization(self, obj):
+        # Use the value annotated by `PrefixQuerySet.with_utilization()` where available
+        if hasattr(obj, "utilization"):
+            return obj.utilization
+        numerator, denominator = obj.get_utilization()
+        return numerator * 100 / denominator
+
     class Meta:
         model = Prefix
         fields = "__all__"
@@ -304,6 +316,51 @@ class AvailablePrefixSerializer(serializers.Serializer):
         )
 
 
+class ClosestParentsRequestSerializer(serializers.Serializer):
+    """
+    Input serializer for a POST to /api/ipam/prefixes/closest-parents/.
+    """
+
+    namespace = NautobotHyperlinkedRelatedField(
+        view_name="ipam-api:namespace-detail",
+        queryset=Namespace.objects.all(),
+        required=False,
+        help_text="Namespace to search for parent prefixes. Defaults to the Global namespace.",
+    )
+    addresses = serializers.ListField(child=IPFieldSerializer(), allow_empty=False)
+
+
+class ClosestParentSerializer(serializers.Serializer):
+    """
+    The closest (longest-prefix-match) parent prefix of an IP address, if any.
+
+    Response serializer for a POST to /api/ipam/prefixes/closest-parents/.
+    """
+
+    address = serializers.CharField(read_only=True)
+    prefix = PrefixSerializer(read_only=True, allow_null=True)
+
+
+class PrefixTreeNodeSerializer(serializers.Serializer):
+    """
+    A prefix and its depth within the prefix tree.
+    """
+
+    depth = serializers.IntegerField(read_only=True)
+    prefix = PrefixSerializer(read_only=True)
+
+
+class PrefixTreeSerializer(serializers.Serializer):
+    """
+    A page of the prefix tree, in tree order.
+
+    Response serializer for a GET to /api/ipam/prefixes/tree/.
+    """
+
+    next = serializers.URLField(read_only=True, allow_null=True)
+    results = PrefixTreeNodeSerializer(many=True, read_only=True)
+
+
 #
 # IP addresses
 #
@@ -1,23 +1,28 @@
-from django.conf import settings
-from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 import netaddr
-from rest_framework import status
+from rest_framework import serializers as drf_serializers, status
 from rest_framework.decorators import action
-from rest_framework.exceptions import APIException
+from rest_framework.exceptions import APIException, PermissionDenied
 from rest_framework.response import Response
 from rest_framework.serializers import IntegerField, ListSerializer
+from rest_framework.utils.urls import replace_query_param
 
 from nautobot.core.api.authentication import TokenPermissions
+from nautobot.core.api.views import _bulk_operation_context
 from nautobot.core.constants import MAX_PAGE_SIZE_DEFAULT, PAGINATE_COUNT_DEFAULT
 from nautobot.core.models.querysets import count_related
+from nautobot.core.settings_funcs import is_truthy
 from nautobot.core.utils.config import get_settings_or_config
 from nautobot.dcim.models import Location
 from nautobot.extras.api.views import ModelViewSet, NautobotModelViewSet
 from nautobot.ipam import filters
 from nautobot.ipam.api import serializers
+from nautobot.ipam.context_managers import deferred_reparenting, prefix_allocation_lock
 from nautobot.ipam.models import (
+    get_default_namespace,
     IPAddress,
     IPAddressToInterface,
     Namespace,
@@ -34,6 +39,39 @@ from nautobot.ipam.models import (
     VRFPrefixAssignment,
 )
 
+
+class DeferredReparentingMixin:
+    """
+    Support `?defer_reparenting=true` on bulk (list) create requests.
+
+    When requested, the parent of each created Prefix or IPAddress is not computed as each object is saved; instead
+    the entire Prefix/IPAddress tree of each affected Namespace is recalculated once, before the created objects are
+    checked against the user's permissions, change-logged and serialized.
+    """
+
+    def create(self, request, *args, **kwargs):
+        if not isinstance(request.data, list) or not is_truthy(request.query_params.get("defer_reparenting", "false")):
+            return super().create(request, *args, **kwargs)
+
+        self.logger.info(f"Creating new {self.queryset.model._meta.verbose_name} with deferred reparenting")
+        serializer = self.get_serializer(data=request.data)
+        try:
+            # Deferred change logging must enclose deferred reparenting, so that the ObjectChanges record the parents
+            with _bulk_operation_context():
+                with deferred_reparenting():
+                    serializer.is_valid(raise_exception=True)
+                    instance = serializer.save()
+                # Enforce object-level permissions only once the parents have been calculated
+                self._validate_objects(instance)
+        except ObjectDoesNotExist:
+            raise PermissionDenied()
+        except ValidationError as e:
+            # e.g. an IPAddress with no possible parent Prefix
+            raise drf_serializers.ValidationError(e.message_dict if hasattr(e, "error_dict") else e.messages)
+        headers = self.get_success_headers(serializer.data)
+        return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
+
+
 #
 # Namespace
 #
@@ -108,11 +146,18 @@ class RIRViewSet(NautobotModelViewSet):
     retrieve=extend_schema(responses={"200": serializers.PrefixLegacySerializer}, versions=["2.0", "2.1"]),
     update=extend_schema(responses={"200": serializers.PrefixLegacySerializer}, versions=["2.0", "2.1"]),
 )
-class PrefixViewSet(NautobotModelViewSet):
+class PrefixViewSet(DeferredReparentingMixin, NautobotModelViewSet):
     queryset = Prefix.objects.all()
     serializer_class = serializers.PrefixSerializer
     filterset_class = filters.PrefixFilterSet
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # Calculate the utilization of the retrieved prefixes in the database, which also allows sorting by it
+        if self.action in ("list", "retrieve"):
+            queryset = queryset.with_utilization()
+        return queryset
+
     def get_serializer_class(self):
         if (
             not getattr(self, "swagger_fake_view", False)
@@ -170,6 +215,134 @@ class PrefixViewSet(NautobotModelViewSet):
         except Location.MultipleObjectsReturned as e:
             raise self.LocationIncompatibleLegacyBehavior from e
 
+    class ClosestParentsPermissions(TokenPermissions):
+        """As nautobot.core.api.authentication.TokenPermissions, but a POST only requires `view_prefix` permission."""
+
+        perms_map = {
+            "POST": ["ipam.view_prefix"],
+        }
+
+        def _verify_write_permission(self, request):
+            # This POST only reads data, so is permitted for read-only tokens
+            return True
+
+    @extend_schema(
+        methods=["post"],
+        request=serializers.ClosestParentsRequestSerializer,
+        responses={200: serializers.ClosestParentSerializer(many=True)},
+    )
+    @action(
+        detail=False,
+        name="Closest Parents",
+        url_path="closest-parents",
+        methods=["post"],
+        permission_classes=[ClosestParentsPermissions],
+        filterset_class=None,
+    )
+    def closest_parents(self, request):
+        """
+        A convenience method for looking up the closest (longest-prefix-match) parent prefix of many IP addresses.
+
+        Results are returned in the same order as the requested `addresses`, with a null `prefix` for any address
+        that is not contained in any prefix in the given namespace.
+        """
+        request_serializer = serializers.ClosestParentsRequestSerializer(
+            data=request.data, context={"request": request}
+        )
+        request_serializer.is_valid(raise_exception=True)
+        namespace = request_serializer.validated_data.get("namespace") or get_default_namespace()
+        addresses = [address.ip for address in request_serializer.validated_data["addresses"]]
+
+        prefixes = Prefix.objects.restrict(request.user, "view").filter(namespace=namespace)
+        parents = prefixes.get_closest_parents(addresses)
+        serializer = serializers.ClosestParentSerializer(
+            [{"address": str(address), "prefix": parent} for address, parent in zip(addresses, parents)],
+            many=True,
+            context=self.get_serializer_context(),
+        )
+        return Response(serializer.data)
+
+    @extend_schema(
+        methods=["get"],
+        parameters=[
+            OpenApiParameter(
+                name="namespace",
+                location="query",
+                description="Namespace whose prefix tree to retrieve. Defaults to the Global namespace.",
+                type={"type": "string", "format": "uuid"},
+            ),
+            OpenApiParameter(
+                name="parent",
+                location="query",
+                description="Retrieve only the descendants of this prefix.",
+                type={"type": "string", "format": "uuid"},
+            ),
+            OpenApiParameter(
+                name="max_depth",
+                location="query",
+                description="Exclude prefixes more than this many levels below the top of the tree.",
+                type=int,
+            ),
+            OpenApiParameter(
+                name="cursor",
+                location="query",
+                description="Retrieve the prefixes following this prefix in the tree. Use the returned `next` URL.",
+                type=str,
+            ),
+        ],
+        responses={200: serializers.PrefixTreeSerializer},
+    )
+    @action(detail=False, name="Prefix Tree", url_path="tree", methods=["get"], filterset_class=None)
+    def tree(self, request):
+        """
+        A convenience method for retrieving the prefix tree of a namespace (or of a single prefix), in tree order.
+
+        Each prefix is returned with its `depth` below the top of the requested tree. Results are retrieved a page
+        at a time (up to `limit` prefixes, by default PAGINATE_COUNT); follow the `next` URL to retrieve the next page.
+        Using `parent` and `max_depth=0` retrieves only the children of a given prefix, for lazily expanding the tree.
+        """
+        namespace = parent = None
+        try:
+            if "parent" in request.query_params:
+                parent = get_object_or_404(self.queryset, pk=request.query_params["parent"])
+            elif "namespace" in request.query_params:
+                namespace = get_object_or_404(
+                    Namespace.objects.restrict(request.user, "view"), pk=request.query_params["namespace"]
+                )
+            else:
+                namespace = get_default_namespace()
+            max_depth = request.query_params.get("max_depth")
+            max_depth = int(max_depth) if max_depth not in (None, "") else None
+            limit = int(
+                request.query_params.get(
+                    "limit", get_settings_or_config("PAGINATE_COUNT", fallback=PAGINATE_COUNT_DEFAULT)
+                )
+            )
+        except (TypeError, ValueError, ValidationError) as e:
+            return Response({"detail": f"Invalid query parameter: {e}"}, status=status.HTTP_400_BAD_REQUEST)
+        if get_settings_or_config("MAX_PAGE_SIZE", fallback=MAX_PAGE_SIZE_DEFAULT):
+            limit = min(limit, get_settings_or_config("MAX_PAGE_SIZE", fallback=MAX_PAGE_SIZE_DEFAULT))
+
+        try:
+            tree, next_cursor = self.get_queryset().get_tree(
+                namespace=namespace,
+                parent=parent,
+                max_depth=max_depth,
+                after=request.query_params.get("cursor"),
+                limit=max(limit, 1),
+            )
+        except ValidationError as e:
+            return Response({"detail": f"Invalid query parameter: {e}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        next_url = None
+        if next_cursor is not None:
+            next_url = replace_query_param(request.build_absolute_uri(), "cursor", next_cursor)
+        serializer = serializers.PrefixTreeSerializer(
+            {"next": next_url, "results": [{"depth": depth, "prefix": prefix} for prefix, depth in tree]},
+            context=self.get_serializer_context(),
+        )
+        return Response(serializer.data)
+
     @extend_schema(methods=["get"], responses={200: serializers.AvailablePrefixSerializer(many=True)})
     @extend_schema(
         methods=["post"],
@@ -187,16 +360,12 @@ class PrefixViewSet(NautobotModelViewSet):
         """
         A convenience method for listing and/or allocating available child prefixes within a parent.
 
-        This uses a Redis lock to prevent this API from being invoked in parallel, in order to avoid a race condition
+        Allocation is serialized per parent prefix by `prefix_allocation_lock()`, in order to avoid a race condition
         if multiple clients tried to simultaneously request allocation from the same parent prefix.
         """
         prefix = get_object_or_404(self.queryset, pk=pk)
         if request.method == "POST":
-            with cache.lock(
-                "nautobot.ipam.api.views.available_prefixes", blocking_timeout=5, timeout=settings.REDIS_LOCK_TIMEOUT
-            ):
-                available_prefixes = prefix.get_available_prefixes()
-
+            with prefix_allocation_lock(prefix):
                 # Validate Requested Prefixes' length
                 requested_prefixes = request.data if isinstance(request.data, list) else [request.data]
                 for requested_prefix in requested_prefixes:
@@ -207,19 +376,22 @@ class PrefixViewSet(NautobotModelViewSet):
                             {"prefix_length": "This field must be an integer."},
                             status=status.HTTP_400_BAD_REQUEST,
                         )
-                    for available_prefix in available_prefixes.iter_cidrs():
-                        if requested_prefix["prefix_length"] >= available_prefix.prefixlen:
-                            allocated_prefix = f"{available_prefix.network}/{requested_prefix['prefix_length']}"
-                            requested_prefix["prefix"] = allocated_prefix
-                            requested_prefix["namespace"] = prefix.namespace
-                            break
-                    else:
+
+                # Find the lowest available space for each requested prefix, without overlapping one another
+                try:
+                    allocated_prefixes = prefix.get_next_available_prefixes(
+                        requested_prefix["prefix_length"] for requested_prefix in requested_prefixes
+                    )
+                except ValidationError as e:
+                    return Response(e.message_dict, status=status.HTTP_400_BAD_REQUEST)
+                for requested_prefix, allocated_prefix in zip(requested_prefixes, allocated_prefixes):
+                    if allocated_prefix is None:
                         return Response(
                             {"detail": "Insufficient space is available to accommodate the requested prefix size(s)"},
                             status=status.HTTP_204_NO_CONTENT,
                         )
-                    # Remove the allocated prefix from the list of available prefixes
-                    available_prefixes.remove(allocated_prefix)
+                    requested_prefix["prefix"] = str(allocated_prefix)
+                    requested_prefix["namespace"] = prefix.namespace
 
                 # Initialize the serializer with a list or a single object depending on what was requested
                 context = {"request": request, "depth": 0}
@@ -235,9 +407,8 @@ class PrefixViewSet(NautobotModelViewSet):
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
 
         else:
-            available_prefixes = prefix.get_available_prefixes()
             serializer = serializers.AvailablePrefixSerializer(
-                available_prefixes.iter_cidrs(),
+                list(prefix.iter_available_prefixes()),
                 many=True,
                 context={
                     "request": request,
@@ -294,7 +465,7 @@ class PrefixViewSet(NautobotModelViewSet):
         By default, the number of IPs returned will be equivalent to PAGINATE_COUNT.
         An arbitrary limit (up to MAX_PAGE_SIZE, if set) may be passed, however results will not be paginated.
 
-        This uses a Redis lock to prevent this API from being invoked in parallel, in order to avoid a race condition
+        Allocation is serialized per parent prefix by `prefix_allocation_lock()`, in order to avoid a race condition
         if multiple clients tried to simultaneously request allocation from the same parent prefix.
         """
         prefix = get_object_or_404(Prefix.objects.restrict(request.user), pk=pk)
@@ -307,28 +478,23 @@ class PrefixViewSet(NautobotModelViewSet):
         if response := error_response_start or error_response_end:
             return response
 
-        available_ips = prefix.get_available_ips()
-        # range_start and range_end are inclusive
-        if range_start > default_first:
-            available_ips.remove(netaddr.IPRange(default_first, range_start - 1))
-        if range_end < default_last:
-            available_ips.remove(netaddr.IPRange(range_end + 1, default_last))
-
         # Create the next available IP within the prefix
         if request.method == "POST":
-            with cache.lock(
-                "nautobot.ipam.api.views.available_ips", blocking_timeout=5, timeout=settings.REDIS_LOCK_TIMEOUT
-            ):
+            with prefix_allocation_lock(prefix):
                 # Normalize to a list of objects
                 requested_ips = request.data if isinstance(request.data, list) else [request.data]
 
                 # Determine if the requested number of IPs is available
-                if available_ips.size < len(requested_ips):
+                # range_start and range_end are inclusive
+                available_ips = prefix.get_first_available_ips(
+                    count=len(requested_ips), range_start=range_start, range_end=range_end
+                )
+                if len(available_ips) < len(requested_ips):
                     return Response(
                         {
                             "detail": (
                                 f"An insufficient number of IP addresses are available within the prefix {prefix} "
-                                f"({len(requested_ips)} requested, {available_ips.size} available between "
+                                f"({len(requested_ips)} requested, {len(available_ips)} available between "
                                 f"{range_start} and {range_end})."
                             )
                         },
@@ -337,9 +503,8 @@ class PrefixViewSet(NautobotModelViewSet):
 
                 # Assign addresses from the list of available IPs and copy Namespace assignment from the parent Prefix
                 prefix_length = prefix.prefix.prefixlen
-                available_ips_iter = iter(available_ips)
-                for requested_ip in requested_ips:
-                    requested_ip["address"] = f"{next(available_ips_iter)}/{prefix_length}"
+                for requested_ip, available_ip in zip(requested_ips, available_ips):
+                    requested_ip["address"] = f"{available_ip}/{prefix_length}"
                     requested_ip["namespace"] = prefix.namespace
 
                 # Initialize the serializer with a list or a single object depending on what was requested
@@ -369,11 +534,7 @@ class PrefixViewSet(NautobotModelViewSet):
                 limit = min(limit, get_settings_or_config("MAX_PAGE_SIZE", fallback=MAX_PAGE_SIZE_DEFAULT))
 
             # Calculate available IPs within the prefix
-            ip_list = []
-            for index, ip in enumerate(available_ips, start=1):
-                ip_list.append(ip)
-                if index == limit:
-                    break
+            ip_list = prefix.get_first_available_ips(count=limit, range_start=range_start, range_end=range_end)
             serializer = serializers.AvailableIPSerializer(
                 ip_list,
                 many=True,
@@ -397,7 +558,7 @@ class PrefixLocationAssignmentViewSet(ModelViewSet):
 #
 
 
-class IPAddressViewSet(NautobotModelViewSet):
+class IPAddressViewSet(DeferredReparentingMixin, NautobotModelViewSet):
     queryset = IPAddress.objects.select_related("parent__namespace")
     serializer_class = serializers.IPAddressSerializer
     filterset_class = filters.IPAddressFilterSet
@@ -457,47 +618,54 @@ class VLANGroupViewSet(NautobotModelViewSet):
     )
     def available_vlans(self, request, pk=None):
         """
-        A convenience method for listing available VLAN IDs within a VLANGroup.
+        A convenience method for listing and/or allocating available VLAN IDs within a VLANGroup.
         By default, the number of VIDs returned will be equivalent to PAGINATE_COUNT.
         An arbitrary limit (up to MAX_PAGE_SIZE, if set) may be passed, however results will not be paginated.
+
+        Allocation locks the VLANGroup's database row, so that concurrent requests to allocate VLANs from the same
+        VLANGroup cannot be assigned the same VLAN IDs.
         """
         vlan_group = get_object_or_404(self.vlan_group_queryset().restrict(user=request.user), pk=pk)
 
         if request.method == "POST":
-            with cache.lock(
-                "nautobot.ipam.api.views.available_vlans", blocking_timeout=5, timeout=settings.REDIS_LOCK_TIMEOUT
-            ):
+            # Lock the VLANGroup's database row for the duration of the transaction, so that concurrent allocations
+            # from the same VLANGroup are serialized and cannot be assigned the same VLAN IDs.
+            with transaction.atomic():
+                list(VLANGroup.objects.select_for_update().filter(pk=vlan_group.pk).values_list("pk", flat=True))
+
                 # Normalize to a list of objects
                 requested_vlans = request.data if isinstance(request.data, list) else [request.data]
 
                 # Determine if the requested number of VLANs is available
-                available_vids = vlan_group.available_vids
-                if len(available_vids) < len(requested_vlans):
+                available_count = sum(last - first + 1 for first, last in vlan_group.iter_available_vid_ranges())
+                if available_count < len(requested_vlans):
                     return Response(
                         {
                             "detail": (
                                 f"An insufficient number of VLANs are available within the VLANGroup {vlan_group} "
-                                f"({len(requested_vlans)} requested, {len(available_vids)} available)"
+                                f"({len(requested_vlans)} requested, {available_count} available)"
                             )
                         },
                         status=status.HTTP_204_NO_CONTENT,
                     )
 
-                # Prioritise and check for explicitly requested VIDs. Remove them from available_vids
-                for requested_vlan in requested_vlans:
-                    # Check requested `vid` for availability.
-                    # This will also catch if same `vid` was requested multiple times in a request.
-                    if "vid" in requested_vlan and requested_vlan["vid"] not in available_vids:
+                # Prioritise and check for explicitly requested VIDs.
+                # This will also catch if same `vid` was requested multiple times in a request.
+                explicit_vids = [requested_vlan["vid"] for requested_vlan in requested_vlans if "vid" in requested_vlan]
+                valid_explicit_vids = [vid for vid in explicit_vids if isinstance(vid, int)]
+                used_vids = set(vlan_group.vlans.filter(vid__in=valid_explicit_vids).values_list("vid", flat=True))
+                for vid in explicit_vids:
+                    if not isinstance(vid, int) or vid in used_vids or not vlan_group.vid_in_range(vid):
                         return Response(
-                            {"detail": f"VLAN {requested_vlan['vid']} is not available within the VLANGroup."},
+                            {"detail": f"VLAN {vid} is not available within the VLANGroup."},
                             status=status.HTTP_204_NO_CONTENT,
                         )
-                    elif "vid" in requested_vlan and requested_vlan["vid"] in available_vids:
-                        available_vids.remove(requested_vlan["vid"])
+                    used_vids.add(vid)
 
-                # Assign VLAN IDs from the list of VLANGroup's available VLAN IDs.
-                # Available_vids now does not contain explicitly requested vids.
-                _available_vids = iter(available_vids)
+                # Assign the lowest available VLAN IDs, other than the explicitly requested ones, to the other VLANs
+                _available_vids = iter(
+                    vlan_group.get_next_available_vids(len(requested_vlans) - len(explicit_vids), exclude=explicit_vids)
+                )
 
                 for requested_vlan in requested_vlans:
                     if "vid" not in requested_vlan:
@@ -564,7 +732,7 @@ class VLANGroupViewSet(NautobotModelViewSet):
                 limit = min(limit, get_settings_or_config("MAX_PAGE_SIZE", fallback=MAX_PAGE_SIZE_DEFAULT))
 
             if isinstance(limit, int) and limit >= 0:
-                vids = vlan_group.available_vids[0:limit]
+                vids = vlan_group.get_next_available_vids(limit)
             else:
                 vids = vlan_group.available_vids
 
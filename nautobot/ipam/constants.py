@@ -34,6 +34,8 @@ PREFIX_ALLOWED_CHILD_TYPES = {
     PrefixTypeChoices.TYPE_NETWORK: [PrefixTypeChoices.TYPE_POOL],
     PrefixTypeChoices.TYPE_POOL: [],
 }
+# Number of rows fetched per round trip when streaming used ranges for available IP/prefix calculation
+ALLOCATION_QUERY_CHUNK_SIZE = 2000
 
 
 #
@@ -0,0 +1,224 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+import contextvars
+
+from django.conf import settings
+from django.db import connections, router, transaction
+import netaddr
+
+deferred_reparenting_state = contextvars.ContextVar("deferred_reparenting_state", default=None)
+closest_parent_cache_state = contextvars.ContextVar("closest_parent_cache_state", default=None)
+
+
+class DeferredReparenting:
+    """
+    Record of the Prefix and IPAddress objects saved while `deferred_reparenting()` is active.
+
+    Rather than each `Prefix.save()` re-parenting its subnets and IPs, and each `IPAddress.save()` looking up its
+    closest parent Prefix, the affected Namespaces are recorded here and their entire Prefix/IPAddress tree is
+    recalculated once, in a single sorted sweep per Namespace, by `flush()`.
+    """
+
+    def __init__(self):
+        # {namespace_id: [Prefix, ...]}
+        self.prefixes = {}
+        # {namespace_id: [IPAddress, ...]}
+        self.ip_addresses = {}
+
+    def add_prefix(self, prefix, previous_namespace_id=None):
+        self.prefixes.setdefault(prefix.namespace_id, []).append(prefix)
+        # A Prefix moved from another Namespace leaves behind children there that must be reparented as well
+        if previous_namespace_id is not None:
+            self.prefixes.setdefault(previous_namespace_id, [])
+
+    def add_ip_address(self, ip_address, namespace):
+        self.ip_addresses.setdefault(namespace.pk, []).append(ip_address)
+
+    def flush(self, batch_size=1000):
+        """
+        Recalculate the parents of all Prefixes and IPAddresses in each affected Namespace.
+
+        If `settings.PREFIX_UTILIZATION_CACHE_ENABLED` is True, also update the stored utilization of those Prefixes.
+        """
+        from nautobot.ipam.models import Namespace  # avoid circular import
+
+        namespace_ids = set(self.prefixes) | set(self.ip_addresses)
+        for namespace in Namespace.objects.filter(pk__in=namespace_ids):
+            namespace.reparent_prefixes_and_ips(
+                prefixes=self.prefixes.get(namespace.pk, []),
+                ip_addresses=self.ip_addresses.get(namespace.pk, []),
+                batch_size=batch_size,
+            )
+            if settings.PREFIX_UTILIZATION_CACHE_ENABLED:
+                namespace.prefixes.update_utilization(batch_size=batch_size)
+        self.prefixes = {}
+        self.ip_addresses = {}
+
+
+def is_reparenting_deferred():
+    """Return True if `deferred_reparenting()` is currently active."""
+    return deferred_reparenting_state.get() is not None
+
+
+@contextmanager
+def deferred_reparenting(batch_size=1000):
+    """
+    Defer the calculation of Prefix and IPAddress parents until the end of the context manager to improve the
+    performance of bulk imports. This context manager is wrapped in an atomic transaction.
+
+    Prefixes and IPAddresses saved inside this context manager are initially written with their `parent` unset;
+    on exit, the parent of every Prefix and IPAddress in each affected Namespace is recalculated in a single pass and
+    written back with `bulk_update()`. The in-memory instances that were saved are updated to match.
+
+    Note that any change logging performed while the context manager is active will record the unset `parent`,
+    unless change logging is also deferred via `deferred_change_logging_for_bulk_operation()` *outside* of this
+    context manager.
+
+    Example usage:
+
+    >>> from nautobot.ipam.context_managers import deferred_reparenting
+    >>> with deferred_reparenting():
+    ...     for cidr in cidrs:
+    ...         Prefix.objects.create(prefix=cidr, namespace=namespace, status=status)
+
+    Raises:
+        ValidationError: if any IPAddress saved inside the context manager has no possible parent Prefix.
+    """
+    if is_reparenting_deferred():
+        # Already deferred by an enclosing context manager, which will handle the reparenting
+        yield
+        return
+
+    with transaction.atomic():
+        state = DeferredReparenting()
+        token = deferred_reparenting_state.set(state)
+        try:
+            yield
+        finally:
+            deferred_reparenting_state.reset(token)
+        state.flush(batch_size=batch_size)
+
+
+class ClosestParentCache:
+    """
+    Bounded LRU cache of leaf Prefixes recently resolved as the closest parent of an IPAddress.
+
+    A Prefix with no child Prefixes is necessarily the closest parent of every IP address within it, so once such a
+    Prefix has been looked up for one IPAddress, the parent of any other IPAddress within it can be found by probing
+    this cache for each possible (namespace, network, prefix_length) containing its host, without querying the database.
+    Entries for a Namespace are discarded whenever a Prefix in that Namespace is saved or deleted.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        # {(namespace_id, ip_version, network, prefix_length): Prefix}, least recently used first
+        self.prefixes = OrderedDict()
+
+    def get(self, namespace_id, host):
+        """Return the cached closest parent Prefix of `host` in the given Namespace, or None if not cached."""
+        ip = netaddr.IPAddress(str(host))
+        max_length = 32 if ip.version == 4 else 128
+        for prefix_length in range(max_length, -1, -1):
+            host_bits = max_length - prefix_length
+            key = (namespace_id, ip.version, ip.value >> host_bits << host_bits, prefix_length)
+            if key in self.prefixes:
+                self.prefixes.move_to_end(key)
+                return self.prefixes[key]
+        return None
+
+    def add(self, prefix):
+        """
+        Cache the given closest parent Prefix, if it has no child Prefixes.
+
+        If the Prefix was retrieved with a `has_children` annotation, that is used rather than querying its children.
+        """
+        has_children = getattr(prefix, "has_children", None)
+        if has_children is None:
+            has_children = prefix.children.exists()
+        if has_children:
+            return
+        key = (prefix.namespace_id, prefix.ip_version, int(netaddr.IPAddress(prefix.network)), prefix.prefix_length)
+        self.prefixes[key] = prefix
+        self.prefixes.move_to_end(key)
+        while len(self.prefixes) > self.maxsize:
+            self.prefixes.popitem(last=False)
+
+    def invalidate(self, namespace_id):
+        """Discard all cached Prefixes in the given Namespace."""
+        for key in [key for key in self.prefixes if key[0] == namespace_id]:
+            del self.prefixes[key]
+
+
+@contextmanager
+def cached_closest_parents(maxsize=1024):
+    """
+    Cache the closest parent Prefixes looked up when saving IPAddresses, to improve the performance of scripts and
+    Jobs that create many IP addresses in the same Prefixes. This is enabled automatically for each web request and Job.
+
+    The cache is invalidated when a Prefix is saved or deleted, but not by operations that bypass model signals,
+    such as `QuerySet.update()` and (outside of `deferred_reparenting()`) `Prefix.objects.bulk_create()`.
+
+    Example usage:
+
+    >>> from nautobot.ipam.context_managers import cached_closest_parents
+    >>> with cached_closest_parents():
+    ...     for address in addresses:
+    ...         IPAddress.objects.create(address=address, namespace=namespace, status=status)
+    """
+    if closest_parent_cache_state.get() is not None:
+        # Already cached by an enclosing context manager
+        yield
+        return
+
+    token = closest_parent_cache_state.set(ClosestParentCache(maxsize=maxsize))
+    try:
+        yield
+    finally:
+        closest_parent_cache_state.reset(token)
+
+
+def _advisory_lock_key(pk):
+    """Derive a signed 64-bit PostgreSQL advisory lock key from the given UUID primary key."""
+    return int.from_bytes(pk.bytes[:8], "big", signed=True)
+
+
+@contextmanager
+def prefix_allocation_lock(prefix):
+    """
+    Serialize the allocation of child IP addresses and Prefixes from the given Prefix. This context manager is wrapped
+    in an atomic transaction, and the lock is held until that transaction ends.
+
+    On PostgreSQL, a transaction-level advisory lock is taken on the Prefix, along with a shared advisory lock on each
+    of its ancestors. Concurrent allocations from the same Prefix, or from a Prefix and one of its ancestors (which
+    could otherwise select the same free address), therefore wait for one another, while allocations from unrelated
+    or sibling Prefixes proceed in parallel. On other databases, the rows of the Prefix and its ancestors are locked
+    with `SELECT ... FOR UPDATE` instead, which also serializes allocations from sibling Prefixes.
+
+    Example usage:
+
+    >>> from nautobot.ipam.context_managers import prefix_allocation_lock
+    >>> with prefix_allocation_lock(prefix):
+    ...     address = prefix.get_first_available_ip()
+    ...     IPAddress.objects.create(address=address, namespace=prefix.namespace, status=status)
+    """
+    from nautobot.ipam.models import Prefix  # avoid circular import
+
+    using = router.db_for_write(Prefix)
+    with transaction.atomic(using=using):
+        # Always acquire locks from the largest to the smallest Prefix, so that allocators cannot deadlock one another
+        ancestor_pks = list(prefix.ancestors().values_list("pk", flat=True))
+        connection = connections[using]
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                for ancestor_pk in ancestor_pks:
+                    cursor.execute("SELECT pg_advisory_xact_lock_shared(%s)", [_advisory_lock_key(ancestor_pk)])
+                cursor.execute("SELECT pg_advisory_xact_lock(%s)", [_advisory_lock_key(prefix.pk)])
+        else:
+            list(
+                Prefix.objects.using(using)
+                .select_for_update()
+                .filter(pk__in=[*ancestor_pks, prefix.pk])
+                .order_by("prefix_length")
+                .values_list("pk", flat=True)
+            )
+        yield
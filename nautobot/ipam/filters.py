@@ -333,6 +333,16 @@ class PrefixFilterSet(
         to_field_name="name",
         label="Cloud Network (name or ID)",
     )
+    utilization__gte = django_filters.NumberFilter(
+        field_name="utilization__gte",
+        method="filter_utilization",
+        label="Utilization (%) greater than or equal to",
+    )
+    utilization__lte = django_filters.NumberFilter(
+        field_name="utilization__lte",
+        method="filter_utilization",
+        label="Utilization (%) less than or equal to",
+    )
 
     class Meta:
         model = Prefix
@@ -376,6 +386,9 @@ class PrefixFilterSet(
             prefixes_queryset |= queryset.filter(query)
         return prefixes_queryset
 
+    def filter_utilization(self, queryset, name, value):
+        return queryset.with_utilization().filter(**{name: value})
+
     def generate_query_filter_present_in_vrf(self, value):
         if isinstance(value, (str, uuid.UUID)):
             value = VRF.objects.get(pk=value)
@@ -1,5 +1,5 @@
 from django.db import connection as _connection, NotSupportedError
-from django.db.models import Lookup, lookups
+from django.db.models import Func, GenericIPAddressField, Lookup, lookups
 import netaddr
 
 
@@ -318,3 +318,58 @@ class NetFamily(Lookup):
         lhs, lhs_params = self.process_lhs(compiler, connection)
         rhs, rhs_params = self.process_rhs(compiler, connection)
         return f"{lhs} = {rhs}", lhs_params + rhs_params
+
+
+#
+# PostgreSQL `inet` containment lookups
+#
+# These are used by `BaseNetworkQuerySet` subclasses in place of range comparisons on `network`/`broadcast`/`host`
+# when `settings.POSTGRESQL_INET_LOOKUPS_ENABLED` is True. The `nautobot_varbinary_to_inet()` database function and
+# the GiST indexes on the same expressions are created by migration `ipam.0054_postgresql_inet_indexes`; the
+# expressions below must match those index expressions exactly for the indexes to be used.
+#
+
+
+class VarbinaryToInet(Func):
+    """Convert a `VarbinaryIPField` to a PostgreSQL `inet` host address."""
+
+    function = "nautobot_varbinary_to_inet"
+    output_field = GenericIPAddressField()
+
+
+class PrefixToInet(Func):
+    """Convert a Prefix's `network` and `prefix_length` to a PostgreSQL `inet` network."""
+
+    function = "set_masklen"
+    output_field = GenericIPAddressField()
+
+    def __init__(self, network="network", prefix_length="prefix_length", **extra):
+        super().__init__(VarbinaryToInet(network), prefix_length, **extra)
+
+
+class InetLookup(Lookup):
+    """Base class for lookups comparing an `inet` expression with a network given as a string in CIDR notation."""
+
+    operator = None
+    prepare_rhs = False
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} {self.operator} {rhs}::inet", lhs_params + rhs_params
+
+
+class InetContainedBy(InetLookup):
+    operator = "<<"
+
+
+class InetContainedByOrEqual(InetLookup):
+    operator = "<<="
+
+
+class InetContains(InetLookup):
+    operator = ">>"
+
+
+class InetContainsOrEqual(InetLookup):
+    operator = ">>="
@@ -0,0 +1,78 @@
+from concurrent.futures import ThreadPoolExecutor
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+import netaddr
+
+from nautobot.extras.models import Status
+from nautobot.ipam.context_managers import prefix_allocation_lock
+from nautobot.ipam.models import IPAddress, Namespace, Prefix
+
+
+class Command(BaseCommand):
+    help = """Measure the throughput of concurrent "next available IP" allocations.
+
+    A temporary Namespace and Prefix are created, the requested number of IP addresses are allocated from that Prefix
+    by parallel workers in the same way as the `/api/ipam/prefixes/{id}/available-ips/` endpoint, and the temporary
+    objects are deleted again afterwards. Run this against a non-production database."""
+
+    def add_arguments(self, parser):
+        parser.add_argument("--prefix", default="10.0.0.0/16", help="Prefix to allocate IP addresses from.")
+        parser.add_argument("--workers", type=int, default=8, help="Number of concurrent allocating workers.")
+        parser.add_argument(
+            "--allocations", type=int, default=1000, help="Total number of allocation requests to perform."
+        )
+        parser.add_argument("--batch-size", type=int, default=1, help="Number of IP addresses per allocation request.")
+
+    def handle(self, *args, **options):
+        try:
+            network = netaddr.IPNetwork(options["prefix"]).cidr
+        except (netaddr.AddrFormatError, ValueError) as exc:
+            raise CommandError(f"Invalid prefix {options['prefix']!r}: {exc}")
+        if options["allocations"] * options["batch_size"] > network.size:
+            raise CommandError(f"Prefix {network} is too small for the requested number of IP addresses.")
+
+        prefix_status = Status.objects.get_for_model(Prefix).first()
+        ip_status = Status.objects.get_for_model(IPAddress).first()
+        if prefix_status is None or ip_status is None:
+            raise CommandError("No Status is available for Prefixes and/or IP addresses.")
+
+        namespace = Namespace.objects.create(name=f"IP allocation benchmark {uuid.uuid4()}")
+        try:
+            prefix = Prefix.objects.create(prefix=str(network), namespace=namespace, status=prefix_status)
+            self.stdout.write(
+                f"Allocating {options['allocations']} x {options['batch_size']} IP address(es) from {prefix} "
+                f"with {options['workers']} worker(s)..."
+            )
+
+            def allocate(_):
+                try:
+                    with prefix_allocation_lock(prefix):
+                        for address in prefix.get_first_available_ips(count=options["batch_size"]):
+                            IPAddress.objects.create(
+                                address=f"{address}/{prefix.prefix_length}", namespace=namespace, status=ip_status
+                            )
+                finally:
+                    # Each worker thread uses its own database connection, which is not closed automatically
+                    connection.close()
+
+            start = time.monotonic()
+            with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+                list(executor.map(allocate, range(options["allocations"])))
+            elapsed = time.monotonic() - start
+
+            hosts = list(prefix.get_all_ips().values_list("host", flat=True))
+            duplicates = len(hosts) - len(set(hosts))
+            self.stdout.write(
+                f"Allocated {len(hosts)} IP addresses in {elapsed:.2f} seconds: "
+                f"{options['allocations'] / elapsed:.1f} allocations/second, {len(hosts) / elapsed:.1f} IPs/second"
+            )
+            if duplicates:
+                raise CommandError(f"{duplicates} duplicate IP addresses were allocated!")
+            self.stdout.write(self.style.SUCCESS("No duplicate IP addresses were allocated."))
+        finally:
+            IPAddress.objects.filter(parent__namespace=namespace).delete()
+            Prefix.objects.filter(namespace=namespace).delete()
+            namespace.delete()
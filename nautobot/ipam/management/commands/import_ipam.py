@@ -0,0 +1,79 @@
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+import netaddr
+
+from nautobot.extras.models import Status
+from nautobot.ipam.context_managers import deferred_reparenting
+from nautobot.ipam.models import get_default_namespace, IPAddress, Namespace, Prefix
+
+
+class Command(BaseCommand):
+    help = """Bulk import Prefixes and/or IP addresses from text files, calculating their parents in a single pass.
+
+    Each file should contain one prefix or address (in CIDR notation) per line; blank lines and lines beginning with
+    "#" are ignored. Objects are inserted with `bulk_create()` and no change logging is performed."""
+
+    def add_arguments(self, parser):
+        parser.add_argument("--prefixes", help="Path to a file of prefixes to import.")
+        parser.add_argument("--ip-addresses", help="Path to a file of IP addresses to import.")
+        parser.add_argument(
+            "--namespace", help="Name of the Namespace to import into. Defaults to the Global namespace."
+        )
+        parser.add_argument("--status", default="Active", help='Name of the Status to assign. Defaults to "Active".')
+        parser.add_argument("--batch-size", type=int, default=1000, help="Number of objects to create per query.")
+
+    @staticmethod
+    def _read_lines(path):
+        with open(path, "r") as fh:
+            for line in fh:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    yield line
+
+    def handle(self, *args, **options):
+        if not options["prefixes"] and not options["ip_addresses"]:
+            raise CommandError("At least one of --prefixes or --ip-addresses must be specified.")
+
+        if options["namespace"]:
+            try:
+                namespace = Namespace.objects.get(name=options["namespace"])
+            except Namespace.DoesNotExist as err:
+                raise CommandError(f'Namespace "{options["namespace"]}" does not exist.') from err
+        else:
+            namespace = get_default_namespace()
+
+        batch_size = options["batch_size"]
+        try:
+            with deferred_reparenting(batch_size=batch_size):
+                if options["prefixes"]:
+                    status = self._get_status(options["status"], Prefix)
+                    prefixes = [
+                        Prefix(prefix=netaddr.IPNetwork(line).cidr, namespace=namespace, status=status)
+                        for line in self._read_lines(options["prefixes"])
+                    ]
+                    Prefix.objects.bulk_create(prefixes, batch_size=batch_size)
+                    self.stdout.write(f"Created {len(prefixes)} prefixes")
+
+                if options["ip_addresses"]:
+                    status = self._get_status(options["status"], IPAddress)
+                    ip_addresses = [
+                        IPAddress(address=netaddr.IPNetwork(line), namespace=namespace, status=status)
+                        for line in self._read_lines(options["ip_addresses"])
+                    ]
+                    IPAddress.objects.bulk_create(ip_addresses, batch_size=batch_size)
+                    self.stdout.write(f"Created {len(ip_addresses)} IP addresses")
+        except (netaddr.AddrFormatError, ValueError) as err:
+            raise CommandError(f"Invalid prefix or address: {err}") from err
+        except ValidationError as err:
+            raise CommandError(f"Import failed and was rolled back: {err}") from err
+
+        self.stdout.write(self.style.SUCCESS(f"Calculated parents of all Prefixes and IP addresses in {namespace}"))
+
+    @staticmethod
+    def _get_status(name, model):
+        try:
+            return Status.objects.get_for_model(model).get(name=name)
+        except Status.DoesNotExist as err:
+            raise CommandError(
+                f'Status "{name}" does not exist or is not valid for {model._meta.verbose_name}.'
+            ) from err
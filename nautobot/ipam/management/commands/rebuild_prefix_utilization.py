@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from nautobot.ipam.models import Namespace, Prefix
+
+
+class Command(BaseCommand):
+    help = """Recalculate and store the utilization of all Prefixes.
+
+    This populates the stored utilization used when `PREFIX_UTILIZATION_CACHE_ENABLED` is set to True, and should be
+    run after first enabling that setting and after any bulk changes that bypass model signals."""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--namespace", help="Name of a Namespace to limit the rebuild to. Defaults to all Namespaces."
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="Number of prefixes to calculate and update at a time."
+        )
+
+    def handle(self, *args, **options):
+        if not settings.PREFIX_UTILIZATION_CACHE_ENABLED:
+            self.stdout.write(
+                self.style.WARNING(
+                    "PREFIX_UTILIZATION_CACHE_ENABLED is not set to True, so the stored utilization will not be "
+                    "used or kept up to date."
+                )
+            )
+
+        namespaces = Namespace.objects.all()
+        if options["namespace"]:
+            namespaces = namespaces.filter(name=options["namespace"])
+            if not namespaces.exists():
+                raise CommandError(f'Namespace "{options["namespace"]}" does not exist.')
+
+        for namespace in namespaces:
+            count = Prefix.objects.filter(namespace=namespace).update_utilization(batch_size=options["batch_size"])
+            self.stdout.write(f"Updated the utilization of {count} prefixes in namespace {namespace}")
+        self.stdout.write(self.style.SUCCESS("Prefix utilization rebuild complete."))
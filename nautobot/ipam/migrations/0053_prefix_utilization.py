@@ -0,0 +1,36 @@
+# Generated by Django 4.2.22 on 2025-07-28 14:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ipam", "0052_alter_ipaddress_index_together_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="prefix",
+            name="utilization_denominator",
+            field=models.DecimalField(
+                blank=True,
+                decimal_places=0,
+                editable=False,
+                help_text="Stored number of usable addresses in this prefix",
+                max_digits=39,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="prefix",
+            name="utilization_numerator",
+            field=models.DecimalField(
+                blank=True,
+                decimal_places=0,
+                editable=False,
+                help_text="Stored number of used addresses in this prefix",
+                max_digits=39,
+                null=True,
+            ),
+        ),
+    ]
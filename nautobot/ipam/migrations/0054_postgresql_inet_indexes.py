@@ -0,0 +1,55 @@
+from django.db import migrations
+
+# Convert a varbinary (bytea) IP address, as stored by `VarbinaryIPField`, to a PostgreSQL `inet`.
+# All functions used are immutable, so this can be used in index expressions.
+CREATE_FUNCTION_SQL = r"""
+CREATE OR REPLACE FUNCTION nautobot_varbinary_to_inet(value bytea) RETURNS inet
+LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+    SELECT CASE length(value)
+        WHEN 4 THEN (
+            get_byte(value, 0)::text || '.' || get_byte(value, 1)::text || '.'
+            || get_byte(value, 2)::text || '.' || get_byte(value, 3)::text
+        )::inet
+        ELSE regexp_replace(encode(value, 'hex'), '(.{4})(?!$)', '\1:', 'g')::inet
+    END
+$$
+"""
+
+CREATE_INDEXES_SQL = [
+    "CREATE INDEX IF NOT EXISTS ipam_prefix_inet_gist ON ipam_prefix "
+    "USING gist (set_masklen(nautobot_varbinary_to_inet(network), prefix_length) inet_ops)",
+    "CREATE INDEX IF NOT EXISTS ipam_ipaddress_host_inet_gist ON ipam_ipaddress "
+    "USING gist (nautobot_varbinary_to_inet(host) inet_ops)",
+]
+
+DROP_SQL = [
+    "DROP INDEX IF EXISTS ipam_prefix_inet_gist",
+    "DROP INDEX IF EXISTS ipam_ipaddress_host_inet_gist",
+    "DROP FUNCTION IF EXISTS nautobot_varbinary_to_inet(bytea)",
+]
+
+
+def create_inet_indexes(apps, schema_editor):
+    """Create the `inet` conversion function and GiST indexes used by PostgreSQL `inet` containment lookups."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(CREATE_FUNCTION_SQL)
+    for sql in CREATE_INDEXES_SQL:
+        schema_editor.execute(sql)
+
+
+def drop_inet_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for sql in DROP_SQL:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ipam", "0053_prefix_utilization"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_inet_indexes, drop_inet_indexes),
+    ]
@@ -1,11 +1,15 @@
+import bisect
+import heapq
+import itertools
 import logging
 import operator
 
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import MultipleObjectsReturned, ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models, transaction
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 from django.utils.functional import cached_property
 import netaddr
 
@@ -19,7 +23,12 @@ from nautobot.core.utils.data import UtilizationData
 from nautobot.dcim.models import Interface
 from nautobot.extras.models import RoleField, StatusField
 from nautobot.extras.utils import extras_features
-from nautobot.ipam import choices, constants
+from nautobot.ipam import allocation, choices, constants
+from nautobot.ipam.context_managers import (
+    closest_parent_cache_state,
+    deferred_reparenting_state,
+    is_reparenting_deferred,
+)
 from nautobot.virtualization.models import VMInterface
 
 from .fields import VarbinaryIPField
@@ -79,6 +88,80 @@ class Namespace(PrimaryModel):
     def __str__(self):
         return self.name
 
+    def reparent_prefixes_and_ips(self, prefixes=None, ip_addresses=None, batch_size=1000):
+        """
+        Recalculate the `parent` of every Prefix and IPAddress in this Namespace in a single sorted sweep.
+
+        This is used by `nautobot.ipam.context_managers.deferred_reparenting()` to resolve the parents of bulk-imported
+        objects, and is much cheaper than the per-object `Prefix.reparent_subnets()`, `Prefix.reparent_ips()` and
+        `IPAddress` closest-parent lookups when many objects have been added at once.
+
+        Args:
+            prefixes (list[Prefix]): Prefix instances whose in-memory `parent` should be updated to match.
+            ip_addresses (list[IPAddress]): IPAddress instances in this Namespace that were saved with no `parent`
+                and so cannot otherwise be identified as belonging to this Namespace.
+            batch_size (int): Number of objects to update per query.
+
+        Returns:
+            (tuple[int, int]): The number of Prefixes and IPAddresses whose parent was changed.
+
+        Raises:
+            ValidationError: if any of the given `ip_addresses` has no possible parent Prefix.
+        """
+        prefixes_by_pk = {prefix.pk: prefix for prefix in prefixes or []}
+        ip_addresses = ip_addresses or []
+        updated_prefixes = []
+        updated_ip_addresses = []
+
+        for ip_version in (4, 6):
+            prefix_ranges = (
+                (int(netaddr.IPAddress(prefix.network)), int(netaddr.IPAddress(prefix.broadcast)), prefix)
+                for prefix in Prefix.objects.filter(namespace=self, ip_version=ip_version)
+                .order_by("network", "prefix_length")
+                .only("id", "network", "broadcast", "prefix_length", "parent_id")
+                .iterator(chunk_size=constants.ALLOCATION_QUERY_CHUNK_SIZE)
+            )
+            existing_ip_points = (
+                (int(netaddr.IPAddress(ip_address.host)), ip_address)
+                for ip_address in IPAddress.objects.filter(parent__namespace=self, ip_version=ip_version)
+                .order_by("host")
+                .only("id", "host", "parent_id")
+                .iterator(chunk_size=constants.ALLOCATION_QUERY_CHUNK_SIZE)
+            )
+            new_ip_points = sorted(
+                (
+                    (int(netaddr.IPAddress(ip_address.host)), ip_address)
+                    for ip_address in ip_addresses
+                    if ip_address.ip_version == ip_version
+                ),
+                key=operator.itemgetter(0),
+            )
+            ip_points = heapq.merge(existing_ip_points, new_ip_points, key=operator.itemgetter(0))
+
+            for obj, parent in allocation.iter_nested_parents(prefix_ranges, ip_points):
+                parent_id = parent.pk if parent is not None else None
+                if isinstance(obj, Prefix):
+                    if obj.pk in prefixes_by_pk:
+                        prefixes_by_pk[obj.pk].parent_id = parent_id
+                    if obj.parent_id != parent_id:
+                        obj.parent_id = parent_id
+                        updated_prefixes.append(obj)
+                elif parent_id is None:
+                    if obj.parent_id is None:
+                        raise ValidationError(
+                            {"namespace": f"No suitable parent Prefix for {obj.host} exists in Namespace {self}"}
+                        )
+                    # An existing IPAddress must always have a parent; leave it as-is
+                elif obj.parent_id != parent_id:
+                    obj.parent_id = parent_id
+                    updated_ip_addresses.append(obj)
+
+        Prefix.objects.bulk_update(updated_prefixes, ["parent"], batch_size=batch_size)
+        IPAddress.objects.bulk_update(updated_ip_addresses, ["parent"], batch_size=batch_size)
+        return len(updated_prefixes), len(updated_ip_addresses)
+
+    reparent_prefixes_and_ips.alters_data = True
+
 
 def get_default_namespace():
     """Return the Global namespace."""
@@ -571,6 +654,24 @@ class Prefix(PrimaryModel):
         help_text="Date this prefix was allocated to an RIR, reserved in IPAM, etc.",
     )
     description = models.CharField(max_length=CHARFIELD_MAX_LENGTH, blank=True)
+    # Only maintained when settings.PREFIX_UTILIZATION_CACHE_ENABLED is True; see `PrefixQuerySet.update_utilization()`
+    # Sized to hold the address count of an IPv6 /0 (2**128, 39 digits)
+    utilization_numerator = models.DecimalField(
+        max_digits=39,
+        decimal_places=0,
+        blank=True,
+        null=True,
+        editable=False,
+        help_text="Stored number of used addresses in this prefix",
+    )
+    utilization_denominator = models.DecimalField(
+        max_digits=39,
+        decimal_places=0,
+        blank=True,
+        null=True,
+        editable=False,
+        help_text="Stored number of usable addresses in this prefix",
+    )
 
     objects = BaseManager.from_queryset(PrefixQuerySet)()
 
@@ -743,7 +844,9 @@ class Prefix(PrimaryModel):
             # which will (re)set the broadcast and ip_version values of this instance to their correct values.
             self.prefix = self.prefix.cidr
 
-            self.parent = self.get_parent()
+            # When reparenting is deferred, the parent will be calculated in bulk by deferred_reparenting()
+            if not is_reparenting_deferred():
+                self.parent = self.get_parent()
 
         super().clean()
 
@@ -792,17 +895,44 @@ class Prefix(PrimaryModel):
                 self.location = self._location
 
         # Only reparent subnets and ips if any of these fields has been updated.
-        if (
+        moved = (
             not present_in_database
             or self._network != self.network
             or self._namespace_id != self.namespace_id
             or self._prefix_length != self.prefix_length
-        ):
+        )
+        if moved:
+            if deferred_reparenting := deferred_reparenting_state.get():
+                deferred_reparenting.add_prefix(
+                    self, previous_namespace_id=self._namespace_id if present_in_database else None
+                )
+                return
             # Determine the subnets and reparent them to this prefix.
             self.reparent_subnets()
             # Determine the child IPs and reparent them to this prefix.
             self.reparent_ips()
 
+        # This is done here rather than in a `post_save` signal handler as it must happen after reparenting.
+        # IPAddress changes and Prefix deletions are handled in `nautobot.ipam.signals`.
+        if settings.PREFIX_UTILIZATION_CACHE_ENABLED:
+            self._update_stored_utilization(moved=moved, present_in_database=present_in_database)
+
+    def _update_stored_utilization(self, moved, present_in_database):
+        """Update the stored utilization of this Prefix and, if it was created or moved, its (old and new) ancestors."""
+        if not moved:
+            Prefix.objects.filter(pk=self.pk).update_utilization()
+        else:
+            Prefix.objects.filter(namespace_id=self.namespace_id).net_contains_or_equals(
+                self.prefix
+            ).update_utilization()
+            if present_in_database and self._network is not None:
+                Prefix.objects.filter(namespace_id=self._namespace_id).net_contains_or_equals(
+                    f"{self._network}/{self._prefix_length}"
+                ).update_utilization()
+        self.refresh_from_db(fields=["utilization_numerator", "utilization_denominator"])
+
+    _update_stored_utilization.alters_data = True
+
     @property
     def cidr_str(self):
         if self.network is not None and self.prefix_length is not None:
@@ -997,43 +1127,170 @@ class Prefix(PrimaryModel):
 
         return query
 
-    def get_available_prefixes(self):
-        """
-        Return all available Prefixes within this prefix as an IPSet.
+    def get_allocated_prefix_ranges(self):
         """
-        prefix = netaddr.IPSet(self.prefix)
-        child_prefixes = netaddr.IPSet([child.prefix for child in self.descendants()])
-        available_prefixes = prefix - child_prefixes
+        Stream the `(first, last)` integer ranges of all descendant prefixes, ordered by network address.
 
-        return available_prefixes
+        Nested descendants are included as-is; consumers such as `nautobot.ipam.allocation.iter_free_ranges()`
+        are responsible for merging overlapping ranges.
+        """
+        ranges = (
+            self.descendants()
+            .order_by("network", "prefix_length")
+            .values_list("network", "broadcast")
+            .iterator(chunk_size=constants.ALLOCATION_QUERY_CHUNK_SIZE)
+        )
+        for network, broadcast in ranges:
+            yield int(netaddr.IPAddress(network)), int(netaddr.IPAddress(broadcast))
 
-    def get_available_ips(self):
+    def get_allocated_ip_ranges(self):
         """
-        Return all available IPs within this prefix as an IPSet.
+        Stream the `(host, host)` integer ranges of all IP addresses contained within this prefix, ordered by host.
+        """
+        hosts = (
+            self.get_all_ips()
+            .order_by("host")
+            .values_list("host", flat=True)
+            .iterator(chunk_size=constants.ALLOCATION_QUERY_CHUNK_SIZE)
+        )
+        for host in hosts:
+            host = int(netaddr.IPAddress(host))
+            yield host, host
+
+    def _get_usable_ip_bounds(self, range_start=None, range_end=None):
         """
-        prefix = netaddr.IPSet(self.prefix)
-        child_ips = netaddr.IPSet([ip.address.ip for ip in self.get_all_ips()])
-        available_ips = prefix - child_ips
+        Return the first and last IPs (as integers) within this prefix that are eligible for allocation.
 
+        Args:
+            range_start (netaddr.IPAddress, optional): Lower (inclusive) bound to further restrict the range to.
+            range_end (netaddr.IPAddress, optional): Upper (inclusive) bound to further restrict the range to.
+        """
+        first, last = self.prefix.first, self.prefix.last
         # IPv6, pool, or IPv4 /31-32 sets are fully usable
-        if any(
+        # For "normal" IPv4 prefixes, omit first and last addresses
+        if not any(
             [
                 self.ip_version == 6,
                 self.type == choices.PrefixTypeChoices.TYPE_POOL,
                 self.ip_version == 4 and self.prefix_length >= 31,
             ]
         ):
-            return available_ips
+            first, last = first + 1, last - 1
+        if range_start is not None:
+            first = max(first, int(range_start))
+        if range_end is not None:
+            last = min(last, int(range_end))
+        return first, last
 
-        # Omit first and last IP address from the available set
-        # For "normal" IPv4 prefixes, omit first and last addresses
-        available_ips -= netaddr.IPSet(
-            [
-                netaddr.IPAddress(self.prefix.first),
-                netaddr.IPAddress(self.prefix.last),
-            ]
+    def iter_available_ip_ranges(self, range_start=None, range_end=None):
+        """
+        Yield each contiguous range of available IPs within this prefix as a `netaddr.IPRange`, in ascending order.
+
+        Unlike `get_available_ips()`, this streams the contained IPs from the database and never builds a full
+        `IPSet`, so it is suitable for very large prefixes.
+
+        Args:
+            range_start (netaddr.IPAddress, optional): Only consider IPs greater than or equal to this address.
+            range_end (netaddr.IPAddress, optional): Only consider IPs less than or equal to this address.
+        """
+        first, last = self._get_usable_ip_bounds(range_start=range_start, range_end=range_end)
+        for free_first, free_last in allocation.iter_free_ranges(first, last, self.get_allocated_ip_ranges()):
+            yield netaddr.IPRange(
+                netaddr.IPAddress(free_first, version=self.ip_version),
+                netaddr.IPAddress(free_last, version=self.ip_version),
+            )
+
+    def iter_available_ips(self, range_start=None, range_end=None):
+        """
+        Yield each available IP within this prefix as a `netaddr.IPAddress`, in ascending order.
+
+        Args:
+            range_start (netaddr.IPAddress, optional): Only consider IPs greater than or equal to this address.
+            range_end (netaddr.IPAddress, optional): Only consider IPs less than or equal to this address.
+        """
+        first, last = self._get_usable_ip_bounds(range_start=range_start, range_end=range_end)
+        free_ranges = allocation.iter_free_ranges(first, last, self.get_allocated_ip_ranges())
+        for value in allocation.iter_free_values(free_ranges):
+            yield netaddr.IPAddress(value, version=self.ip_version)
+
+    def get_first_available_ips(self, count=1, range_start=None, range_end=None):
+        """
+        Return a list of (up to) the first `count` available IPs within this prefix.
+
+        Args:
+            count (int): Maximum number of IPs to return.
+            range_start (netaddr.IPAddress, optional): Only consider IPs greater than or equal to this address.
+            range_end (netaddr.IPAddress, optional): Only consider IPs less than or equal to this address.
+
+        Returns:
+            (list[netaddr.IPAddress]): Fewer than `count` entries if insufficient IPs are available.
+        """
+        return list(itertools.islice(self.iter_available_ips(range_start=range_start, range_end=range_end), count))
+
+    def iter_available_prefixes(self):
+        """
+        Yield each available CIDR within this prefix as a `netaddr.IPNetwork`, in ascending order.
+
+        This is equivalent to `get_available_prefixes().iter_cidrs()` but streams the descendant prefixes from the
+        database rather than building `IPSet`s in memory.
+        """
+        used_ranges = self.get_allocated_prefix_ranges()
+        for free_first, free_last in allocation.iter_free_ranges(self.prefix.first, self.prefix.last, used_ranges):
+            yield from netaddr.iprange_to_cidrs(
+                netaddr.IPAddress(free_first, version=self.ip_version),
+                netaddr.IPAddress(free_last, version=self.ip_version),
+            )
+
+    def get_next_available_prefixes(self, prefix_lengths):
+        """
+        Find the lowest available child prefix for each of the requested prefix lengths, in order.
+
+        Prefixes found for earlier entries in `prefix_lengths` are considered unavailable for later entries.
+
+        Args:
+            prefix_lengths (Iterable[int]): Prefix length of each requested child prefix.
+
+        Returns:
+            (list[netaddr.IPNetwork, None]): One entry per requested length; None if no space was available.
+
+        Raises:
+            ValidationError: if any of the requested prefix lengths is not valid for this prefix's IP version.
+        """
+        prefix_lengths = list(prefix_lengths)
+        max_length = 32 if self.ip_version == 4 else 128
+        for prefix_length in prefix_lengths:
+            if not 0 <= prefix_length <= max_length:
+                raise ValidationError(
+                    {"prefix_length": f"Prefix length must be between 0 and {max_length} for IPv{self.ip_version}."}
+                )
+        block_starts = allocation.allocate_free_blocks(
+            self.prefix.first,
+            self.prefix.last,
+            self.get_allocated_prefix_ranges,
+            [2 ** (max_length - prefix_length) for prefix_length in prefix_lengths],
         )
-        return available_ips
+        return [
+            netaddr.IPNetwork(f"{netaddr.IPAddress(block_start, version=self.ip_version)}/{prefix_length}")
+            if block_start is not None
+            else None
+            for block_start, prefix_length in zip(block_starts, prefix_lengths)
+        ]
+
+    def get_available_prefixes(self):
+        """
+        Return all available Prefixes within this prefix as an IPSet.
+
+        For large prefixes, prefer `iter_available_prefixes()` or `get_next_available_prefixes()`.
+        """
+        return netaddr.IPSet(self.iter_available_prefixes())
+
+    def get_available_ips(self):
+        """
+        Return all available IPs within this prefix as an IPSet.
+
+        For large prefixes, prefer `iter_available_ips()` or `get_first_available_ips()`.
+        """
+        return netaddr.IPSet(cidr for ip_range in self.iter_available_ip_ranges() for cidr in ip_range.cidrs())
 
     def get_child_ips(self):
         """
@@ -1080,19 +1337,16 @@ class Prefix(PrimaryModel):
         """
         Return the first available child prefix within the prefix (or None).
         """
-        available_prefixes = self.get_available_prefixes()
-        if not available_prefixes:
-            return None
-        return available_prefixes.iter_cidrs()[0]
+        return next(self.iter_available_prefixes(), None)
 
     def get_first_available_ip(self):
         """
         Return the first available IP within the prefix (or None).
         """
-        available_ips = self.get_available_ips()
-        if not available_ips:
+        first_available_ip = next(self.iter_available_ips(), None)
+        if first_available_ip is None:
             return None
-        return f"{next(available_ips.__iter__())}/{self.prefix_length}"
+        return f"{first_available_ip}/{self.prefix_length}"
 
     def get_utilization(self):
         """Return the utilization of this prefix as a UtilizationData object.
@@ -1102,20 +1356,24 @@ class Prefix(PrimaryModel):
         For prefixes containing IP addresses and/or pools, pools are considered fully utilized while
         only IP addresses that are not contained within pools are added to the utilization.
 
-        It is recommended that when using this method you add the following prefetch to the queryset when dealing with
-        multiple prefixes to ensure good performance:
+        When dealing with multiple prefixes, use `PrefixQuerySet.get_utilization_data()` instead, which calculates the
+        utilization of all of them with a fixed number of queries, or `PrefixQuerySet.with_utilization()` to sort or
+        filter prefixes by their utilization percentage in the database.
 
-        ```
-        prefetch_related(
-            Prefetch(
-                "children", queryset=Prefix.objects.only("network", "prefix_length", "parent_id").order_by()
-            )
-        )
-        ```
+        If `settings.PREFIX_UTILIZATION_CACHE_ENABLED` is True, the stored utilization is returned when available.
 
         Returns:
             UtilizationData (namedtuple): (numerator, denominator)
         """
+        if (
+            settings.PREFIX_UTILIZATION_CACHE_ENABLED
+            and self.utilization_numerator is not None
+            and self.utilization_denominator is not None
+        ):
+            return UtilizationData(
+                numerator=int(self.utilization_numerator), denominator=int(self.utilization_denominator)
+            )
+
         denominator = self.prefix.size
         child_ips = netaddr.IPSet()
         child_prefixes = netaddr.IPSet()
@@ -1135,8 +1393,6 @@ class Prefix(PrimaryModel):
         if self.type != choices.PrefixTypeChoices.TYPE_POOL:
             # Using self.children.all over self.children.iterator (with chunk_size given or not) consistently shaves
             # off around 200 extra SQL queries and shows better performance.
-            # Also note that this is meant to be used in conjunction with a Prefetch on an only query. This query is
-            # performed in nautobot.ipam.tables.PrefixDetailTable.
             child_prefixes = netaddr.IPSet(p.prefix for p in self.children.all())
 
         numerator_set = child_ips | child_prefixes
@@ -1288,25 +1544,37 @@ class IPAddress(PrimaryModel):
     natural_key_field_names = ["parent__namespace", "host"]
 
     def _get_closest_parent(self):
-        # TODO: Implement proper caching of `closest_parent` and ensure the cache is invalidated when
-        #  `_namespace` changes. Currently, `_get_closest_parent` is called twice, in the `clean` and `save` methods.
-        #  Caching would improve performance.
-
         # Host and maxlength are required to get the closest_parent
         empty_values = [None, b"", ""]
         if self.host in empty_values or self.mask_length in empty_values:
             return None
+
+        # Within `cached_closest_parents()` (i.e. within a web request or Job), reuse previously looked-up parents
+        namespace = self._namespace
+        closest_parent_cache = closest_parent_cache_state.get()
+        if closest_parent_cache is not None:
+            closest_parent = closest_parent_cache.get(namespace.pk, self.host)
+            if closest_parent is not None:
+                return closest_parent
+
+        queryset = Prefix.objects.filter(namespace=namespace)
+        if closest_parent_cache is not None:
+            # Find out whether the closest parent has any child Prefixes, and so can't be cached, in the same query
+            queryset = queryset.annotate(has_children=Exists(Prefix.objects.filter(parent_id=OuterRef("pk"))))
         try:
             closest_parent = (
-                Prefix.objects.filter(namespace=self._namespace)
+                queryset
                 # 3.0 TODO: disallow IPAddress from parenting to a TYPE_POOL prefix, instead pick closest TYPE_NETWORK
                 # .exclude(type=choices.PrefixTypeChoices.TYPE_POOL)
                 .get_closest_parent(self.host, include_self=True)
             )
-            return closest_parent
         except Prefix.DoesNotExist as e:
             raise ValidationError({"namespace": "No suitable parent Prefix exists in this Namespace"}) from e
 
+        if closest_parent_cache is not None:
+            closest_parent_cache.add(closest_parent)
+        return closest_parent
+
     def clean(self):
         self.address = self.address  # not a no-op - forces re-calling of self._deconstruct_address()
 
@@ -1320,7 +1588,12 @@ class IPAddress(PrimaryModel):
         if self.type == choices.IPAddressTypeChoices.TYPE_SLAAC and self.ip_version != 6:
             raise ValidationError({"type": "Only IPv6 addresses can be assigned SLAAC type"})
 
-        closest_parent = self._get_closest_parent()
+        # When reparenting is deferred, the parent of a new IP address will be calculated in bulk by
+        # deferred_reparenting(), but an existing IP address (which may have been moved to a different Namespace)
+        # must still be validated and reparented here
+        closest_parent = None
+        if self.present_in_database or not is_reparenting_deferred():
+            closest_parent = self._get_closest_parent()
         # Validate `parent` can be used as the parent for this ipaddress
         if closest_parent is not None:
             if self.parent is not None and self.parent != closest_parent:
@@ -1351,6 +1624,14 @@ class IPAddress(PrimaryModel):
     def save(self, *args, **kwargs):
         self.clean()  # MUST do data fixup as above
 
+        deferred_reparenting = deferred_reparenting_state.get()
+        if deferred_reparenting is not None and not self.present_in_database:
+            namespace = self._namespace
+            self.parent = None
+            super().save(*args, **kwargs)
+            deferred_reparenting.add_ip_address(self, namespace)
+            return
+
         super().save(*args, **kwargs)
 
     @property
@@ -1515,18 +1796,63 @@ class VLANGroup(PrimaryModel):
     def expanded_range(self):
         """
         Expand VLAN's range into a list of integers (VLAN IDs).
+
+        Prefer `vid_ranges` or `vid_in_range()` where possible, as these do not expand the range.
         """
         return parse_numeric_range(self.range)
 
+    @property
+    def vid_ranges(self):
+        """
+        Return the permitted VID range(s) of this VLANGroup as a sorted list of non-overlapping `(first, last)` tuples.
+        """
+        ranges = []
+        for dash_range in self.range.split(","):
+            begin, _, end = dash_range.partition("-")
+            ranges.append((int(begin), int(end or begin)))
+        return list(allocation.merge_ranges(sorted(ranges)))
+
+    def vid_in_range(self, vid):
+        """
+        Return True if the given VLAN ID is within the permitted VID range(s) of this VLANGroup.
+        """
+        if vid is None:
+            return False
+        return any(first <= vid <= last for first, last in self.vid_ranges)
+
+    def iter_available_vid_ranges(self, exclude=()):
+        """
+        Yield each range of available VLAN IDs within this VLANGroup as an inclusive `(first, last)` tuple, in order.
+
+        This is calculated by range arithmetic against the sorted VLAN IDs already in use, without expanding the
+        permitted VID range(s) of this VLANGroup.
+
+        Args:
+            exclude (Iterable[int]): Additional VLAN IDs to treat as unavailable, such as those about to be allocated.
+        """
+        used_vids = sorted({*self.vlans.values_list("vid", flat=True), *exclude})
+        for first, last in self.vid_ranges:
+            start = bisect.bisect_left(used_vids, first)
+            yield from allocation.iter_free_ranges(first, last, ((vid, vid) for vid in used_vids[start:]))
+
     @property
     def available_vids(self):
         """
         Return all available VLAN IDs within this VLANGroup as a list.
+
+        Prefer `iter_available_vid_ranges()` or `get_next_available_vids()` where possible.
         """
-        used_ids = self.vlans.all().values_list("vid", flat=True)
-        available = sorted([vid for vid in self.expanded_range if vid not in used_ids])
+        return list(allocation.iter_free_values(self.iter_available_vid_ranges()))
 
-        return available
+    def get_next_available_vids(self, count, exclude=()):
+        """
+        Return (up to) the first `count` available VLAN IDs within this VLANGroup, in ascending order.
+
+        Args:
+            count (int): Maximum number of VLAN IDs to return.
+            exclude (Iterable[int]): Additional VLAN IDs to treat as unavailable.
+        """
+        return list(itertools.islice(allocation.iter_free_values(self.iter_available_vid_ranges(exclude)), count))
 
     def clean(self):
         super().clean()
@@ -1538,8 +1864,12 @@ class VLANGroup(PrimaryModel):
                 )
 
         # Validate ranges for related VLANs.
-        _expanded_range = self.expanded_range
-        out_of_range_vids = [_vlan.vid for _vlan in self.vlans.all() if _vlan.vid not in _expanded_range]
+        vid_ranges = self.vid_ranges
+        out_of_range_vids = [
+            vid
+            for vid in self.vlans.values_list("vid", flat=True)
+            if not any(first <= vid <= last for first, last in vid_ranges)
+        ]
         if out_of_range_vids:
             raise ValidationError(
                 {
@@ -1554,8 +1884,8 @@ class VLANGroup(PrimaryModel):
         """
         Return the first available VLAN ID in the group's range.
         """
-        _available_vids = self.available_vids
-        return _available_vids[0] if _available_vids else None
+        first, _ = next(self.iter_available_vid_ranges(), (None, None))
+        return first
 
 
 @extras_features(
@@ -1678,7 +2008,7 @@ class VLAN(PrimaryModel):
         super().clean()
 
         # Validate Vlan Group Range
-        if self.vlan_group and self.vid not in self.vlan_group.expanded_range:
+        if self.vlan_group and not self.vlan_group.vid_in_range(self.vid):
             raise ValidationError({"vid": f"VLAN ID is not contained in VLAN Group range ({self.vlan_group.range})"})
 
 
@@ -1,12 +1,40 @@
+import itertools
 import re
 
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_ipv46_address
-from django.db.models import ProtectedError, Q
+from django.db import connections
+from django.db.models import (
+    Case,
+    Count,
+    Exists,
+    F,
+    FloatField,
+    OuterRef,
+    ProtectedError,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Coalesce, Power
 import netaddr
 
-from nautobot.core.models.querysets import RestrictedQuerySet
-from nautobot.core.utils.data import merge_dicts_without_collision
+from nautobot.core.models.querysets import count_related, RestrictedQuerySet
+from nautobot.core.utils.data import merge_dicts_without_collision, UtilizationData
+from nautobot.ipam import choices, constants
+from nautobot.ipam.allocation import iter_nested_parents
+from nautobot.ipam.context_managers import deferred_reparenting_state
+from nautobot.ipam.lookups import (
+    InetContainedBy,
+    InetContainedByOrEqual,
+    InetContains,
+    InetContainsOrEqual,
+    PrefixToInet,
+    VarbinaryToInet,
+)
 from nautobot.ipam.mixins import LocationToLocationsQuerySetMixin
 
 
@@ -189,6 +217,10 @@ class BaseNetworkQuerySet(RestrictedQuerySet):
 
         return self.filter(the_filter)
 
+    def _use_inet_lookups(self):
+        """Return True if containment queries should use the native PostgreSQL `inet` lookups."""
+        return settings.POSTGRESQL_INET_LOOKUPS_ENABLED and connections[self.db].vendor == "postgresql"
+
     def _build_prefix_and_last_ip(self, ip):
         if isinstance(ip, str):
             ip = netaddr.IPNetwork(ip)
@@ -196,9 +228,40 @@ class BaseNetworkQuerySet(RestrictedQuerySet):
         return ip, last_ip
 
 
+def _prefix_size():
+    """Return an expression for the number of addresses in a Prefix, as a float (IPv6 sizes overflow a bigint)."""
+    return Power(Value(2.0), Case(When(ip_version=4, then=Value(32)), default=Value(128)) - F("prefix_length"))
+
+
 class PrefixQuerySet(LocationToLocationsQuerySetMixin, BaseNetworkQuerySet):
     """Queryset for `Prefix` objects."""
 
+    # Fields needed to calculate and store the utilization of a Prefix
+    _UTILIZATION_FIELDS = (
+        "id",
+        "network",
+        "broadcast",
+        "prefix_length",
+        "ip_version",
+        "type",
+        "namespace",
+        "utilization_numerator",
+        "utilization_denominator",
+    )
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        When used within `nautobot.ipam.context_managers.deferred_reparenting()`, also register the created Prefixes
+        so that their parents (and those of any affected subnets and IPs) are calculated on exit.
+
+        Outside of that context manager, no parents are calculated; the caller is responsible for the Prefix tree.
+        """
+        objs = super().bulk_create(objs, *args, **kwargs)
+        if deferred_reparenting := deferred_reparenting_state.get():
+            for obj in objs:
+                deferred_reparenting.add_prefix(obj)
+        return objs
+
     def net_equals(self, *prefixes):
         query = Q()
         for prefix in prefixes:
@@ -206,7 +269,17 @@ class PrefixQuerySet(LocationToLocationsQuerySetMixin, BaseNetworkQuerySet):
             query |= Q(prefix_length=prefix.prefixlen, network=prefix.network, broadcast=last_ip)
         return self.filter(query) if query else self.none()
 
+    def _filter_inet(self, lookup_class, prefixes):
+        """Filter by the given PostgreSQL `inet` containment lookup against any of the given `prefixes`."""
+        query = Q()
+        for prefix in prefixes:
+            prefix = netaddr.IPNetwork(str(prefix))
+            query |= Q(lookup_class(PrefixToInet(), str(prefix.cidr)))
+        return self.filter(query) if query else self.none()
+
     def net_contained(self, *prefixes):
+        if self._use_inet_lookups():
+            return self._filter_inet(InetContainedBy, prefixes)
         query = Q()
         for prefix in prefixes:
             prefix, last_ip = self._build_prefix_and_last_ip(prefix)
@@ -214,6 +287,8 @@ class PrefixQuerySet(LocationToLocationsQuerySetMixin, BaseNetworkQuerySet):
         return self.filter(query) if query else self.none()
 
     def net_contained_or_equal(self, *prefixes):
+        if self._use_inet_lookups():
+            return self._filter_inet(InetContainedByOrEqual, prefixes)
         query = Q()
         for prefix in prefixes:
             prefix, last_ip = self._build_prefix_and_last_ip(prefix)
@@ -221,6 +296,8 @@ class PrefixQuerySet(LocationToLocationsQuerySetMixin, BaseNetworkQuerySet):
         return self.filter(query) if query else self.none()
 
     def net_contains(self, *prefixes):
+        if self._use_inet_lookups():
+            return self._filter_inet(InetContains, prefixes)
         query = Q()
         for prefix in prefixes:
             prefix, last_ip = self._build_prefix_and_last_ip(prefix)
@@ -228,12 +305,245 @@ class PrefixQuerySet(LocationToLocationsQuerySetMixin, BaseNetworkQuerySet):
         return self.filter(query) if query else self.none()
 
     def net_contains_or_equals(self, *prefixes):
+        if self._use_inet_lookups():
+            return self._filter_inet(InetContainsOrEqual, prefixes)
         query = Q()
         for prefix in prefixes:
             prefix, last_ip = self._build_prefix_and_last_ip(prefix)
             query |= Q(prefix_length__lte=prefix.prefixlen, network__lte=prefix.network, broadcast__gte=last_ip)
         return self.filter(query) if query else self.none()
 
+    def with_utilization(self):
+        """
+        Annotate each Prefix with its `utilization`, as a percentage, calculated in the database.
+
+        The calculation is the same as that of `Prefix.get_utilization()`, but as it is expressed as correlated
+        subqueries rather than being performed per Prefix in Python, the result can be used to sort and filter a
+        queryset without issuing any additional queries, for example
+        `Prefix.objects.with_utilization().filter(utilization__gte=90).order_by("-utilization")`.
+
+        As IPv6 prefix sizes exceed the range of a database integer, the calculation uses floating point arithmetic;
+        use `get_utilization_data()` where the exact numerator and denominator are needed.
+        """
+        if "utilization" in self.query.annotations:
+            return self
+
+        from nautobot.ipam.models import IPAddress  # avoid circular import
+
+        child_prefix_space = Coalesce(
+            Subquery(
+                self.model.objects.filter(parent_id=OuterRef("pk"))
+                .order_by()
+                .values("parent_id")
+                .annotate(space=Sum(_prefix_size()))
+                .values("space"),
+                output_field=FloatField(),
+            ),
+            Value(0.0),
+        )
+        # Pools count every IP address within their range, regardless of which Prefix is its parent
+        pool_ip_count = Coalesce(
+            Subquery(
+                IPAddress.objects.filter(
+                    parent__namespace_id=OuterRef("namespace_id"),
+                    ip_version=OuterRef("ip_version"),
+                    host__gte=OuterRef("network"),
+                    host__lte=OuterRef("broadcast"),
+                )
+                .order_by()
+                .values("ip_version")
+                .annotate(count=Count("*"))
+                .values("count")
+            ),
+            0,
+        )
+        # IP addresses in a network that are not within any child prefix are parented directly to the network
+        network_ip_count = count_related(IPAddress, "parent")
+        numerator = Case(
+            When(type=choices.PrefixTypeChoices.TYPE_CONTAINER, then=child_prefix_space),
+            When(type=choices.PrefixTypeChoices.TYPE_POOL, then=pool_ip_count),
+            default=child_prefix_space + network_ip_count,
+            output_field=FloatField(),
+        )
+
+        # The network and broadcast addresses of an IPv4 network aren't usable unless they've been explicitly assigned
+        network_or_broadcast_used = Exists(
+            IPAddress.objects.filter(
+                Q(host=OuterRef("network")) | Q(host=OuterRef("broadcast")),
+                parent__namespace_id=OuterRef("namespace_id"),
+                ip_version=4,
+            )
+        ) | Exists(
+            self.model.objects.filter(
+                Q(network=OuterRef("network")) | Q(broadcast=OuterRef("broadcast")),
+                parent_id=OuterRef("pk"),
+            )
+        )
+        denominator = Case(
+            When(
+                Q(type=choices.PrefixTypeChoices.TYPE_NETWORK, ip_version=4, prefix_length__lt=31)
+                & ~network_or_broadcast_used,
+                then=_prefix_size() - Value(2.0),
+            ),
+            default=_prefix_size(),
+            output_field=FloatField(),
+        )
+
+        utilization = numerator * Value(100.0) / denominator
+        if settings.PREFIX_UTILIZATION_CACHE_ENABLED:
+            # Only fall back to calculating the utilization for prefixes that don't have it stored yet
+            stored_utilization = (
+                Cast("utilization_numerator", FloatField())
+                * Value(100.0)
+                / Cast("utilization_denominator", FloatField())
+            )
+            utilization = Coalesce(stored_utilization, utilization)
+
+        return self.annotate(utilization=utilization)
+
+    def get_utilization_data(self):
+        """
+        Calculate the utilization of every Prefix in this queryset using a fixed number of aggregate queries.
+
+        The results are the same as calling `Prefix.get_utilization()` on each Prefix in turn, which issues several
+        queries per Prefix; this is therefore preferred when dealing with multiple prefixes, such as when rendering a
+        page of a table.
+
+        If `settings.PREFIX_UTILIZATION_CACHE_ENABLED` is True, the stored utilization is used when available.
+
+        Returns:
+            (dict): Mapping of Prefix primary key to `UtilizationData` (namedtuple): (numerator, denominator)
+        """
+        prefixes = list(self.order_by().only(*self._UTILIZATION_FIELDS))
+        utilization_data = {}
+        if settings.PREFIX_UTILIZATION_CACHE_ENABLED:
+            utilization_data = {
+                prefix.pk: UtilizationData(
+                    numerator=int(prefix.utilization_numerator), denominator=int(prefix.utilization_denominator)
+                )
+                for prefix in prefixes
+                if prefix.utilization_numerator is not None and prefix.utilization_denominator is not None
+            }
+        utilization_data.update(
+            self._calculate_utilization_data([prefix for prefix in prefixes if prefix.pk not in utilization_data])
+        )
+        return utilization_data
+
+    def update_utilization(self, batch_size=1000):
+        """
+        Recalculate the utilization of every Prefix in this queryset and store it in the database.
+
+        This is called automatically for the affected prefixes whenever a Prefix or IPAddress is saved or deleted
+        if `settings.PREFIX_UTILIZATION_CACHE_ENABLED` is True, and by the `rebuild_prefix_utilization` command.
+
+        Args:
+            batch_size (int): Number of prefixes to calculate and update at a time.
+
+        Returns:
+            (int): The number of prefixes updated.
+        """
+        count = 0
+        prefixes = self.order_by().only(*self._UTILIZATION_FIELDS).iterator(chunk_size=batch_size)
+        while batch := list(itertools.islice(prefixes, batch_size)):
+            utilization_data = self._calculate_utilization_data(batch)
+            for prefix in batch:
+                prefix.utilization_numerator, prefix.utilization_denominator = utilization_data[prefix.pk]
+            self.model.objects.bulk_update(batch, ["utilization_numerator", "utilization_denominator"])
+            count += len(batch)
+        return count
+
+    update_utilization.alters_data = True
+
+    def _calculate_utilization_data(self, prefixes):
+        """Calculate the utilization of the given Prefix instances, ignoring any stored utilization."""
+        from nautobot.ipam.models import IPAddress  # avoid circular import
+
+        if not prefixes:
+            return {}
+        prefixes_by_pk = {prefix.pk: prefix for prefix in prefixes}
+        numerators = dict.fromkeys(prefixes_by_pk, 0)
+        pools = [prefix for prefix in prefixes if prefix.type == choices.PrefixTypeChoices.TYPE_POOL]
+        networks = [prefix for prefix in prefixes if prefix.type == choices.PrefixTypeChoices.TYPE_NETWORK]
+        non_pool_pks = [prefix.pk for prefix in prefixes if prefix.type != choices.PrefixTypeChoices.TYPE_POOL]
+
+        # All direct child prefixes of networks and containers are considered fully utilized
+        child_prefix_counts = (
+            self.model.objects.filter(parent_id__in=non_pool_pks)
+            .order_by()
+            .values("parent_id", "ip_version", "prefix_length")
+            .annotate(count=Count("*"))
+            .values_list("parent_id", "ip_version", "prefix_length", "count")
+        )
+        for parent_id, ip_version, prefix_length, count in child_prefix_counts:
+            numerators[parent_id] += count * 2 ** ((32 if ip_version == 4 else 128) - prefix_length)
+
+        # IP addresses in a network that are not within any child prefix are parented directly to the network
+        if networks:
+            network_ip_counts = (
+                IPAddress.objects.filter(parent_id__in=[prefix.pk for prefix in networks])
+                .order_by()
+                .values("parent_id")
+                .annotate(count=Count("*"))
+                .values_list("parent_id", "count")
+            )
+            for parent_id, count in network_ip_counts:
+                numerators[parent_id] += count
+
+        # Pools count every IP address within their range, regardless of which Prefix is its parent
+        if pools:
+            pool_filters = [
+                Q(
+                    parent__namespace_id=pool.namespace_id,
+                    ip_version=pool.ip_version,
+                    host__gte=pool.network,
+                    host__lte=pool.broadcast,
+                )
+                for pool in pools
+            ]
+            pool_ip_counts = IPAddress.objects.filter(Q(*pool_filters, _connector=Q.OR)).aggregate(
+                **{f"pool_{index}": Count("*", filter=pool_filter) for index, pool_filter in enumerate(pool_filters)}
+            )
+            for index, pool in enumerate(pools):
+                numerators[pool.pk] = pool_ip_counts[f"pool_{index}"]
+
+        # The network and broadcast addresses of an IPv4 network aren't usable unless they've been explicitly assigned
+        reducible_networks = [prefix for prefix in networks if prefix.ip_version == 4 and prefix.prefix_length < 31]
+        reducible_pks = {prefix.pk for prefix in reducible_networks}
+        used_network_or_broadcast = set()
+        if reducible_networks:
+            boundaries = {(prefix.namespace_id, prefix.network) for prefix in reducible_networks}
+            boundaries |= {(prefix.namespace_id, prefix.broadcast) for prefix in reducible_networks}
+            used_boundaries = set(
+                IPAddress.objects.filter(
+                    parent__namespace_id__in={namespace_id for namespace_id, _ in boundaries},
+                    ip_version=4,
+                    host__in={host for _, host in boundaries},
+                ).values_list("parent__namespace_id", "host")
+            )
+            used_network_or_broadcast = {
+                prefix.pk
+                for prefix in reducible_networks
+                if (prefix.namespace_id, prefix.network) in used_boundaries
+                or (prefix.namespace_id, prefix.broadcast) in used_boundaries
+            }
+            boundary_children = self.model.objects.filter(
+                Q(network__in={prefix.network for prefix in reducible_networks})
+                | Q(broadcast__in={prefix.broadcast for prefix in reducible_networks}),
+                parent_id__in=[prefix.pk for prefix in reducible_networks],
+            ).values_list("parent_id", "network", "broadcast")
+            for parent_id, network, broadcast in boundary_children:
+                parent = prefixes_by_pk[parent_id]
+                if network == parent.network or broadcast == parent.broadcast:
+                    used_network_or_broadcast.add(parent_id)
+
+        utilization_data = {}
+        for prefix in prefixes:
+            denominator = 2 ** ((32 if prefix.ip_version == 4 else 128) - prefix.prefix_length)
+            if prefix.pk in reducible_pks and prefix.pk not in used_network_or_broadcast:
+                denominator -= 2
+            utilization_data[prefix.pk] = UtilizationData(numerator=numerators[prefix.pk], denominator=denominator)
+        return utilization_data
+
     def get(self, *args, **kwargs):
         """
         Provide a convenience for `.get(prefix=<prefix>)`
@@ -366,15 +676,18 @@ class PrefixQuerySet(LocationToLocationsQuerySetMixin, BaseNetworkQuerySet):
 
         # Prepare the queryset filter
         lookup_kwargs = {
-            "network__lte": cidr.value,
             "prefix_length__gte": shortest_prefix_length,
-            "broadcast__gte": broadcast,
             "ip_version": ip_version,
         }
+        if self._use_inet_lookups():
+            lookup_args = [InetContainsOrEqual(PrefixToInet(), str(cidr.cidr))]
+        else:
+            lookup_args = []
+            lookup_kwargs.update({"network__lte": cidr.value, "broadcast__gte": broadcast})
 
         # Search for possible ancestors by network/prefix, returning them in reverse order, so that
         # we can choose the first one.
-        possible_ancestors = self.filter(**lookup_kwargs).order_by("-prefix_length")
+        possible_ancestors = self.filter(*lookup_args, **lookup_kwargs).order_by("-prefix_length")
         if not include_self:
             possible_ancestors = possible_ancestors.exclude(network=cidr.value, prefix_length=cidr.prefixlen)
 
@@ -384,6 +697,147 @@ class PrefixQuerySet(LocationToLocationsQuerySetMixin, BaseNetworkQuerySet):
         except IndexError:
             raise self.model.DoesNotExist(f"Could not determine parent Prefix for {cidr}")
 
+    def get_tree(self, namespace=None, parent=None, max_depth=None, after=None, limit=None):
+        """
+        Return the Prefixes of a Namespace, or the descendants of a `parent` Prefix, in tree order with their depth.
+
+        A recursive common table expression on `parent_id` walks down the Prefix tree from its roots, stopping at
+        `max_depth`. As Prefixes nest, ordering the result by (IP version, network, prefix length) places every Prefix
+        directly after its parent and before its parent's next child, i.e. in depth-first tree order, so the tree can
+        be paged through using a keyset `after` cursor rather than an ever-growing OFFSET.
+
+        Prefixes excluded from this queryset (for example by permissions) are omitted, but their descendants are not.
+
+        Args:
+            namespace (Namespace): Namespace whose top-level Prefixes are the roots of the tree.
+                Ignored if `parent` is specified.
+            parent (Prefix): If specified, the children of this Prefix are the roots of the tree.
+            max_depth (int): If specified, exclude Prefixes more than `max_depth` levels below the roots of the tree.
+            after (str): If specified, only include Prefixes following this prefix (e.g. "10.0.0.0/16") in tree order.
+            limit (int): If specified, the maximum number of Prefixes to retrieve.
+
+        Returns:
+            (tuple[list[tuple[Prefix, int]], str]): A list of `(prefix, depth)` tuples, where the roots of the tree
+                have a depth of 0, and the `after` value to retrieve the next page of results, or None if there are no
+                further results.
+        """
+        connection = connections[self.db]
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        pk_field = self.model._meta.pk
+        network_field = self.model._meta.get_field("network")
+
+        if parent is not None:
+            root_condition = "parent_id = %s"
+            params = [pk_field.get_db_prep_value(parent.pk, connection)]
+        else:
+            root_condition = "parent_id IS NULL AND namespace_id = %s"
+            params = [pk_field.get_db_prep_value(namespace.pk, connection)]
+
+        depth_condition = ""
+        if max_depth is not None:
+            depth_condition = "WHERE prefix_tree.depth < %s"
+            params.append(int(max_depth))
+
+        # Restrict the tree to the Prefixes in this queryset within the query, so that `limit` and the `after` cursor
+        # of the next page only ever refer to Prefixes that are actually returned
+        conditions = []
+        if self.query.where:
+            visible_sql, visible_params = self.order_by().values("pk").query.get_compiler(using=self.db).as_sql()
+            conditions.append(f"p.id IN ({visible_sql})")
+            params += visible_params
+
+        if after is not None:
+            after = self._validate_cidr(after)
+            conditions.append("(p.ip_version, p.network, p.prefix_length) > (%s, %s, %s)")
+            params += [after.version, network_field.get_db_prep_value(after.network, connection), after.prefixlen]
+
+        limit_clause = ""
+        if limit is not None:
+            limit_clause = "LIMIT %s"
+            params.append(int(limit))
+
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        # Only quoted table names and fixed or compiled SQL fragments are interpolated; all values are parameters
+        sql = f"""
+            WITH RECURSIVE prefix_tree (id, depth) AS (
+                SELECT id, 0 FROM {table} WHERE {root_condition}
+                UNION ALL
+                SELECT child.id, prefix_tree.depth + 1
+                FROM {table} child JOIN prefix_tree ON child.parent_id = prefix_tree.id
+                {depth_condition}
+            )
+            SELECT prefix_tree.id, prefix_tree.depth, p.network, p.prefix_length
+            FROM prefix_tree JOIN {table} p ON p.id = prefix_tree.id
+            {where_clause}
+            ORDER BY p.ip_version, p.network, p.prefix_length
+            {limit_clause}
+        """  # noqa: S608
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            rows = [(pk_field.to_python(row[0]), *row[1:]) for row in cursor]
+
+        next_after = None
+        if rows and limit is not None and len(rows) == int(limit):
+            _, _, network, prefix_length = rows[-1]
+            next_after = f"{network_field.from_db_value(bytes(network), None, connection)}/{prefix_length}"
+
+        prefixes = self.filter(pk__in=[pk for pk, _, _, _ in rows]).in_bulk()
+        tree = [(prefixes[pk], depth) for pk, depth, _, _ in rows if pk in prefixes]
+        return tree, next_after
+
+    def get_closest_parents(self, addresses):
+        """
+        Return the closest (longest-prefix-match) Prefix containing each of the given IP `addresses`.
+
+        This is the bulk equivalent of calling `get_closest_parent(address, include_self=True)` for each address, but
+        rather than performing one query per address, the candidate Prefixes are streamed from the database in sorted
+        order and matched to the (sorted) addresses in a single sweep, followed by a single query to retrieve the
+        matching Prefixes. As with `get_closest_parent()`, the queryset should usually be filtered to a single
+        Namespace first.
+
+        Args:
+            addresses (Iterable[str, netaddr.IPAddress, netaddr.IPNetwork]): IP addresses to look up; any mask length
+                is ignored.
+
+        Returns:
+            (list[Prefix, None]): The closest parent Prefix of each address, in the same order as `addresses`,
+                or None for each address that is not contained in any Prefix.
+        """
+        ips = []
+        for address in addresses:
+            try:
+                ips.append(netaddr.IPNetwork(str(address)).ip)
+            except (netaddr.AddrFormatError, ValueError, TypeError) as err:
+                raise ValidationError(
+                    {"addresses": f"{address} does not appear to be an IPv4 or IPv6 address."}
+                ) from err
+
+        parent_pks = [None] * len(ips)
+        for ip_version in (4, 6):
+            ip_points = sorted((ip.value, index) for index, ip in enumerate(ips) if ip.version == ip_version)
+            if not ip_points:
+                continue
+            # Only Prefixes overlapping the span of the given addresses can possibly contain any of them
+            first_ip = netaddr.IPAddress(ip_points[0][0], version=ip_version)
+            last_ip = netaddr.IPAddress(ip_points[-1][0], version=ip_version)
+            prefix_ranges = (
+                (int(netaddr.IPAddress(network)), int(netaddr.IPAddress(broadcast)), pk)
+                for pk, network, broadcast in self.filter(
+                    ip_version=ip_version, network__lte=last_ip, broadcast__gte=first_ip
+                )
+                .order_by("network", "prefix_length")
+                .values_list("pk", "network", "broadcast")
+                .iterator(chunk_size=constants.ALLOCATION_QUERY_CHUNK_SIZE)
+            )
+            # Prefix ranges are tagged with their (UUID) pk, and address points with their (int) index
+            for item, parent_pk in iter_nested_parents(prefix_ranges, ip_points):
+                if isinstance(item, int):
+                    parent_pks[item] = parent_pk
+
+        prefixes = self.filter(pk__in={pk for pk in parent_pks if pk is not None}).in_bulk()
+        return [prefixes.get(pk) for pk in parent_pks]
+
 
 class IPAddressQuerySet(BaseNetworkQuerySet):
     """Queryset for `IPAddress` objects."""
@@ -398,6 +852,28 @@ class IPAddressQuerySet(BaseNetworkQuerySet):
         """
         return super().order_by("host")
 
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        When used within `nautobot.ipam.context_managers.deferred_reparenting()`, create the IPAddresses with no
+        parent and register them so that their parents are calculated on exit.
+
+        Each IPAddress should be instantiated with a `namespace` (or a `parent` in the desired Namespace).
+        Outside of that context manager, the caller is responsible for setting the correct `parent` on each object.
+        """
+        deferred_reparenting = deferred_reparenting_state.get()
+        if deferred_reparenting is None:
+            return super().bulk_create(objs, *args, **kwargs)
+
+        objs = list(objs)
+        namespaces = []
+        for obj in objs:
+            namespaces.append(obj._namespace)
+            obj.parent = None
+        objs = super().bulk_create(objs, *args, **kwargs)
+        for obj, namespace in zip(objs, namespaces):
+            deferred_reparenting.add_ip_address(obj, namespace)
+        return objs
+
     def get_or_create(self, defaults=None, **kwargs):
         from nautobot.ipam.models import get_default_namespace, Prefix
 
@@ -461,7 +937,10 @@ class IPAddressQuerySet(BaseNetworkQuerySet):
         query = Q()
         for ip in networks:
             ip, last_ip = self._build_prefix_and_last_ip(ip)
-            query |= Q(host__lte=last_ip, host__gte=ip.network)
+            if self._use_inet_lookups():
+                query |= Q(InetContainedByOrEqual(VarbinaryToInet("host"), str(ip.cidr)))
+            else:
+                query |= Q(host__lte=last_ip, host__gte=ip.network)
         return self.filter(query) if query else self.none()
 
     def net_in(self, networks):
@@ -1,10 +1,13 @@
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db.models import Q
-from django.db.models.signals import m2m_changed, pre_delete, pre_save
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
+from nautobot.ipam.context_managers import closest_parent_cache_state, is_reparenting_deferred
 from nautobot.ipam.models import (
+    IPAddress,
     IPAddressToInterface,
     Prefix,
     PrefixLocationAssignment,
@@ -131,3 +134,73 @@ def assert_locations_content_types(sender, instance, action, reverse, model, pk_
             raise ValidationError(
                 {key: f"{instance} is a {instance.location_type} and may not have {label} associated to it."}
             )
+
+
+def _update_stored_prefix_utilization(namespace_ids, cidr):
+    """Update the stored utilization of all Prefixes containing `cidr` in any of the given Namespaces."""
+    for namespace_id in set(namespace_ids):
+        Prefix.objects.filter(namespace_id=namespace_id).net_contains_or_equals(cidr).update_utilization()
+
+
+@receiver(pre_save, sender=IPAddress)
+def ip_address_pre_save_utilization(sender, instance, raw=False, **kwargs):
+    """
+    Record the original parent of an existing IPAddress, so that if it's moved to a different Namespace, the stored
+    utilization of the Prefixes it was moved out of can be updated.
+    """
+    if raw or not settings.PREFIX_UTILIZATION_CACHE_ENABLED or not instance.present_in_database:
+        return
+    instance._original_parent_id = IPAddress.objects.filter(pk=instance.pk).values_list("parent_id", flat=True).first()
+
+
+@receiver(post_save, sender=IPAddress)
+def ip_address_saved_utilization(sender, instance, created, raw=False, **kwargs):
+    """
+    Update the stored utilization of the Prefixes containing a newly created or moved IPAddress.
+
+    When reparenting is deferred, the stored utilization is instead updated by `deferred_reparenting()`.
+    """
+    if raw or not settings.PREFIX_UTILIZATION_CACHE_ENABLED or is_reparenting_deferred():
+        return
+    original_parent_id = getattr(instance, "_original_parent_id", None)
+    if not created and original_parent_id == instance.parent_id:
+        return
+    namespace_ids = Prefix.objects.filter(pk__in=[instance.parent_id, original_parent_id]).values_list(
+        "namespace_id", flat=True
+    )
+    _update_stored_prefix_utilization(namespace_ids, instance.host)
+
+
+@receiver(post_delete, sender=IPAddress)
+def ip_address_deleted_utilization(sender, instance, **kwargs):
+    """Update the stored utilization of the Prefixes that contained a deleted IPAddress."""
+    if not settings.PREFIX_UTILIZATION_CACHE_ENABLED:
+        return
+    namespace_ids = Prefix.objects.filter(pk=instance.parent_id).values_list("namespace_id", flat=True)
+    _update_stored_prefix_utilization(namespace_ids, instance.host)
+
+
+@receiver(post_delete, sender=Prefix)
+def prefix_deleted_utilization(sender, instance, **kwargs):
+    """
+    Update the stored utilization of the ancestors of a deleted Prefix.
+
+    Changes to the stored utilization on Prefix creation and update are handled in `Prefix.save()`.
+    """
+    if not settings.PREFIX_UTILIZATION_CACHE_ENABLED:
+        return
+    _update_stored_prefix_utilization([instance.namespace_id], instance.prefix)
+
+
+@receiver(post_save, sender=Prefix)
+@receiver(post_delete, sender=Prefix)
+def prefix_changed_invalidate_closest_parents(sender, instance, **kwargs):
+    """
+    Discard any closest parent Prefixes cached by `cached_closest_parents()` in the affected Namespace(s).
+    """
+    closest_parent_cache = closest_parent_cache_state.get()
+    if closest_parent_cache is None:
+        return
+    closest_parent_cache.invalidate(instance.namespace_id)
+    if getattr(instance, "_namespace_id", None) not in (None, instance.namespace_id):
+        closest_parent_cache.invalidate(instance._namespace_id)
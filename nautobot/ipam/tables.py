@@ -1,4 +1,4 @@
-from django.db.models import Prefetch
+from django.template.loader import render_to_string
 from django.utils.safestring import mark_safe
 import django_tables2 as tables
 from django_tables2.utils import Accessor
@@ -11,7 +11,7 @@ from nautobot.core.tables import (
     TagColumn,
     ToggleColumn,
 )
-from nautobot.core.templatetags.helpers import render_boolean
+from nautobot.core.templatetags.helpers import render_boolean, utilization_graph
 from nautobot.dcim.models import Interface
 from nautobot.dcim.tables import InterfaceTable
 from nautobot.dcim.tables.devices import DeviceComponentTable
@@ -38,12 +38,6 @@ from .models import (
 
 AVAILABLE_LABEL = mark_safe('<span class="label label-success">Available</span>')  # noqa: S308  # suspicious-mark-safe-usage -- known safe string here
 
-UTILIZATION_GRAPH = """
-{% load helpers %}
-{% if record.present_in_database %}{% utilization_graph record.get_utilization %}{% else %}&mdash;{% endif %}
-"""
-
-
 # record: the Prefix being rendered in this row
 # object: the base ancestor Prefix, in the case of PrefixDetailTable, else None
 PREFIX_COPY_LINK = """
@@ -417,18 +411,24 @@ class PrefixTable(StatusTableMixin, RoleTableMixin, BaseTable):
 
 
 class PrefixDetailTable(PrefixTable):
-    utilization = tables.TemplateColumn(template_code=UTILIZATION_GRAPH, orderable=False)
+    utilization = tables.Column(empty_values=(), orderable=False)
     tenant = TenantColumn()
     tags = TagColumn(url_name="ipam:prefix_list")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.add_conditional_prefetch(
-            "utilization",
-            prefetch=Prefetch(
-                "children", queryset=Prefix.objects.only("network", "prefix_length", "parent_id").order_by()
-            ),
-        )
+        self._utilization_data = None
+
+    def render_utilization(self, record):
+        if not record.present_in_database:
+            return mark_safe("&mdash;")  # noqa: S308  # suspicious-mark-safe-usage -- known safe string here
+        if self._utilization_data is None:
+            # Calculate the utilization of all prefixes on the current page at once, rather than one row at a time
+            self._utilization_data = Prefix.objects.filter(
+                pk__in=[row.record.pk for row in self.paginated_rows if row.record.present_in_database]
+            ).get_utilization_data()
+        utilization_data = self._utilization_data.get(record.pk) or record.get_utilization()
+        return render_to_string("utilities/templatetags/utilization_graph.html", utilization_graph(utilization_data))
 
     class Meta(PrefixTable.Meta):
         fields = (
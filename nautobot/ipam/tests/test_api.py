@@ -22,7 +22,7 @@ from nautobot.dcim.models import (
     Manufacturer,
     VirtualDeviceContext,
 )
-from nautobot.extras.models import CustomField, Role, Status
+from nautobot.extras.models import CustomField, ObjectChange, Role, Status
 from nautobot.ipam import choices
 from nautobot.ipam.models import (
     IPAddress,
@@ -478,6 +478,147 @@ class PrefixTest(APIViewTestCases.APIViewTestCase):
                 "Please correct the data or use a later API version.",
             )
 
+    def test_bulk_create_with_deferred_reparenting(self):
+        """Test bulk creation of nested prefixes with `?defer_reparenting=true`."""
+        self.add_permissions("ipam.add_prefix", "ipam.view_prefix", "extras.view_status", "ipam.view_namespace")
+        namespace = Namespace.objects.create(name="Deferred Reparenting")
+        data = [
+            {"prefix": prefix, "status": self.status.pk, "namespace": namespace.pk}
+            for prefix in ("10.99.0.0/24", "10.99.0.0/16", "10.99.1.0/24", "10.0.0.0/8", "10.99.1.128/25")
+        ]
+        url = f"{self._get_list_url()}?defer_reparenting=true"
+        response = self.client.post(url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+
+        prefixes = {str(prefix.prefix): prefix for prefix in Prefix.objects.filter(namespace=namespace)}
+        self.assertEqual(len(prefixes), 5)
+        self.assertIsNone(prefixes["10.0.0.0/8"].parent)
+        self.assertEqual(prefixes["10.99.0.0/16"].parent, prefixes["10.0.0.0/8"])
+        self.assertEqual(prefixes["10.99.0.0/24"].parent, prefixes["10.99.0.0/16"])
+        self.assertEqual(prefixes["10.99.1.0/24"].parent, prefixes["10.99.0.0/16"])
+        self.assertEqual(prefixes["10.99.1.128/25"].parent, prefixes["10.99.1.0/24"])
+        # The response should reflect the calculated parents
+        for result in response.data:
+            self.assertEqual(result["parent"]["id"] if result["parent"] else None, prefixes[result["prefix"]].parent_id)
+        # As should the change log
+        objectchange = ObjectChange.objects.get(changed_object_id=prefixes["10.99.1.128/25"].pk)
+        self.assertEqual(objectchange.object_data["parent"], str(prefixes["10.99.1.0/24"].pk))
+
+    def test_list_prefixes_utilization(self):
+        """Test that the utilization of each Prefix is included in, and can be used to sort and filter, the list."""
+        self.add_permissions("ipam.view_prefix")
+        utilization_data = {str(pk): data for pk, data in Prefix.objects.get_utilization_data().items()}
+
+        response = self.client.get(f"{self._get_list_url()}?sort=-utilization&limit=1000", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], Prefix.objects.count())
+        utilizations = [result["utilization"] for result in response.data["results"]]
+        self.assertEqual(utilizations, sorted(utilizations, reverse=True))
+        for result in response.data["results"]:
+            numerator, denominator = utilization_data[result["id"]]
+            self.assertAlmostEqual(result["utilization"], numerator * 100 / denominator)
+
+        response = self.client.get(f"{self._get_list_url()}?utilization__gte=50&limit=1000", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(
+            {result["id"] for result in response.data["results"]},
+            {pk for pk, (numerator, denominator) in utilization_data.items() if numerator * 100 / denominator >= 50},
+        )
+
+    def test_create_prefix_utilization(self):
+        """Test that the utilization of a Prefix is included in responses without it being annotated."""
+        self.add_permissions("ipam.add_prefix", "ipam.change_prefix", "extras.view_status", "ipam.view_namespace")
+        namespace = Namespace.objects.create(name="Prefix Utilization")
+        data = {"prefix": "192.0.2.0/24", "status": self.status.pk, "namespace": namespace.pk}
+        response = self.client.post(self._get_list_url(), data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["utilization"], 0)
+
+        prefix = Prefix.objects.get(pk=response.data["id"])
+        IPAddress.objects.create(address="192.0.2.1/24", status=self.status, namespace=namespace)
+        url = self._get_detail_url(prefix)
+        response = self.client.patch(url, {"description": "Used"}, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        numerator, denominator = prefix.get_utilization()
+        self.assertAlmostEqual(response.data["utilization"], numerator * 100 / denominator)
+
+    def test_closest_parents(self):
+        """Test the bulk closest (longest-prefix-match) parent lookup."""
+        url = reverse("ipam-api:prefix-closest-parents")
+        prefix = Prefix.objects.filter(prefix_length__lt=30).first()
+        addresses = [str(prefix.prefix[1]), str(prefix.prefix[-1]), "255.255.255.255", "ffff::"]
+        data = {"namespace": prefix.namespace.pk, "addresses": addresses}
+
+        response = self.client.post(url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+
+        self.add_permissions("ipam.view_prefix")
+        response = self.client.post(url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual([result["address"] for result in response.data], addresses)
+        queryset = Prefix.objects.filter(namespace=prefix.namespace)
+        for result, address in zip(response.data, addresses):
+            with self.subTest(address=address):
+                try:
+                    expected_parent = queryset.get_closest_parent(address, include_self=True)
+                except Prefix.DoesNotExist:
+                    self.assertIsNone(result["prefix"])
+                else:
+                    self.assertEqual(result["prefix"]["id"], str(expected_parent.pk))
+
+        response = self.client.post(url, {"addresses": ["10.0.0.0/33"]}, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+
+    def test_prefix_tree(self):
+        """Test paging through the prefix tree of a namespace."""
+        namespace = Prefix.objects.first().namespace
+        url = f"{reverse('ipam-api:prefix-tree')}?namespace={namespace.pk}&limit=3"
+
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+
+        self.add_permissions("ipam.view_prefix", "ipam.view_namespace")
+        results = []
+        while url:
+            response = self.client.get(url, **self.header)
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), 3)
+            results += [(result["prefix"]["id"], result["depth"]) for result in response.data["results"]]
+            url = response.data["next"]
+        tree, _ = Prefix.objects.all().get_tree(namespace=namespace)
+        self.assertEqual(results, [(str(prefix.pk), depth) for prefix, depth in tree])
+
+        parent = Prefix.objects.filter(namespace=namespace, children__isnull=False).first()
+        response = self.client.get(f"{reverse('ipam-api:prefix-tree')}?parent={parent.pk}&max_depth=0", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(
+            {result["prefix"]["id"] for result in response.data["results"]},
+            {str(pk) for pk in parent.children.values_list("pk", flat=True)},
+        )
+
+        response = self.client.get(f"{reverse('ipam-api:prefix-tree')}?max_depth=foo", **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+
+    def test_prefix_tree_with_permissions_constraint(self):
+        """Test that paging through the prefix tree only ever refers to prefixes that the user may view."""
+        namespace = Namespace.objects.create(name="Prefix Tree")
+        for cidr in ("10.0.0.0/8", "10.0.0.0/16", "10.0.0.0/24", "10.1.0.0/16", "10.2.0.0/16", "10.3.0.0/16"):
+            Prefix.objects.create(prefix=cidr, namespace=namespace, status=self.status)
+        self.add_permissions("ipam.view_namespace")
+        self.add_permissions("ipam.view_prefix", constraints={"prefix_length__lte": 8})
+        url = f"{reverse('ipam-api:prefix-tree')}?namespace={namespace.pk}&limit=1"
+
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual([result["prefix"]["prefix"] for result in response.data["results"]], ["10.0.0.0/8"])
+        self.assertIsNotNone(response.data["next"])
+
+        # The following (hidden) prefixes are neither returned nor disclosed by the next page's cursor
+        response = self.client.get(response.data["next"], **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [])
+        self.assertIsNone(response.data["next"])
+
     def test_list_available_prefixes(self):
         """
         Test retrieval of all available prefixes within a parent prefix.
@@ -558,6 +699,12 @@ class PrefixTest(APIViewTestCases.APIViewTestCase):
         self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
         self.assertIn("prefix_length", response.data)
         self.assertEqual(response.data["prefix_length"], "This field must be an integer.")
+        max_length = 32 if prefix.ip_version == 4 else 128
+        response = self.client.post(
+            url, {"prefix_length": max_length + 1, "status": self.status.pk}, format="json", **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("prefix_length", response.data)
 
     def test_create_multiple_available_prefixes(self):
         """
@@ -1480,6 +1627,45 @@ class ParallelPrefixTest(APITransactionTestCase):
         ips = [str(o) for o in IPAddress.objects.filter().all()]
         self.assertEqual(len(ips), len(set(ips)), "Duplicate IPs should not exist")
 
+    def test_create_available_ips_parallel_in_parent_and_child(self):
+        """Allocations from a Prefix and from its child Prefix must not select the same free address."""
+        parent = Prefix.objects.create(prefix="192.0.2.0/29", namespace=self.namespace, status=self.status)
+        child = Prefix.objects.create(
+            prefix="192.0.2.0/30",
+            type=choices.PrefixTypeChoices.TYPE_POOL,
+            namespace=self.namespace,
+            status=self.status,
+        )
+
+        # 3 IPs from each of the parent (.1 to .6 usable) and the child (.0 to .3 usable)
+        requests = [
+            (
+                reverse("ipam-api:prefix-available-ips", kwargs={"pk": prefix.pk}),
+                {"description": f"Test IP {i}", "namespace": self.namespace.pk, "status": self.status.pk},
+            )
+            for i, prefix in enumerate([parent, child] * 3)
+        ]
+        shuffle(requests)
+        with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+            futures = [executor.submit(self._threaded_post, url, data) for url, data in requests]
+        for future in futures:
+            future.result()
+
+        ips = list(IPAddress.objects.filter(parent__namespace=self.namespace).values_list("host", flat=True))
+        self.assertEqual(len(ips), 6)
+        self.assertEqual(len(ips), len(set(ips)), "Duplicate IPs should not exist")
+
+    def test_create_multiple_available_vlans_parallel(self):
+        vlan_group = VLANGroup.objects.create(name="Parallel VLAN Group", range="1-4,10-13")
+        vlan_status = Status.objects.get_for_model(VLAN).first()
+
+        # 8 VLANs
+        requests = [{"name": f"VLAN {i}", "status": vlan_status.pk} for i in range(1, 9)]
+        url = reverse("ipam-api:vlangroup-available-vlans", kwargs={"pk": vlan_group.pk})
+        self._do_parallel_requests(url, requests)
+        vids = list(vlan_group.vlans.values_list("vid", flat=True))
+        self.assertEqual(sorted(vids), [1, 2, 3, 4, 10, 11, 12, 13], "Duplicate VLAN IDs should not exist")
+
     def _do_parallel_requests(self, url, requests):
         # Randomize request order, such that test run more closely simulates
         # a real calling pattern.
@@ -1562,6 +1748,17 @@ class IPAddressTest(APIViewTestCases.APIViewTestCase):
         self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
         self.assertIn("__all__", response.data)
 
+    def test_bulk_create_with_deferred_reparenting_without_parent(self):
+        """Test that bulk creation with `?defer_reparenting=true` of an IP address with no possible parent fails."""
+        self.add_permissions("ipam.add_ipaddress", "ipam.view_ipaddress", "extras.view_status", "ipam.view_namespace")
+        namespace = Namespace.objects.create(name="Deferred Reparenting")
+        data = [{"address": "192.0.2.1/32", "status": self.statuses[0].pk, "namespace": namespace.pk}]
+        url = f"{self._get_list_url()}?defer_reparenting=true"
+        response = self.client.post(url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("namespace", response.data)
+        self.assertFalse(IPAddress.objects.filter(host="192.0.2.1").exists())
+
     def test_create_invalid_address(self):
         """Pass various invalid inputs and confirm they are rejected cleanly."""
         self.add_permissions("ipam.add_ipaddress")
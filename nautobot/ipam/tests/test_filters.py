@@ -220,6 +220,20 @@ class PrefixTestCase(FilterTestCases.FilterTestCase, FilterTestCases.TenancyFilt
         all_prefixes = self.queryset.all()
         self.assertQuerysetEqualAndNotEmpty(self.filterset(params, self.queryset).qs, all_prefixes)
 
+    def test_utilization(self):
+        utilization_data = self.queryset.get_utilization_data()
+        percentages = {pk: numerator * 100 / denominator for pk, (numerator, denominator) in utilization_data.items()}
+        params = {"utilization__gte": 50}
+        self.assertQuerysetEqualAndNotEmpty(
+            self.filterset(params, self.queryset).qs,
+            self.queryset.filter(pk__in=[pk for pk, percentage in percentages.items() if percentage >= 50]),
+        )
+        params = {"utilization__lte": 50}
+        self.assertQuerysetEqualAndNotEmpty(
+            self.filterset(params, self.queryset).qs,
+            self.queryset.filter(pk__in=[pk for pk, percentage in percentages.items() if percentage <= 50]),
+        )
+
 
 class PrefixLocationAssignmentTestCase(FilterTestCases.FilterTestCase):
     queryset = PrefixLocationAssignment.objects.all()
@@ -1,11 +1,13 @@
+from io import StringIO
 from unittest import skipIf
 from unittest.mock import patch
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
 from django.db import connection, IntegrityError
 from django.db.models import ProtectedError
-from django.test import TestCase
+from django.test import override_settings, TestCase
 import netaddr
 
 from nautobot.core.testing.models import ModelTestCases
@@ -13,6 +15,7 @@ from nautobot.dcim import choices as dcim_choices
 from nautobot.dcim.models import Device, DeviceType, Interface, Location, LocationType, Module, ModuleBay, ModuleType
 from nautobot.extras.models import Role, Status
 from nautobot.ipam.choices import IPAddressTypeChoices, PrefixTypeChoices, ServiceProtocolChoices
+from nautobot.ipam.context_managers import cached_closest_parents, closest_parent_cache_state, deferred_reparenting
 from nautobot.ipam.models import (
     get_default_namespace,
     IPAddress,
@@ -827,6 +830,155 @@ class TestPrefix(ModelTestCases.BaseModelTestCase):
 
         self.assertEqual(parent_prefix.get_first_available_ip(), "10.0.3.2/29")
 
+    def test_iter_available_ips(self):
+        parent_prefix = Prefix.objects.create(prefix="10.0.0.0/28", status=self.status, namespace=self.namespace)
+        Prefix.objects.create(prefix="10.0.0.8/30", status=self.status, namespace=self.namespace)
+        for address in ("10.0.0.1/28", "10.0.0.2/28", "10.0.0.5/28", "10.0.0.9/30"):
+            IPAddress.objects.create(address=address, status=self.status, namespace=self.namespace)
+
+        self.assertEqual(
+            list(parent_prefix.iter_available_ip_ranges()),
+            [
+                netaddr.IPRange("10.0.0.3", "10.0.0.4"),
+                netaddr.IPRange("10.0.0.6", "10.0.0.8"),
+                netaddr.IPRange("10.0.0.10", "10.0.0.14"),
+            ],
+        )
+        self.assertEqual(
+            parent_prefix.get_first_available_ips(count=4),
+            [netaddr.IPAddress(ip) for ip in ("10.0.0.3", "10.0.0.4", "10.0.0.6", "10.0.0.7")],
+        )
+        self.assertEqual(
+            parent_prefix.get_first_available_ips(
+                count=10, range_start=netaddr.IPAddress("10.0.0.7"), range_end=netaddr.IPAddress("10.0.0.11")
+            ),
+            [netaddr.IPAddress(ip) for ip in ("10.0.0.7", "10.0.0.8", "10.0.0.10", "10.0.0.11")],
+        )
+        self.assertEqual(
+            netaddr.IPSet(parent_prefix.iter_available_ips()),
+            parent_prefix.get_available_ips(),
+        )
+
+    def test_iter_available_ips_pool(self):
+        parent_prefix = Prefix.objects.create(
+            prefix="10.0.0.0/30", type=PrefixTypeChoices.TYPE_POOL, status=self.status, namespace=self.namespace
+        )
+        IPAddress.objects.create(address="10.0.0.1/30", status=self.status, namespace=self.namespace)
+        self.assertEqual(
+            parent_prefix.get_first_available_ips(count=10),
+            [netaddr.IPAddress(ip) for ip in ("10.0.0.0", "10.0.0.2", "10.0.0.3")],
+        )
+
+    def test_get_next_available_prefixes(self):
+        parent_prefix = Prefix.objects.create(
+            prefix="10.0.0.0/16", type=PrefixTypeChoices.TYPE_CONTAINER, status=self.status, namespace=self.namespace
+        )
+        Prefix.objects.create(prefix="10.0.0.0/24", status=self.status, namespace=self.namespace)
+        Prefix.objects.create(prefix="10.0.0.0/25", status=self.status, namespace=self.namespace)
+        Prefix.objects.create(prefix="10.0.2.0/24", status=self.status, namespace=self.namespace)
+
+        self.assertEqual(
+            list(parent_prefix.iter_available_prefixes()), list(parent_prefix.get_available_prefixes().iter_cidrs())
+        )
+        self.assertEqual(
+            parent_prefix.get_next_available_prefixes([24, 23, 25, 24]),
+            [
+                netaddr.IPNetwork("10.0.1.0/24"),
+                netaddr.IPNetwork("10.0.4.0/23"),
+                netaddr.IPNetwork("10.0.3.0/25"),
+                netaddr.IPNetwork("10.0.6.0/24"),
+            ],
+        )
+        self.assertEqual(
+            parent_prefix.get_next_available_prefixes([15, 17]), [None, netaddr.IPNetwork("10.0.128.0/17")]
+        )
+        with self.assertRaises(ValidationError):
+            parent_prefix.get_next_available_prefixes([24, 33])
+
+    def test_deferred_reparenting(self):
+        namespace = Namespace.objects.create(name="Deferred Reparenting")
+        existing_parent = Prefix.objects.create(prefix="10.0.0.0/8", status=self.status, namespace=namespace)
+        existing_ip = IPAddress.objects.create(address="10.1.1.1/32", status=self.status, namespace=namespace)
+        self.assertEqual(existing_ip.parent, existing_parent)
+
+        with deferred_reparenting():
+            prefixes = Prefix.objects.bulk_create(
+                [
+                    Prefix(prefix="10.1.1.0/24", status=self.status, namespace=namespace),
+                    Prefix(prefix="10.1.0.0/16", status=self.status, namespace=namespace),
+                    Prefix(prefix="2001:db8::/32", status=self.status, namespace=namespace),
+                ]
+            )
+            ip_addresses = IPAddress.objects.bulk_create(
+                [
+                    IPAddress(address="10.1.2.3/16", status=self.status, namespace=namespace),
+                    IPAddress(address="2001:db8::1/64", status=self.status, namespace=namespace),
+                ]
+            )
+            saved_prefix = Prefix.objects.create(prefix="10.1.2.0/24", status=self.status, namespace=namespace)
+            # Parents are not calculated until the context manager exits
+            self.assertIsNone(saved_prefix.parent)
+            self.assertIsNone(ip_addresses[0].parent)
+
+        self.assertEqual(prefixes[0].parent, prefixes[1])
+        self.assertEqual(prefixes[1].parent, existing_parent)
+        self.assertIsNone(prefixes[2].parent)
+        self.assertEqual(saved_prefix.parent, prefixes[1])
+        self.assertEqual(ip_addresses[0].parent, saved_prefix)
+        self.assertEqual(ip_addresses[1].parent, prefixes[2])
+        for prefix in [*prefixes, saved_prefix]:
+            prefix.refresh_from_db()
+            self.assertEqual(prefix.parent, prefix.get_parent())
+        existing_ip.refresh_from_db()
+        self.assertEqual(existing_ip.parent, prefixes[0])
+        ip_addresses[0].refresh_from_db()
+        self.assertEqual(ip_addresses[0].parent, saved_prefix)
+
+    def test_deferred_reparenting_no_parent(self):
+        namespace = Namespace.objects.create(name="Deferred Reparenting")
+        with self.assertRaises(ValidationError):
+            with deferred_reparenting():
+                Prefix.objects.create(prefix="10.0.0.0/8", status=self.status, namespace=namespace)
+                IPAddress.objects.create(address="11.0.0.1/32", status=self.status, namespace=namespace)
+        self.assertFalse(Prefix.objects.filter(namespace=namespace).exists())
+
+    def test_deferred_reparenting_namespace_changed(self):
+        namespace = Namespace.objects.create(name="Deferred Reparenting")
+        other_namespace = Namespace.objects.create(name="Other Deferred Reparenting")
+        other_parent = Prefix.objects.create(prefix="10.0.0.0/8", status=self.status, namespace=other_namespace)
+        prefix = Prefix.objects.create(prefix="10.1.0.0/16", status=self.status, namespace=namespace)
+        child = Prefix.objects.create(prefix="10.1.1.0/24", status=self.status, namespace=namespace)
+        self.assertEqual(child.parent, prefix)
+
+        with deferred_reparenting():
+            prefix.namespace = other_namespace
+            prefix.save()
+
+        self.assertEqual(prefix.parent, other_parent)
+        # The child left behind in the original Namespace is reparented as well
+        child.refresh_from_db()
+        self.assertIsNone(child.parent)
+
+    def test_deferred_reparenting_existing_ip_address(self):
+        namespace = Namespace.objects.create(name="Deferred Reparenting")
+        other_namespace = Namespace.objects.create(name="Other Deferred Reparenting")
+        parent = Prefix.objects.create(prefix="10.0.0.0/8", status=self.status, namespace=namespace)
+        other_parent = Prefix.objects.create(prefix="10.1.0.0/16", status=self.status, namespace=other_namespace)
+        ip_address = IPAddress.objects.create(address="10.1.1.1/32", status=self.status, namespace=namespace)
+        self.assertEqual(ip_address.parent, parent)
+
+        with deferred_reparenting():
+            ip_address._namespace = other_namespace
+            ip_address.save()
+            # Existing IP addresses are reparented immediately
+            self.assertEqual(ip_address.parent, other_parent)
+            ip_address._namespace = Namespace.objects.create(name="Empty Deferred Reparenting")
+            with self.assertRaises(ValidationError):
+                ip_address.save()
+
+        ip_address.refresh_from_db()
+        self.assertEqual(ip_address.parent, other_parent)
+
     def test_get_all_ips_issue_3319(self):
         # https://github.com/nautobot/nautobot/issues/3319
         # Confirm that IPv4 addresses aren't caught up in the IPv6 ::/96 subnet by accident, and vice versa.
@@ -1006,6 +1158,121 @@ class TestPrefix(ModelTestCases.BaseModelTestCase):
         )
         self.assertSequenceEqual(v4_10dot_address_space_in_v6.get_utilization(), (0, 2**120))
 
+    def test_get_utilization_data(self):
+        container = Prefix.objects.create(
+            prefix="10.0.0.0/24", type=PrefixTypeChoices.TYPE_CONTAINER, status=self.status, namespace=self.namespace
+        )
+        slash26 = Prefix.objects.create(prefix="10.0.0.0/26", status=self.status, namespace=self.namespace)
+        slash25 = Prefix.objects.create(prefix="10.0.0.128/25", status=self.status, namespace=self.namespace)
+        pool = Prefix.objects.create(
+            prefix="10.0.0.132/30", type=PrefixTypeChoices.TYPE_POOL, status=self.status, namespace=self.namespace
+        )
+        slash31 = Prefix.objects.create(prefix="10.0.1.0/31", status=self.status, namespace=self.namespace)
+        slash124 = Prefix.objects.create(prefix="aaaa::/124", status=self.status, namespace=self.namespace)
+        large_prefix_v6 = Prefix.objects.create(
+            prefix="ab00::/8", type=PrefixTypeChoices.TYPE_CONTAINER, status=self.status, namespace=self.namespace
+        )
+        Prefix.objects.create(prefix="ab40::/10", status=self.status, namespace=self.namespace)
+        for address in ["10.0.0.0", "10.0.0.1", "10.0.0.2", "10.0.0.133", "10.0.0.200", "10.0.1.1"]:
+            IPAddress.objects.create(address=f"{address}/32", status=self.status, namespace=self.namespace)
+        IPAddress.objects.create(address="aaaa::f/128", status=self.status, namespace=self.namespace)
+
+        prefixes = Prefix.objects.filter(namespace=self.namespace)
+        with self.assertNumQueries(6):
+            utilization_data = prefixes.get_utilization_data()
+        self.assertEqual(len(utilization_data), prefixes.count())
+        for prefix in prefixes:
+            with self.subTest(prefix=prefix.prefix):
+                self.assertEqual(utilization_data[prefix.pk], prefix.get_utilization())
+                numerator, denominator = utilization_data[prefix.pk]
+                self.assertAlmostEqual(
+                    prefixes.with_utilization().get(pk=prefix.pk).utilization, numerator * 100 / denominator
+                )
+        self.assertEqual(utilization_data[container.pk], (192, 256))
+        self.assertEqual(utilization_data[slash26.pk], (3, 64))
+        self.assertEqual(utilization_data[slash25.pk], (5, 126))
+        self.assertEqual(utilization_data[pool.pk], (1, 4))
+        self.assertEqual(utilization_data[slash31.pk], (1, 2))
+        self.assertEqual(utilization_data[slash124.pk], (1, 16))
+        self.assertEqual(utilization_data[large_prefix_v6.pk], (2**118, 2**120))
+
+        self.assertQuerysetEqualAndNotEmpty(
+            prefixes.with_utilization().filter(utilization__gte=50).order_by("network"),
+            Prefix.objects.filter(pk__in=[self.root.pk, self.parent.pk, container.pk, slash31.pk]).order_by("network"),
+        )
+        self.assertEqual(Prefix.objects.none().get_utilization_data(), {})
+
+    def assertStoredUtilizationCorrect(self):
+        """Assert that the stored utilization of every Prefix matches its calculated utilization."""
+        with override_settings(PREFIX_UTILIZATION_CACHE_ENABLED=False):
+            expected = Prefix.objects.get_utilization_data()
+        for prefix in Prefix.objects.all():
+            with self.subTest(prefix=prefix.prefix):
+                self.assertEqual((prefix.utilization_numerator, prefix.utilization_denominator), expected[prefix.pk])
+
+    @override_settings(PREFIX_UTILIZATION_CACHE_ENABLED=True)
+    def test_stored_utilization(self):
+        call_command("rebuild_prefix_utilization", stdout=StringIO())
+        self.assertStoredUtilizationCorrect()
+
+        container = Prefix.objects.create(
+            prefix="10.0.0.0/16", type=PrefixTypeChoices.TYPE_CONTAINER, status=self.status, namespace=self.namespace
+        )
+        network = Prefix.objects.create(prefix="10.0.0.0/24", status=self.status, namespace=self.namespace)
+        self.assertEqual(network.get_utilization(), (0, 254))
+        self.assertEqual(container.get_utilization(), (0, 65536))  # not yet refreshed from the database
+        container.refresh_from_db()
+        self.assertEqual(container.get_utilization(), (256, 65536))
+
+        ip = IPAddress.objects.create(address="10.0.0.1/24", status=self.status, namespace=self.namespace)
+        pool = Prefix.objects.create(
+            prefix="10.0.0.0/30", type=PrefixTypeChoices.TYPE_POOL, status=self.status, namespace=self.namespace
+        )
+        IPAddress.objects.create(address="10.0.0.10/24", status=self.status, namespace=self.namespace)
+        self.assertStoredUtilizationCorrect()
+        pool.refresh_from_db()
+        self.assertEqual(pool.get_utilization(), (1, 4))
+        network.refresh_from_db()
+        self.assertEqual(network.get_utilization(), (5, 256))
+
+        # Moving an IP address to another namespace
+        other_namespace = Namespace.objects.create(name="Stored Utilization")
+        Prefix.objects.create(prefix="10.0.0.0/8", status=self.status, namespace=other_namespace)
+        ip._namespace = other_namespace
+        ip.save()
+        self.assertStoredUtilizationCorrect()
+
+        # Resizing a prefix
+        pool.prefix = "10.0.0.8/29"
+        pool.save()
+        self.assertStoredUtilizationCorrect()
+
+        # Changing the type of a prefix
+        network.type = PrefixTypeChoices.TYPE_CONTAINER
+        network.save()
+        self.assertStoredUtilizationCorrect()
+
+        # Deleting prefixes and IP addresses
+        pool.delete()
+        self.assertStoredUtilizationCorrect()
+        ip.delete()
+        self.assertStoredUtilizationCorrect()
+
+        # Bulk operations bypass signals, but deferred reparenting updates the stored utilization
+        with deferred_reparenting():
+            Prefix.objects.bulk_create([Prefix(prefix="10.0.1.0/24", status=self.status, namespace=self.namespace)])
+            IPAddress.objects.bulk_create(
+                [IPAddress(address="10.0.1.1/24", status=self.status, namespace=self.namespace)]
+            )
+        self.assertStoredUtilizationCorrect()
+
+        # Filtering and sorting use the stored utilization
+        Prefix.objects.filter(pk=container.pk).update(utilization_numerator=0)
+        self.assertEqual(Prefix.objects.with_utilization().get(pk=container.pk).utilization, 0)
+        self.assertEqual(Prefix.objects.filter(pk=container.pk).get_utilization_data()[container.pk], (0, 65536))
+        call_command("rebuild_prefix_utilization", namespace=self.namespace.name, stdout=StringIO())
+        self.assertStoredUtilizationCorrect()
+
     #
     # Uniqueness enforcement tests
     #
@@ -1215,6 +1482,56 @@ class TestIPAddress(ModelTestCases.BaseModelTestCase):
         self.status = Status.objects.get(name="Active")
         self.prefix = Prefix.objects.create(prefix="192.0.2.0/24", status=self.status, namespace=self.namespace)
 
+    def test_cached_closest_parents(self):
+        """Test that closest parents are reused within `cached_closest_parents()` and invalidated by Prefix changes."""
+        namespace = Namespace.objects.create(name="test_cached_closest_parents")
+        container = Prefix.objects.create(
+            prefix="10.0.0.0/16", type=PrefixTypeChoices.TYPE_CONTAINER, status=self.status, namespace=namespace
+        )
+        network = Prefix.objects.create(prefix="10.0.1.0/24", status=self.status, namespace=namespace)
+
+        with cached_closest_parents():
+            closest_parent_cache = closest_parent_cache_state.get()
+            ip = IPAddress.objects.create(address="10.0.1.1/24", status=self.status, namespace=namespace)
+            self.assertEqual(ip.parent, network)
+            # A Prefix with no children is cached...
+            self.assertEqual(closest_parent_cache.get(namespace.pk, "10.0.1.2"), network)
+            self.assertIsNone(closest_parent_cache.get(self.namespace.pk, "10.0.1.2"))
+            ip = IPAddress(address="10.0.1.2/24", status=self.status, namespace=namespace)
+            with self.assertNumQueries(0):
+                self.assertEqual(ip._get_closest_parent(), network)
+            # ...but a Prefix with children isn't
+            ip = IPAddress.objects.create(address="10.0.2.1/24", status=self.status, namespace=namespace)
+            self.assertEqual(ip.parent, container)
+            self.assertIsNone(closest_parent_cache.get(namespace.pk, "10.0.2.2"))
+            # Looking it up takes a single query, which also determines that it has children
+            ip = IPAddress(address="10.0.2.2/24", status=self.status, namespace=namespace)
+            with self.assertNumQueries(1):
+                self.assertEqual(ip._get_closest_parent(), container)
+
+            # Creating a Prefix invalidates the cache
+            subnet = Prefix.objects.create(prefix="10.0.1.0/28", status=self.status, namespace=namespace)
+            self.assertIsNone(closest_parent_cache.get(namespace.pk, "10.0.1.2"))
+            ip = IPAddress.objects.create(address="10.0.1.2/24", status=self.status, namespace=namespace)
+            self.assertEqual(ip.parent, subnet)
+            self.assertEqual(closest_parent_cache.get(namespace.pk, "10.0.1.3"), subnet)
+
+            # Deleting a Prefix invalidates the cache
+            ip.delete()
+            subnet.delete()
+            self.assertIsNone(closest_parent_cache.get(namespace.pk, "10.0.1.3"))
+            ip = IPAddress.objects.create(address="10.0.1.3/24", status=self.status, namespace=namespace)
+            self.assertEqual(ip.parent, network)
+
+            # The cache is bounded
+            self.assertEqual(list(closest_parent_cache.prefixes.values()), [network])
+            closest_parent_cache.maxsize = 1
+            other = Prefix.objects.create(prefix="10.0.3.0/24", status=self.status, namespace=namespace)
+            closest_parent_cache.add(other)
+            self.assertEqual(list(closest_parent_cache.prefixes.values()), [other])
+
+        self.assertIsNone(closest_parent_cache_state.get())
+
     def test_get_or_create(self):
         """Assert `get_or_create` method to permit specifying a namespace as an alternative to a parent prefix."""
         default_namespace = get_default_namespace()
@@ -1589,6 +1906,26 @@ class TestVLANGroup(ModelTestCases.BaseModelTestCase):
         VLAN.objects.bulk_create((VLAN(name="VLAN 6", vid=6, vlan_group=vlangroup, status=status),))
         self.assertEqual(vlangroup.get_next_available_vid(), None)
 
+    def test_available_vid_ranges(self):
+        vlangroup = VLANGroup.objects.create(name="VLAN Group 1", range="100-110,1-10,5-20,4094")
+        status = Status.objects.get_for_model(VLAN).first()
+        VLAN.objects.bulk_create(
+            VLAN(name=f"VLAN {vid}", vid=vid, vlan_group=vlangroup, status=status) for vid in (1, 2, 5, 20, 100, 4094)
+        )
+        self.assertEqual(vlangroup.vid_ranges, [(1, 20), (100, 110), (4094, 4094)])
+        self.assertTrue(vlangroup.vid_in_range(15))
+        self.assertFalse(vlangroup.vid_in_range(50))
+        self.assertFalse(vlangroup.vid_in_range(None))
+        self.assertEqual(list(vlangroup.iter_available_vid_ranges()), [(3, 4), (6, 19), (101, 110)])
+        self.assertEqual(list(vlangroup.iter_available_vid_ranges(exclude=[3, 110])), [(4, 4), (6, 19), (101, 109)])
+        self.assertEqual(vlangroup.get_next_available_vids(4), [3, 4, 6, 7])
+        self.assertEqual(vlangroup.get_next_available_vids(3, exclude=[4]), [3, 6, 7])
+        self.assertEqual(vlangroup.get_next_available_vids(100), vlangroup.available_vids)
+        self.assertEqual(
+            vlangroup.available_vids,
+            [vid for vid in vlangroup.expanded_range if vid not in (1, 2, 5, 20, 100, 4094)],
+        )
+
     def test_range_resize(self):
         vlangroup = VLANGroup.objects.create(name="VLAN Group 1", range="1-3")
         status = Status.objects.get_for_model(VLAN).first()
@@ -2,7 +2,9 @@ import re
 from unittest import skipIf
 
 from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
 from django.db import connection, transaction
+from django.test import override_settings
 import netaddr
 
 from nautobot.core.testing import TestCase
@@ -819,3 +821,134 @@ class PrefixQuerysetTestCase(TestCase):
                     .order_by("-prefix_length")
                     .first(),
                 )
+
+    def test_get_closest_parents(self):
+        """Test that PrefixQuerySet.get_closest_parents() matches get_closest_parent() for each address."""
+        namespace = Namespace.objects.create(name="test_get_closest_parents")
+        container = netaddr.IPNetwork("10.0.0.0/24")
+        Prefix.objects.create(
+            prefix=container,
+            type=choices.PrefixTypeChoices.TYPE_CONTAINER,
+            namespace=namespace,
+            status=self.status,
+        )
+        for prefix_length in range(25, 33):
+            Prefix.objects.create(
+                prefix=list(container.subnet(prefix_length))[1],
+                type=choices.PrefixTypeChoices.TYPE_NETWORK,
+                namespace=namespace,
+                status=self.status,
+            )
+        Prefix.objects.create(prefix="2001:db8::/64", namespace=namespace, status=self.status)
+
+        queryset = Prefix.objects.filter(namespace=namespace)
+        addresses = [f"10.0.0.{last_octet}" for last_octet in range(255, -1, -1)]
+        addresses += ["2001:db8::1/64", "10.0.1.1", "2001:db9::1", "10.0.0.5"]
+        with self.assertNumQueries(3):
+            parents = queryset.get_closest_parents(addresses)
+        self.assertEqual(len(parents), len(addresses))
+        for address, parent in zip(addresses, parents):
+            with self.subTest(address=address):
+                try:
+                    expected_parent = queryset.get_closest_parent(address, include_self=True)
+                except Prefix.DoesNotExist:
+                    expected_parent = None
+                self.assertEqual(parent, expected_parent)
+
+        with self.assertRaises(ValidationError):
+            queryset.get_closest_parents(["10.0.0.1", "not an address"])
+        self.assertEqual(queryset.get_closest_parents([]), [])
+
+    def test_get_tree(self):
+        """Test that PrefixQuerySet.get_tree() returns prefixes in depth-first tree order with their depth."""
+        namespace = Namespace.objects.create(name="test_get_tree")
+        expected_tree = [
+            ("10.0.0.0/8", 0),
+            ("10.0.0.0/16", 1),
+            ("10.0.0.0/24", 2),
+            ("10.0.0.0/30", 3),
+            ("10.0.1.0/24", 2),
+            ("10.1.0.0/16", 1),
+            ("192.168.0.0/16", 0),
+            ("2001:db8::/32", 0),
+            ("2001:db8::/64", 1),
+        ]
+        # Create in a non-tree order to ensure the ordering is not simply by creation
+        for cidr, _ in reversed(expected_tree):
+            Prefix.objects.create(prefix=cidr, namespace=namespace, status=self.status)
+
+        queryset = Prefix.objects.all()
+        tree, after = queryset.get_tree(namespace=namespace)
+        self.assertEqual([(str(prefix.prefix), depth) for prefix, depth in tree], expected_tree)
+        self.assertIsNone(after)
+
+        with self.subTest("max_depth"):
+            tree, _ = queryset.get_tree(namespace=namespace, max_depth=1)
+            self.assertEqual(
+                [(str(prefix.prefix), depth) for prefix, depth in tree],
+                [(cidr, depth) for cidr, depth in expected_tree if depth <= 1],
+            )
+
+        with self.subTest("parent"):
+            parent = Prefix.objects.get(prefix="10.0.0.0/16", namespace=namespace)
+            tree, _ = queryset.get_tree(parent=parent)
+            self.assertEqual(
+                [(str(prefix.prefix), depth) for prefix, depth in tree],
+                [("10.0.0.0/24", 0), ("10.0.0.0/30", 1), ("10.0.1.0/24", 0)],
+            )
+            tree, _ = queryset.get_tree(parent=parent, max_depth=0)
+            self.assertEqual([str(prefix.prefix) for prefix, _ in tree], ["10.0.0.0/24", "10.0.1.0/24"])
+
+        with self.subTest("paging"):
+            results = []
+            after = None
+            while True:
+                tree, after = queryset.get_tree(namespace=namespace, after=after, limit=4)
+                self.assertLessEqual(len(tree), 4)
+                results += [(str(prefix.prefix), depth) for prefix, depth in tree]
+                if after is None:
+                    break
+            self.assertEqual(results, expected_tree)
+
+        with self.subTest("restricted queryset"):
+            tree, _ = queryset.exclude(prefix_length=16).get_tree(namespace=namespace)
+            self.assertEqual(
+                [(str(prefix.prefix), depth) for prefix, depth in tree],
+                [(cidr, depth) for cidr, depth in expected_tree if not cidr.endswith("/16")],
+            )
+
+
+@skipIf(connection.vendor != "postgresql", "PostgreSQL inet lookups are only supported on postgresql")
+@override_settings(POSTGRESQL_INET_LOOKUPS_ENABLED=True)
+class IPAddressQuerySetInetLookupsTestCase(IPAddressQuerySet):
+    """Re-run the IPAddressQuerySet tests using the PostgreSQL inet containment lookups."""
+
+    def test_net_host_contained_uses_inet_lookup(self):
+        self.assertIn("<<=", str(IPAddress.objects.net_host_contained("10.0.0.0/24").query))
+
+
+@skipIf(connection.vendor != "postgresql", "PostgreSQL inet lookups are only supported on postgresql")
+@override_settings(POSTGRESQL_INET_LOOKUPS_ENABLED=True)
+class PrefixQuerySetInetLookupsTestCase(PrefixQuerysetTestCase):
+    """Re-run the PrefixQuerySet tests using the PostgreSQL inet containment lookups."""
+
+    def test_net_lookups_use_inet_lookups(self):
+        for method, operator in (
+            ("net_contained", "<<"),
+            ("net_contained_or_equal", "<<="),
+            ("net_contains", ">>"),
+            ("net_contains_or_equals", ">>="),
+        ):
+            with self.subTest(method=method):
+                query = str(getattr(Prefix.objects, method)("192.168.0.0/16").query)
+                self.assertIn(f" {operator} ", query)
+                self.assertIn("nautobot_varbinary_to_inet", query)
+
+    def test_inet_lookups_match_range_lookups(self):
+        for prefix in Prefix.objects.all():
+            for method in ("net_contained", "net_contained_or_equal", "net_contains", "net_contains_or_equals"):
+                with self.subTest(prefix=prefix.prefix, method=method):
+                    inet_results = getattr(Prefix.objects, method)(prefix.prefix)
+                    with override_settings(POSTGRESQL_INET_LOOKUPS_ENABLED=False):
+                        range_results = list(getattr(Prefix.objects, method)(prefix.prefix))
+                    self.assertQuerysetEqual(inet_results, range_results, ordered=False)
@@ -3,10 +3,62 @@ import netaddr
 
 from nautobot.core.forms.utils import parse_numeric_range
 from nautobot.extras.models import Status
+from nautobot.ipam import allocation
 from nautobot.ipam.models import IPAddress, Namespace, Prefix, VLAN, VLANGroup
 from nautobot.ipam.utils import add_available_ipaddresses, add_available_vlans
 
 
+class AllocationTest(TestCase):
+    """Tests for the range helpers in nautobot.ipam.allocation."""
+
+    def test_merge_ranges(self):
+        self.assertEqual(
+            list(allocation.merge_ranges([(1, 3), (2, 5), (6, 6), (8, 10), (9, 9)])),
+            [(1, 6), (8, 10)],
+        )
+        self.assertEqual(list(allocation.merge_ranges([])), [])
+
+    def test_iter_free_ranges(self):
+        self.assertEqual(
+            list(allocation.iter_free_ranges(0, 15, [(0, 1), (4, 4), (6, 9), (7, 8), (20, 30)])),
+            [(2, 3), (5, 5), (10, 15)],
+        )
+        self.assertEqual(list(allocation.iter_free_ranges(0, 15, [])), [(0, 15)])
+        self.assertEqual(list(allocation.iter_free_ranges(4, 8, [(0, 10)])), [])
+        self.assertEqual(list(allocation.iter_free_ranges(4, 8, [(0, 5), (7, 7)])), [(6, 6), (8, 8)])
+
+    def test_find_free_block(self):
+        free_ranges = [(1, 3), (5, 7), (9, 20)]
+        self.assertEqual(allocation.find_free_block(free_ranges, 1), 1)
+        self.assertEqual(allocation.find_free_block(free_ranges, 2), 2)
+        self.assertEqual(allocation.find_free_block(free_ranges, 4), 12)
+        self.assertEqual(allocation.find_free_block(free_ranges, 8), None)
+
+    def test_allocate_free_blocks(self):
+        self.assertEqual(
+            allocation.allocate_free_blocks(0, 15, lambda: iter([(0, 3)]), [4, 4, 8, 4, 4]),
+            [4, 8, None, 12, None],
+        )
+
+    def test_iter_nested_parents(self):
+        ranges = [(0, 255, "/24"), (0, 127, "/25a"), (0, 63, "/26"), (128, 255, "/25b"), (512, 767, "other")]
+        points = [(1, "ip1"), (64, "ip64"), (200, "ip200"), (300, "ip300")]
+        self.assertEqual(
+            dict(allocation.iter_nested_parents(ranges, points)),
+            {
+                "/24": None,
+                "/25a": "/24",
+                "/26": "/25a",
+                "ip1": "/26",
+                "ip64": "/25a",
+                "/25b": "/24",
+                "ip200": "/25b",
+                "ip300": None,
+                "other": None,
+            },
+        )
+
+
 class AddAvailableVlansTest(TestCase):
     """Tests for add_available_vlans()."""
 
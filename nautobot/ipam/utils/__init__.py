@@ -3,7 +3,6 @@ from collections.abc import Iterable
 from django.core.exceptions import ValidationError
 import netaddr
 
-from nautobot.core.forms.utils import compress_range
 from nautobot.dcim.models import Interface
 from nautobot.extras.models import RelationshipAssociation
 from nautobot.ipam.choices import PrefixTypeChoices
@@ -121,7 +120,7 @@ def add_available_vlans(vlan_group: VLANGroup, vlans: list[VLAN]):
             "available": t[1] - t[0] + 1,
             "range": f"{t[0]}" if t[0] == t[1] else f"{t[0]}-{t[1]}",
         }
-        for t in compress_range(vlan_group.available_vids)
+        for t in vlan_group.iter_available_vid_ranges()
     ]
 
     vlans = list(vlans) + fake_vlans
@@ -0,0 +1,25 @@
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from nautobot.core.authentication import ObjectPermissionBackend
+
+from .models import ObjectPermission, User
+
+#
+# Object permissions
+#
+
+
+@receiver(post_save, sender=ObjectPermission)
+@receiver(post_delete, sender=ObjectPermission)
+@receiver(post_delete, sender=Group)
+@receiver(m2m_changed, sender=ObjectPermission.object_types.through)
+@receiver(m2m_changed, sender=ObjectPermission.groups.through)
+@receiver(m2m_changed, sender=ObjectPermission.users.through)
+@receiver(m2m_changed, sender=User.groups.through)
+def invalidate_object_permissions(**kwargs):
+    """
+    Discard loaded user permissions and their compiled filters when an ObjectPermission or group membership changes.
+    """
+    ObjectPermissionBackend.invalidate_object_permissions()